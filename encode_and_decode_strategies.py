@@ -2,36 +2,64 @@
 
 import marshal
 import base64
+import zlib
 import types
+import os
 
 def encode_function(filepath):
     with open(filepath, 'r') as f:
         code = f.read()
 
     compiled = compile(code, filepath, 'exec')
-    marshaled = marshal.dumps(compiled)
+    # marshal output compresses well, which more than makes up for base64's overhead
+    marshaled = zlib.compress(marshal.dumps(compiled), 9)
     encoded = base64.b64encode(marshaled).decode('ascii')
 
     return encoded
 
 def encode_function_obj(func):
-    marshaled = marshal.dumps(func.__code__)
+    marshaled = zlib.compress(marshal.dumps(func.__code__), 9)
     encoded = base64.b64encode(marshaled).decode('ascii')
     return encoded
 
 def decode_and_load(encoded_string, strategy_name):
-    decoded = base64.b64decode(encoded_string.encode('ascii'))
+    decoded = zlib.decompress(base64.b64decode(encoded_string.encode('ascii')))
     code_obj = marshal.loads(decoded)
     func = types.FunctionType(code_obj, globals(), strategy_name)
     return func
 
-# Generate encoded versions
-harrison_encoded = encode_function('harrison.py')
-jackson_encoded = encode_function('jackson.py')
+def encode_function_cached(filepath):
+    # re-encoding is skipped if the source has not been modified since the last run
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    cache_path = f"./cache/encoded/{name}.b64"
+    stamp_path = f"./cache/encoded/{name}.mtime"
+    mtime = str(os.path.getmtime(filepath))
 
-print("# Paste this into the notebook cell:")
-print()
-print("# Obfuscated strategies")
-print(f"_harrison_encoded = '{harrison_encoded}'")
-print()
-print(f"_jackson_encoded = '{jackson_encoded}'")
+    if os.path.exists(cache_path) and os.path.exists(stamp_path):
+        with open(stamp_path, 'r') as f:
+            if f.read() == mtime:
+                with open(cache_path, 'r') as cache_file:
+                    return cache_file.read()
+
+    encoded = encode_function(filepath)
+    os.makedirs("./cache/encoded", exist_ok=True)
+    with open(cache_path, 'w') as f:
+        f.write(encoded)
+    with open(stamp_path, 'w') as f:
+        f.write(mtime)
+    return encoded
+
+def main():
+    # Generate encoded versions
+    harrison_encoded = encode_function_cached('harrison.py')
+    jackson_encoded = encode_function_cached('jackson.py')
+
+    print("# Paste this into the notebook cell:")
+    print()
+    print("# Obfuscated strategies")
+    print(f"_harrison_encoded = '{harrison_encoded}'")
+    print()
+    print(f"_jackson_encoded = '{jackson_encoded}'")
+
+if __name__ == "__main__":
+    main()
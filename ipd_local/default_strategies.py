@@ -2,7 +2,9 @@
 # presumably written by ian lum '22
 
 import random
+import numpy as np
 from .types import *
+from .history import HistoryState, ReplicaState
 
 
 def rat(my_moves: List[bool], other_moves: List[bool], current_round: int) -> bool:
@@ -43,20 +45,17 @@ def tit_for_two_tats(
 def nuke_for_tat(
     my_moves: List[bool], other_moves: List[bool], current_round: int
 ) -> bool:
-    if len(other_moves) == 0:
-        return False
-    return True in other_moves
+    return any(other_moves)
 
 
 def nuke_for_two_tats(
     my_moves: List[bool], other_moves: List[bool], current_round: int
 ) -> bool:
-    if len(other_moves) < 2:
-        return False
-    indices = [i for i, x in enumerate(other_moves) if x]
-    for i in range(len(indices) - 1):
-        if indices[i] == indices[i + 1] - 1:
+    previous = False
+    for move in other_moves:
+        if move and previous:
             return True
+        previous = move
     return False
 
 
@@ -65,15 +64,15 @@ def two_tits_for_tat(
 ) -> bool:
     if current_round == 0:
         return False
-    if (current_round >= 1 and other_moves[-1]) or (current_round >= 2 and other_moves[-2]):
+    if other_moves[-1]:
         return True
-    return False
+    return current_round >= 2 and other_moves[-2]
 
 
 def pavlov(my_moves: List[bool], other_moves: List[bool], current_round: int) -> bool:
     if current_round == 0:
         return False
-    return not my_moves[-1] == other_moves[-1]
+    return my_moves[-1] != other_moves[-1]
 
 
 def suspicious_tit_for_tat(
@@ -97,3 +96,154 @@ all_default_functions = [
     pavlov,
     suspicious_tit_for_tat,
 ]
+
+# the code of every default function, which (unlike submitted code) is trusted not to modify the histories it is given
+default_function_codes: FrozenSet[CodeType] = frozenset(function.__code__ for function in all_default_functions)
+
+
+def is_default_function(strategy: Strategy) -> bool:
+    """Whether `strategy` has the code of one of the default functions (even if it was rebuilt from its bytecode)."""
+    return getattr(strategy, "__code__", None) in default_function_codes
+
+
+# bit-packed versions of the default functions, used by the simulation instead of the list versions.
+# `state.my_mask` and `state.other_mask` hold round k's move in bit k (see `HistoryState` in history.py).
+# they must behave exactly like (and consume randomness exactly like) the functions above.
+
+
+def _rat_bitmask(state: HistoryState, current_round: int) -> bool:
+    return True
+
+
+def _silent_bitmask(state: HistoryState, current_round: int) -> bool:
+    return False
+
+
+def _rand_bitmask(state: HistoryState, current_round: int) -> bool:
+    return bool(random.getrandbits(1))
+
+
+def _kinda_random_bitmask(state: HistoryState, current_round: int) -> bool:
+    return random.random() < 0.9
+
+
+def _tit_for_tat_bitmask(state: HistoryState, current_round: int) -> bool:
+    return state.last_rat
+
+
+def _tit_for_two_tats_bitmask(state: HistoryState, current_round: int) -> bool:
+    return current_round >= 2 and ((state.other_mask >> (current_round - 2)) & 0b11) == 0b11
+
+
+def _nuke_for_tat_bitmask(state: HistoryState, current_round: int) -> bool:
+    return state.any_rat
+
+
+def _nuke_for_two_tats_bitmask(state: HistoryState, current_round: int) -> bool:
+    return state.two_in_a_row
+
+
+def _two_tits_for_tat_bitmask(state: HistoryState, current_round: int) -> bool:
+    return bool((state.other_mask >> max(current_round - 2, 0)) & 0b11)
+
+
+def _pavlov_bitmask(state: HistoryState, current_round: int) -> bool:
+    return bool(((state.my_mask ^ state.other_mask) >> (current_round - 1)) & 1) if current_round else False
+
+
+def _suspicious_tit_for_tat_bitmask(state: HistoryState, current_round: int) -> bool:
+    return state.last_rat if current_round else True
+
+
+# keyed by code object rather than function so that lookups still work on
+# functions that were rebuilt from their bytecode (see `unpack_functions`).
+# read-only, since the simulation trusts every entry to match its default function exactly
+bitmask_kernels: MappingProxyType[CodeType, BitmaskStrategy] = MappingProxyType({
+    rat.__code__: _rat_bitmask,
+    silent.__code__: _silent_bitmask,
+    rand.__code__: _rand_bitmask,
+    kinda_random.__code__: _kinda_random_bitmask,
+    tit_for_tat.__code__: _tit_for_tat_bitmask,
+    tit_for_two_tats.__code__: _tit_for_two_tats_bitmask,
+    nuke_for_tat.__code__: _nuke_for_tat_bitmask,
+    nuke_for_two_tats.__code__: _nuke_for_two_tats_bitmask,
+    two_tits_for_tat.__code__: _two_tits_for_tat_bitmask,
+    pavlov.__code__: _pavlov_bitmask,
+    suspicious_tit_for_tat.__code__: _suspicious_tit_for_tat_bitmask,
+})
+
+
+def get_bitmask_kernel(strategy: Strategy) -> Optional[BitmaskStrategy]:
+    """Returns the bit-packed version of `strategy` if it is a default function, otherwise None."""
+    return bitmask_kernels.get(getattr(strategy, "__code__", None))
+
+
+# versions of the default functions that play every noise game of a match at once.
+# each takes a `ReplicaState` (see history.py) and returns a boolean array with one move per game.
+# unlike the bit-packed versions, the random ones draw from `state.rng` instead of `random`.
+
+
+def _rat_vectorized(state: ReplicaState) -> np.ndarray:
+    return np.ones(state.num_games, dtype=bool)
+
+
+def _silent_vectorized(state: ReplicaState) -> np.ndarray:
+    return np.zeros(state.num_games, dtype=bool)
+
+
+def _rand_vectorized(state: ReplicaState) -> np.ndarray:
+    return state.rng.random(state.num_games) < 0.5
+
+
+def _kinda_random_vectorized(state: ReplicaState) -> np.ndarray:
+    return state.rng.random(state.num_games) < 0.9
+
+
+def _tit_for_tat_vectorized(state: ReplicaState) -> np.ndarray:
+    return state.last_other
+
+
+def _tit_for_two_tats_vectorized(state: ReplicaState) -> np.ndarray:
+    return state.last_other & state.second_last_other
+
+
+def _nuke_for_tat_vectorized(state: ReplicaState) -> np.ndarray:
+    return state.other_rat_count > 0
+
+
+def _nuke_for_two_tats_vectorized(state: ReplicaState) -> np.ndarray:
+    return state.two_in_a_row
+
+
+def _two_tits_for_tat_vectorized(state: ReplicaState) -> np.ndarray:
+    return state.last_other | state.second_last_other
+
+
+def _pavlov_vectorized(state: ReplicaState) -> np.ndarray:
+    return state.last_my != state.last_other
+
+
+def _suspicious_tit_for_tat_vectorized(state: ReplicaState) -> np.ndarray:
+    if state.current_round == 0:
+        return np.ones(state.num_games, dtype=bool)
+    return state.last_other
+
+
+vectorized_kernels: MappingProxyType[CodeType, VectorizedStrategy] = MappingProxyType({
+    rat.__code__: _rat_vectorized,
+    silent.__code__: _silent_vectorized,
+    rand.__code__: _rand_vectorized,
+    kinda_random.__code__: _kinda_random_vectorized,
+    tit_for_tat.__code__: _tit_for_tat_vectorized,
+    tit_for_two_tats.__code__: _tit_for_two_tats_vectorized,
+    nuke_for_tat.__code__: _nuke_for_tat_vectorized,
+    nuke_for_two_tats.__code__: _nuke_for_two_tats_vectorized,
+    two_tits_for_tat.__code__: _two_tits_for_tat_vectorized,
+    pavlov.__code__: _pavlov_vectorized,
+    suspicious_tit_for_tat.__code__: _suspicious_tit_for_tat_vectorized,
+})
+
+
+def get_vectorized_kernel(strategy: Strategy) -> Optional[VectorizedStrategy]:
+    """Returns the vectorized version of `strategy` if it is a default function, otherwise None."""
+    return vectorized_kernels.get(getattr(strategy, "__code__", None))
@@ -1,10 +1,15 @@
 from openai import OpenAI
-from typing import List, Dict
+from typing import List, Dict, Iterator, Tuple
 from pydantic import BaseModel
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+import hashlib
+import os
+import threading
 
 from .prompts import single_strategy_prompt
 
-from .game_specs import NVIDIA_API_KEY
+from .game_specs import get_nvidia_key
 
 class SummaryResponse(BaseModel):
     summary5: str
@@ -17,10 +22,14 @@ def get_single_strategy_prompt(noise: bool, strategy_code: str) -> str:
     return single_strategy_prompt.format(noise_str=noise_str, strategy_code=strategy_code)
 
 def get_client():
-    return OpenAI(
-        base_url="https://integrate.api.nvidia.com/v1",
-        api_key=NVIDIA_API_KEY,
-    )
+    # one client is shared so its connection pool is reused between requests
+    global client
+    if client is None:
+        client = OpenAI(
+            base_url="https://integrate.api.nvidia.com/v1",
+            api_key=get_nvidia_key(),
+        )
+    return client
 
 def get_response(client, chat_history: List[Dict[str, str]]) -> str:
     completion = client.chat.completions.create(
@@ -38,6 +47,34 @@ def get_response(client, chat_history: List[Dict[str, str]]) -> str:
     return completion.choices[0].message.content
 
 def describe_strategy(noise: bool, strategy_code: str) -> str:
+    # descriptions are cached on disk by code and noise setting, so unchanged strategies are never re-sent
+    key = hashlib.sha1(strategy_code.encode()).hexdigest() + ("_n" if noise else "")
+    cache_path = Path("./cache/descriptions") / key
+    if cache_path.exists():
+        return cache_path.read_text()
+
     client = get_client()
     response = get_response(client, [{"role": "user", "content": get_single_strategy_prompt(noise, strategy_code)}])
-    return response
\ No newline at end of file
+
+    if response is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # written to a temporary file (one per thread) and moved into place, so a cached description is never half-written
+        temp_path = cache_path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(response)
+        os.replace(temp_path, cache_path)
+    return response
+
+def describe_strategies(noise: bool, strategy_codes: Dict[str, str], max_workers: int = 8) -> Iterator[Tuple[str, str]]:
+    """
+    Describes many strategies at once with a pool of threads (the requests are I/O bound).
+    Yields `(name, description)` pairs in the order they finish.
+    """
+    get_client()  # create the shared client before the threads race to do it
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(describe_strategy, noise, code): name
+            for name, code in strategy_codes.items()
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
\ No newline at end of file
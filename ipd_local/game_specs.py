@@ -1,6 +1,9 @@
 """Specify global parameters in this submodule."""
 
 import random
+from functools import cache
+from pathlib import Path
+import os
 
 RANDOM_SEED = 44
 
@@ -12,8 +15,16 @@ NUM_NOISE_GAMES_TO_AVG = 1000  # number of noise games to play and average (only
 # Random round range from 100 - 200
 MIN_ROUNDS = 100
 MAX_ROUNDS = 200
-random.seed(RANDOM_SEED)
-ROUNDS = [random.randint(MIN_ROUNDS, MAX_ROUNDS) for _ in range(NUM_NOISE_GAMES_TO_AVG)]  # number of rounds each strategy plays against each other strategy
+
+@cache
+def get_rounds() -> list[int]:
+    """
+    Returns the number of rounds each strategy plays against each other strategy in each noise game.
+    Generated on first use from its own generator seeded with `RANDOM_SEED`, so the global `random` state is left alone.
+    """
+    rng = random.Random(RANDOM_SEED)
+    return [rng.randint(MIN_ROUNDS, MAX_ROUNDS) for _ in range(NUM_NOISE_GAMES_TO_AVG)]
+
 MAXIMUM_NUM_FUNCTIONS = 10 # change to a very large number if this restriction is not desired
 MAXIMUM_CHAR_COUNT = 5000 # change to a very large number if this restriction is not desired
 
@@ -47,12 +58,12 @@ STUDENT_NAME_COL = 2
 REGULAR_STRAT_COL = 4
 NOISE_STRAT_COL = 3
 
-import dotenv
-from pathlib import Path
-import os
 
-current_dir = Path(__file__).parent.parent
-dotenv_path = current_dir / '.env'
-dotenv.load_dotenv(dotenv_path)
+@cache
+def get_nvidia_key() -> str | None:
+    """Returns the NVIDIA API key, loading `.env` from the repository root the first time it is needed."""
+    import dotenv
 
-NVIDIA_API_KEY = os.getenv("NVIDIA_API_KEY")
\ No newline at end of file
+    dotenv_path = Path(__file__).parent.parent / '.env'
+    dotenv.load_dotenv(dotenv_path)
+    return os.getenv("NVIDIA_API_KEY")
\ No newline at end of file
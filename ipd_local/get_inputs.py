@@ -4,15 +4,28 @@ from .types import *
 from .game_specs import *
 from .output_locations import BLACKLIST_LOCATION
 from .utils import suppress_output, get_length_no_whitespace_no_comments, check_type
+from .history import pack_moves, wants_masks
 
 import gspread
+from gspread.utils import fill_gaps
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from tqdm import tqdm
 import parse
 from loguru import logger
 import os
 import urllib
 import statistics
+import json
+import ast
+import re
+import hashlib
+import marshal
+import threading
+import sys
+import numpy as np
 
 import random
 import math
@@ -23,6 +36,11 @@ import math
 # run
 
 
+# shared by every download so connections to pastebin are kept alive and reused
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+
 def get_spreadsheet_data(sheet: str, tab: str) -> List[List[str]]:
     """
     Retrieve latest list of submissions from Google Sheet.
@@ -34,25 +52,55 @@ def get_spreadsheet_data(sheet: str, tab: str) -> List[List[str]]:
 
     Returns: list of lists containing spreadsheet data in column-row format.
     """
+    return get_spreadsheet_tabs(sheet, [tab])[tab]
+
+
+def get_spreadsheet_tabs(sheet: str, tabs: List[str]) -> Dict[str, List[List[str]]]:
+    """
+    Retrieve the contents of several tabs of a Google Sheet in a single `values.batchGet` request.
+
+    Arguments:
+    - `sheet`: the name of the spreadsheet to query.
+    - `tabs`: the tabs of the spreadsheet to retrieve.
+
+    Returns: a dictionary mapping each tab to a list of lists of its data in column-row format
+    (padded with empty strings, like `Worksheet.get_all_values()`).
+    """
     print("Retrieving spreadsheet data...")
     service_account = gspread.service_account(filename="service_account.json")
     spreadsheet = service_account.open(sheet)
-    worksheet = spreadsheet.worksheet(tab)
+    # a range that is just a quoted tab name covers the whole tab
+    response = spreadsheet.values_batch_get(ranges=["'" + tab.replace("'", "''") + "'" for tab in tabs])
     print("Retrieved spreadsheet data.")
-    return worksheet.get_all_values()
+    return {
+        tab: fill_gaps(value_range["values"]) if value_range.get("values") else []
+        for tab, value_range in zip(tabs, response["valueRanges"])
+    }
 
 
-def get_pastebin(link: str, cache: bool = False) -> Optional[str]:
+def get_pastebin(link: str, cache: bool = True, session: requests.Session = session) -> Optional[str]:
     """
     Downloads content of pastebin link and returns it.
-    Caches content for optional faster future lookups (assuming code has not changed).
+    Every download is cached in `./cache`, and re-downloads are conditional requests that reuse
+    the cached copy if the pastebin has not changed. Results are also kept in memory for the
+    rest of the process. Safe to call from several threads at once.
 
     Arguments:
     - `link`: the pastebin link to query
-    - `cache`: whether or not to pull from a cached copy (if applicable).
+    - `cache`: whether or not to trust a cached copy without asking pastebin if it changed (if applicable).
+    - `session`: the `requests` session to download with; defaults to the module's shared session.
 
     Returns: the contents of the pastebin as a string.
     """
+    id = parse_pastebin_id(link)
+    if id is None:
+        return None
+
+    return _fetch_pastebin(id, cache, session)
+
+
+def parse_pastebin_id(link: str) -> Optional[str]:
+    """Returns the id of a pastebin link (`pastebin.com/<id>` or `pastebin.com/raw/<id>`), or None if it is not one."""
     url = urllib.parse.urlparse(link)
     if url.netloc != "pastebin.com":
         return None
@@ -67,28 +115,124 @@ def get_pastebin(link: str, cache: bool = False) -> Optional[str]:
     if len(id) != 8 or not id.isalnum():  # pastebin IDs are always 8 alphanumeric chars
         return None
 
-    if not os.path.exists("./cache"):
-        os.mkdir("./cache")
-    if cache:
-        if os.path.exists(f"./cache/{id}"):
-            return open(f"./cache/{id}", "r").read()
+    return id
+
+
+def _fetch_pastebin(id: str, cache: bool, session: requests.Session) -> Optional[str]:
+    """Downloads the pastebin with the given id (see `_fetch_pastebin_cached`), or returns None if that fails."""
+    try:
+        return _fetch_pastebin_cached(id, cache, session)
+    except requests.HTTPError as error:
+        # not cached in memory either, so a later call tries again
+        logger.error(f"Could not download pastebin {id}: {str(error)}")
+        return None
+
+
+@lru_cache(maxsize=None)
+def _fetch_pastebin_cached(id: str, cache: bool, session: requests.Session) -> str:
+    """
+    Downloads the pastebin with the given id, using `./cache/{id}` and its `.meta` file (validators) when possible.
+    Only successful responses are written to the cache; on an error response the cached copy is returned if there
+    is one, and `requests.HTTPError` is raised otherwise.
+    """
+    cache_path = f"./cache/{id}"
+    meta_path = f"./cache/{id}.meta"
 
-    raw_link = f"https://pastebin.com/raw/{id}"
-    code = requests.get(raw_link).text
-    if not cache:  # no need to re-write cache's contents to itself
-        open(f"./cache/{id}", "w").write(code)
+    # opening the files straight away instead of checking that they exist first saves a stat per file
+    cached_code = None
+    try:
+        with open(cache_path, "r") as cache_file:
+            cached_code = cache_file.read()
+    except FileNotFoundError:
+        pass
+    else:
+        if cache:
+            return cached_code
+
+    headers = {}
+    if cached_code is not None:
+        try:
+            with open(meta_path, "r") as meta_file:
+                meta = json.load(meta_file)
+        except FileNotFoundError:
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = session.get(f"https://pastebin.com/raw/{id}", headers=headers)
+    if response.status_code == 304:
+        return cached_code
+    if not response.ok:
+        # an error page (rate limiting, say) must never be saved as the code
+        if cached_code is not None:
+            logger.warning(f"Pastebin {id} returned {response.status_code}, using the cached copy")
+            return cached_code
+        response.raise_for_status()
+
+    code = response.text
+    os.makedirs("./cache", exist_ok=True)
+    with open(cache_path, "w") as cache_file:
+        cache_file.write(code)
+    with open(meta_path, "w") as meta_file:
+        json.dump({
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }, meta_file)
     return code
 
 
+_TOP_LEVEL_DEF = re.compile(r"^def ", re.MULTILINE)
+
+
+def count_functions(tree: ast.AST) -> int:
+    """Counts every function definition in a parsed module, including nested ones."""
+    return sum(isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) for node in ast.walk(tree))
+
+
 def get_num_functions(code: str):
-    lines = code.split("\n")
+    try:
+        return count_functions(ast.parse(code))
+    except SyntaxError:
+        pass
+
+    # code that doesn't parse falls back to counting lines that start a function
+    return len(_TOP_LEVEL_DEF.findall(code))
+
+def compile_submission(code: str, filename: str = "<submission>") -> Tuple[CodeType, int]:
+    """
+    Compiles a submission and counts its functions (see `count_functions`), parsing the code only once.
+    Results are cached in `./cache/compiled` by the hash of the code (and the python version, since
+    marshal's format is version specific), so unchanged submissions are never re-parsed.
+
+    Raises `SyntaxError` if the code does not compile.
 
-    num_functions = 0
-    for line in lines:
-        if line.startswith("def "):
-            num_functions += 1
+    Returns: the compiled code object and the number of functions.
+    """
+    digest = hashlib.sha1(code.encode()).hexdigest()
+    cache_path = f"./cache/compiled/{digest}.{sys.implementation.cache_tag}.marshal"
 
-    return num_functions
+    try:
+        with open(cache_path, "rb") as cache_file:
+            compiled, num_functions = marshal.load(cache_file)
+        if isinstance(compiled, CodeType) and isinstance(num_functions, int):
+            return compiled, num_functions
+    except (FileNotFoundError, EOFError, ValueError, TypeError):
+        pass  # a missing or damaged cache file is a cache miss, and is (over)written below
+
+    tree = ast.parse(code, filename)
+    num_functions = count_functions(tree)
+    compiled = compile(tree, filename, "exec")
+
+    os.makedirs("./cache/compiled", exist_ok=True)
+    # written to a temporary file and moved into place, so an interrupted run never leaves a truncated cache file
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as cache_file:
+        marshal.dump((compiled, num_functions), cache_file)
+    os.replace(temp_path, cache_path)
+
+    return compiled, num_functions
 
 def check_functions(
     functions: List[Strategy],
@@ -103,13 +247,20 @@ def check_functions(
     good_functions = []
     bad_function_results = []
 
-    test_cases = [[[True] * i, [False] * i, i] for i in range(0, MAX_ROUNDS)]
+    # round 0, every power of two, and the last possible round is enough to
+    # check the return types without calling every function MAX_ROUNDS times
+    test_rounds = sorted({0, MAX_ROUNDS - 1} | {2 ** k for k in range(MAX_ROUNDS.bit_length()) if 2 ** k < MAX_ROUNDS})
+    test_cases = [[[True] * i, [False] * i, i] for i in test_rounds]
+    # a few mixed histories too, since all-rat/all-silent ones never reach most branches
+    rng = random.Random(RANDOM_SEED)
+    for i in sorted(rng.sample(range(1, MAX_ROUNDS), 5)):
+        test_cases.append([[rng.random() < 0.5 for _ in range(i)], [rng.random() < 0.5 for _ in range(i)], i])
 
     with suppress_output():
         for function in functions:
-            globals()[function.__name__] = function
             try:
                 queued_moves = []
+                takes_masks = wants_masks(function)
                 for test_case in test_cases:
                     my_moves = test_case[0]
                     my_moves_copy = my_moves.copy()
@@ -118,12 +269,19 @@ def check_functions(
 
                     if queued_moves:
                         output = queued_moves.pop(0)
+                    elif takes_masks:
+                        output = function(
+                            my_moves, other_moves, test_case[2], my_mask=pack_moves(my_moves), other_mask=pack_moves(other_moves)
+                        )
                     else:
                         output = function(my_moves, other_moves, test_case[2])
 
+                    # the test cases are shared by every function, so put them back before failing
                     if my_moves_copy != my_moves:
+                        my_moves[:] = my_moves_copy
                         raise Exception("my_moves was modified")
                     if other_moves_copy != other_moves:
+                        other_moves[:] = other_moves_copy
                         raise Exception("other_moves was modified")
 
                     if isinstance(output, bool):
@@ -140,9 +298,6 @@ def check_functions(
             except Exception as e:
                 logger.error(f"Testing of {function.__name__} failed: {str(e)}")
                 bad_function_results.append((function, e))
-            finally:
-                if function.__name__ in globals():
-                    del globals()[function.__name__]
 
     return good_functions, bad_function_results
 
@@ -183,10 +338,11 @@ def get_and_load_functions(
     noise: bool = NOISE,
     maximum_num_functions: int = MAXIMUM_NUM_FUNCTIONS,
     maximum_char_count: int = MAXIMUM_CHAR_COUNT,
-    cache: bool = False,
-) -> Tuple[List[Strategy], Dict[str, List[str]]]:
+    cache: bool = True,
+) -> Tuple[Dict[str, Strategy], Dict[str, str]]:
     """
     Downloads, loads, and filters all of the python code in the provided pastebin links.
+    Returns the good functions keyed by name, and the source code of every function keyed by name.
     Filtering of functions is done via `check_functions_io`
 
     Arguments:
@@ -200,11 +356,13 @@ def get_and_load_functions(
     """
     print("Retrieving student code...")
 
+    # sets, so every membership check below is O(1).
+    # function names can't contain whitespace, but student names can, so submissions are one per line
     with open("blocked_functions.txt", "r") as blocked_functions_file:
-        blocked_functions = blocked_functions_file.read().split("\n")
+        blocked_functions = set(blocked_functions_file.read().split())
 
     with open("blocked_submissions.txt", "r") as blocked_submissions_file:
-        blocked_submissions = blocked_submissions_file.read().split("\n")
+        blocked_submissions = {line.strip() for line in blocked_submissions_file if line.strip()}
 
     sucessfully_blocked_items = []
 
@@ -213,30 +371,59 @@ def get_and_load_functions(
     num_character_overloaded_pastebins = 0
     num_blocked_pastebins = 0
 
-    strategies_namespace = {"random": random, "math": math}
+    # get all the functions that have been loaded without issue, by name
+    loaded_functions: Dict[str, Strategy] = {}
 
     # Accumulate mapping from strategy name to its source lines across all submissions
     all_strategy_code_pairs: Dict[str, str] = {}
 
     char_counts = []
 
+    # download every submission up front; the downloads are I/O bound so they run in parallel,
+    # but everything after (especially exec) stays on this thread.
+    # blocked submissions and empty cells are never sent to pastebin at all
+    links = {
+        i: data[i][noise_col if noise else regular_col]
+        for i in range(1, len(data))
+        if data[i][name_col] not in blocked_submissions and data[i][noise_col if noise else regular_col].strip()
+    }
+    ids = {i: parse_pastebin_id(link) for i, link in links.items()}
+    # each pastebin is only downloaded once, even if several rows link to it
+    unique_ids = list(dict.fromkeys(id for id in ids.values() if id is not None))
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        fetched = dict(zip(unique_ids, tqdm(
+            executor.map(lambda id: _fetch_pastebin(id, cache, session), unique_ids), total=len(unique_ids)
+        )))
+    codes = {i: fetched[id] if id is not None else None for i, id in ids.items()}
+
     # iterate through all submissions (every student)
-    for i in tqdm(range(1, len(data))):
+    for i in range(1, len(data)):
         if data[i][name_col] in blocked_submissions:
             sucessfully_blocked_items.append(str(data[i][name_col]))
             num_blocked_pastebins += 1
             continue
-        link = data[i][noise_col if noise else regular_col]
+        if i not in links:
+            logger.error(f"No pastebin link submitted for {data[i][name_col]}!")
+            num_erroneous_pastebins += 1
+            continue
+        link = links[i]
 
         # HACK reports a false error if the pastebin is empty
         # because empty strings are falsey
         
-        if not (code := get_pastebin(link, cache=cache)):
+        if not (code := codes[i]):
             logger.error(f"Could not parse pastebin link for {data[i][name_col]}!")
             num_erroneous_pastebins += 1
             continue
         
-        num_functions = get_num_functions(code)
+        compile_error = None
+        try:
+            compiled, num_functions = compile_submission(code, link)
+        except SyntaxError as error:
+            # still checked against the limits below; it is reported when it would have been executed
+            compile_error = error
+            num_functions = get_num_functions(code)
+
         if num_functions > maximum_num_functions:
             num_function_overloaded_pastebins += 1
             logger.error(
@@ -263,33 +450,37 @@ def get_and_load_functions(
             continue
 
 
+        # each submission gets its own namespace, so students can't overwrite each other's helpers
+        strategies_namespace = {"__builtins__": __builtins__, "random": random, "math": math}
         try:
+            if compile_error is not None:
+                raise compile_error
             # oh boy here we go
-            exec(code, strategies_namespace)
+            exec(compiled, strategies_namespace)
         except Exception as error:
             num_erroneous_pastebins += 1
             logger.error(f"Failed to execute code for student {data[i][name_col]}: {str(error)}")
 
-    # get all the functions that have been loaded without issue
-    loaded_functions = []
-
-    for element in strategies_namespace.values():
-        if callable(element):
-            if not element.__name__ in blocked_functions:
-                loaded_functions.append(element)
-            elif element.__name__ in blocked_functions:
-                sucessfully_blocked_items.append(element.__name__)            
+        # only keep functions the submission defined itself (imported
+        # functions like `math.sqrt` or `random.choice` are skipped)
+        for element in strategies_namespace.values():
+            if not isinstance(element, FunctionType) or element.__module__ is not None:
+                continue
+            if element.__name__ in blocked_functions:
+                sucessfully_blocked_items.append(element.__name__)
+                continue
+            if element.__name__ in loaded_functions:
+                logger.error(f"Function {element.__name__} from {data[i][name_col]} replaces an earlier function with the same name!")
+            loaded_functions[element.__name__] = element
 
     # filter for functions that pass basic input/output check
-    good_functions, bad_function_pairs = check_functions(loaded_functions)
+    good_functions, bad_function_pairs = check_functions(list(loaded_functions.values()))
 
     with open(BLACKLIST_LOCATION, "w") as blacklist_file:
-        for function, error in bad_function_pairs:
-            blacklist_file.write(f"From {function.__name__} error: {error}\n")
+        blacklist_file.writelines(f"From {function.__name__} error: {error}\n" for function, error in bad_function_pairs)
 
     with open("successful_blocks.txt", "w") as blocks_file:
-        for successfully_blocked_item in sucessfully_blocked_items:
-            blocks_file.write(f"Successfully blocked {successfully_blocked_item}\n")
+        blocks_file.writelines(f"Successfully blocked {item}\n" for item in sucessfully_blocked_items)
 
     if num_erroneous_pastebins > 0:
         print(f"Could not load code from {num_erroneous_pastebins} pastebins (you can see which ones by looking at 'ipd.log').")
@@ -312,12 +503,16 @@ def get_and_load_functions(
 
     print(f"Loaded {len(good_functions)} good functions.")
 
-    print("Number of characters (no whitespace or comments)")
-    if len(char_counts) > 1:
-        print("std dev:", statistics.stdev(char_counts))
-    print("mean:", statistics.mean(char_counts))
-    print("q1, q2, q3:", statistics.quantiles(char_counts))
-    print("min:", min(char_counts))
-    print("max:", max(char_counts))
-
-    return good_functions, all_strategy_code_pairs
\ No newline at end of file
+    if char_counts:
+        counts = np.asarray(char_counts)
+        print("Number of characters (no whitespace or comments)")
+        if len(counts) > 1:
+            print("std dev:", float(counts.std(ddof=1)))
+        print("mean:", float(counts.mean()))
+        if len(counts) > 1:
+            # numpy has no equivalent of the "exclusive" method, which extrapolates past the data for small samples
+            print("q1, q2, q3:", statistics.quantiles(char_counts))
+        print("min:", int(counts.min()))
+        print("max:", int(counts.max()))
+
+    return {function.__name__: function for function in good_functions}, all_strategy_code_pairs
\ No newline at end of file
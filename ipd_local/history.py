@@ -0,0 +1,167 @@
+"""Submodule for compact move histories.
+
+A history mask stores round `k`'s move in bit `k` (True = rat), so a history of
+`round` moves only ever uses the low `round` bits of the integer.
+`ReplicaState` instead stores the histories of many noise games side by side in arrays.
+"""
+
+from .types import *
+
+import numpy as np
+import dis
+from dataclasses import dataclass
+
+
+def pack_moves(moves: List[bool]) -> int:
+    """Packs a list of moves into a history mask (round k is bit k)."""
+    mask = 0
+    for i, move in enumerate(moves):
+        if move:
+            mask |= 1 << i
+    return mask
+
+
+def unpack_moves(mask: int, rounds: int) -> List[bool]:
+    """Unpacks the first `rounds` moves of a history mask into a list of moves."""
+    return [bool((mask >> i) & 1) for i in range(rounds)]
+
+
+@dataclass(slots=True)
+class HistoryState:
+    """
+    One player's view of a single game: both histories as masks, plus running summaries
+    of the opponent's moves that are updated in O(1) as each round is played.
+    `other_mask` and the summaries are built from the moves the player percieved, not the ones actually made.
+    A new one is made for every player in every game, so it uses slots instead of an instance dict.
+    """
+
+    my_mask: int = 0
+    other_mask: int = 0
+    any_rat: bool = False  # whether the opponent has ever ratted
+    last_rat: bool = False  # whether the opponent ratted last round
+    two_in_a_row: bool = False  # whether the opponent has ever ratted twice in a row
+
+    def update(self, my_move: bool, other_move: bool, current_round: int) -> None:
+        """Records the moves of round `current_round`."""
+        self.my_mask |= my_move << current_round
+        self.other_mask |= other_move << current_round
+        self.any_rat |= other_move
+        self.two_in_a_row |= self.last_rat and other_move
+        self.last_rat = other_move
+
+
+class ReplicaState:
+    """
+    One player's view of many noise games at once, stored as arrays over the games (structure of arrays).
+    `my_moves` holds the player's actual moves and `other_moves` the moves they percieved their opponent make.
+    Only rounds before `current_round` are filled in.
+    """
+
+    def __init__(self, num_games: int, max_rounds: int, rng: np.random.Generator):
+        self.num_games = num_games
+        self.rng = rng
+        self.current_round = 0
+        self.my_moves = np.zeros((num_games, max_rounds), dtype=np.uint8)
+        self.other_moves = np.zeros((num_games, max_rounds), dtype=np.uint8)
+
+        # running summaries of the histories, so kernels never have to scan them
+        self.last_my = np.zeros(num_games, dtype=bool)
+        self.last_other = np.zeros(num_games, dtype=bool)
+        self.second_last_other = np.zeros(num_games, dtype=bool)
+        self.other_rat_count = np.zeros(num_games, dtype=np.int64)
+        self.two_in_a_row = np.zeros(num_games, dtype=bool)
+
+    def update(self, my_move: np.ndarray, other_move: np.ndarray) -> None:
+        """Records one round of moves for every game."""
+        self.my_moves[:, self.current_round] = my_move
+        self.other_moves[:, self.current_round] = other_move
+
+        # the summaries are rebound rather than written in place, so kernels can return them directly
+        self.two_in_a_row = self.two_in_a_row | (self.last_other & other_move)
+        self.second_last_other = self.last_other
+        self.last_other = other_move
+        self.last_my = my_move
+        self.other_rat_count = self.other_rat_count + other_move
+        self.current_round += 1
+
+
+def wants_masks(strategy: Strategy) -> bool:
+    """
+    Whether `strategy` takes `my_mask` and `other_mask` arguments after the usual three, in which case it is
+    also given both histories as masks (the same ones as `HistoryState`'s, so round k is bit k).
+    Once `n` rounds have been played, the opponent's last `n` moves are `(other_mask >> (current_round - n)) & ((1 << n) - 1)`,
+    the oldest of them in the lowest bit, so a pattern can be checked with one comparison instead of `n` list lookups.
+    """
+    code = getattr(strategy, "__code__", None)
+    if code is None:
+        return False
+    parameters = code.co_varnames[3 : code.co_argcount + code.co_kwonlyargcount]
+    return "my_mask" in parameters and "other_mask" in parameters
+
+
+# builtins that only read the list they are given
+_READ_ONLY_BUILTINS = {"len", "any", "all", "sum", "min", "max", "sorted", "list", "tuple", "enumerate", "reversed", "bool"}
+
+
+def _is_subscript(instruction: Optional[dis.Instruction]) -> bool:
+    return instruction is not None and (
+        instruction.opname in ("BINARY_SUBSCR", "BINARY_SLICE")
+        or instruction.opname == "BINARY_OP" and instruction.argrepr == "[]"
+    )
+
+
+def _is_read_only_use(instructions: List[dis.Instruction], k: int, name: str) -> bool:
+    """Whether the list `name` loaded by `instructions[k]` is used in a way that can't modify it or let it escape."""
+    following = instructions[k + 1 : k + 5] + [None] * 4
+    opnames = [instruction.opname if instruction is not None else "" for instruction in following]
+
+    # `moves[i]`, `moves[-1]`, `moves[a:b]`
+    if isinstance(instructions[k].argval, tuple):  # LOAD_FAST_LOAD_FAST pushes `moves, i` in one go
+        first, second = instructions[k].argval
+        return first == name != second and _is_subscript(following[0])
+    if opnames[0].startswith("LOAD_") and _is_subscript(following[1]):
+        return True
+    if opnames[0].startswith("LOAD_") and opnames[1].startswith("LOAD_") and (
+        opnames[2] == "BUILD_SLICE" and _is_subscript(following[3]) or opnames[2] == "BINARY_SLICE"
+    ):
+        return True
+
+    # `x in moves`, `for x in moves`, `moves == ...`, `if moves:`
+    if opnames[0] in ("CONTAINS_OP", "GET_ITER", "COMPARE_OP", "UNARY_NOT", "TO_BOOL") or opnames[0].startswith("POP_JUMP"):
+        return True
+
+    # `len(moves)` and friends
+    previous = instructions[k - 1] if k > 0 else None
+    if previous is not None and previous.opname == "LOAD_GLOBAL" and previous.argval in _READ_ONLY_BUILTINS:
+        call = following[1] if opnames[0] == "PRECALL" else following[0]
+        return call is not None and call.opname == "CALL" and call.arg == 1
+
+    return False
+
+
+def needs_history_copies(strategy: Strategy) -> Tuple[bool, bool]:
+    """
+    Works out from the bytecode of `strategy` whether its `my_moves` and `other_moves` arguments must be
+    copied before each call, to stop it from modifying the simulation's histories.
+    An argument can be passed without copying if it is only ever indexed, sliced, measured (`len`, `sum`, ...),
+    iterated over or tested. Anything else, including passing it to another function or a closure, needs a copy.
+    The check can be fooled (a comparison can call an `__eq__` that modifies its other operand, and builtins can
+    be rebound), so it is only good for trusted code like the default functions; submitted strategies always get copies.
+    """
+    code = getattr(strategy, "__code__", None)
+    if code is None or code.co_argcount < 2:
+        return (True, True)
+
+    instructions = list(dis.get_instructions(code))
+    needs_copy = []
+    for name in code.co_varnames[:2]:
+        if name in code.co_cellvars:
+            needs_copy.append(True)
+            continue
+        needs_copy.append(any(
+            instruction.opname.startswith(("LOAD_FAST", "STORE_FAST", "DELETE_FAST"))
+            and (name == instruction.argval or isinstance(instruction.argval, tuple) and name in instruction.argval)
+            and not (instruction.opname.startswith("LOAD_FAST") and _is_read_only_use(instructions, k, name))
+            for k, instruction in enumerate(instructions)
+        ))
+    return tuple(needs_copy)
@@ -4,12 +4,17 @@ from .types import *
 from .game_specs import *
 from .output_locations import *
 from .utils import suppress_output, check_type
+from .default_strategies import get_bitmask_kernel, get_vectorized_kernel, is_default_function
+from .history import HistoryState, ReplicaState, needs_history_copies, wants_masks
 
 from tqdm import tqdm
-from functools import partial
+from functools import partial, lru_cache
+from itertools import combinations
 from loguru import logger
 import multiprocessing as mp
+import multiprocessing.util
 import marshal
+import copy
 from collections import defaultdict
 
 # ⬇️ the below section of imports is pretty important, a lot 
@@ -22,6 +27,35 @@ import math
 import numpy as np
 
 
+# the same strategies are packed and unpacked for match after match, and code objects are immutable,
+# so both directions of the conversion are cached
+@lru_cache(maxsize=1024)
+def _dump_code(code: CodeType) -> bytes:
+    return marshal.dumps(code)
+
+
+@lru_cache(maxsize=1024)
+def _load_code(data: bytes) -> CodeType:
+    return marshal.loads(data)
+
+
+def _pack_one(function: Callable[..., Any]) -> Tuple[bytes, str]:
+    return (_dump_code(function.__code__), function.__name__)
+
+
+def _new_namespace() -> Dict[str, Any]:
+    """A fresh globals dict for unpacked functions, with everything this module imports (see above)."""
+    return dict(globals())
+
+
+def _unpack_one(packed: Tuple[bytes, str], default_name: str, namespace: Dict[str, Any]) -> Callable[..., Any]:
+    """Unpacks a function into `namespace`, so it and the others unpacked there can call each other by name."""
+    # only the code is cached; every unpack still makes a new function (as `_play_matchup` does), so matches never share one
+    function = FunctionType(_load_code(packed[0]), namespace, packed[1] or default_name)
+    namespace[function.__name__] = function
+    return function
+
+
 def pack_functions(
     functions: Tuple[Callable[..., Any], Callable[..., Any]]
 ) -> Tuple[Tuple[bytes, str], Tuple[bytes, str]]:
@@ -29,10 +63,7 @@ def pack_functions(
     Note:
     - If the function references globals, it will not work!
     """
-    return (
-        (marshal.dumps(functions[0].__code__), functions[0].__name__),
-        (marshal.dumps(functions[1].__code__), functions[1].__name__),
-    )
+    return (_pack_one(functions[0]), _pack_one(functions[1]))
 
 
 def unpack_functions(
@@ -40,20 +71,31 @@ def unpack_functions(
 ) -> Tuple[Callable[..., Any], Callable[..., Any]]:
     """Unpacks a tuple of two tuples of bytecode sequences and names into a tuple of functions.
     Default function names are "p1" and "p2".
+    Both functions share a new namespace, so they never modify this module's globals.
     """
-    return (
-        FunctionType(
-            marshal.loads(bytecodes[0][0]), globals(), bytecodes[0][1] or "p1"
-        ),
-        FunctionType(
-            marshal.loads(bytecodes[1][0]), globals(), bytecodes[1][1] or "p2"
-        ),
+    namespace = _new_namespace()
+    return (_unpack_one(bytecodes[0], "p1", namespace), _unpack_one(bytecodes[1], "p2", namespace))
+
+
+def _score_table(both_coop: int, loser: int, winner: int, both_rat: int) -> np.ndarray:
+    """The points of (player 1, player 2) for each round outcome, indexed by `2 * player1_move + player2_move`."""
+    return np.array(
+        [(both_coop, both_coop), (loser, winner), (winner, loser), (both_rat, both_rat)],
+        dtype=np.float64,
     )
 
 
+DEFAULT_PAYOFFS_KEY = (POINTS_BOTH_COOPERATE, POINTS_DIFFERENT_LOSER, POINTS_DIFFERENT_WINNER, POINTS_BOTH_RAT)
+SCORE_TABLE = _score_table(*DEFAULT_PAYOFFS_KEY)
+SCORE_TUPLES = tuple(map(tuple, SCORE_TABLE.tolist()))
+
+# below this many rounds, indexing a tuple table in python is faster than the setup cost of the numpy path
+SMALL_GAME_ROUNDS = 64
+
+
 def get_scores(
-    player1_moves: List[bool],
-    player2_moves: List[bool],
+    player1_moves: List[bool] | bytearray,
+    player2_moves: List[bool] | bytearray,
     both_coop: int = POINTS_BOTH_COOPERATE,
     loser: int = POINTS_DIFFERENT_LOSER,
     winner: int = POINTS_DIFFERENT_WINNER,
@@ -63,6 +105,7 @@ def get_scores(
     Calculates the points each player has given their set of moves.
 
     Note: `player1_moves` and `player2_moves` are assumed to be equal length!
+    They can also be `bytearray`s of 0s and 1s.
 
     Arguments:
     - `player1_moves`: the list of moves player 1 made
@@ -77,25 +120,140 @@ def get_scores(
     Returns: a 2-element list of the points of player 1 and player 2.
     """
 
-    # both coop, get exploited, exploit other, both cheat
-    payoffs = [both_coop, loser, winner, both_rat]
+    if not player1_moves:
+        return (0.0, 0.0)
+
+    default_payoffs = (both_coop, loser, winner, both_rat) == DEFAULT_PAYOFFS_KEY
+
+    if len(player1_moves) < SMALL_GAME_ROUNDS:
+        if default_payoffs:
+            score_tuples = SCORE_TUPLES
+        else:
+            score_tuples = tuple(map(tuple, _score_table(both_coop, loser, winner, both_rat).tolist()))
+        player1score = player2score = 0.0
+        for player1_move, player2_move in zip(player1_moves, player2_moves):
+            points = score_tuples[(player1_move << 1) | player2_move]
+            player1score += points[0]
+            player2score += points[1]
+        return (player1score, player2score)
+
+    score_table = SCORE_TABLE if default_payoffs else _score_table(both_coop, loser, winner, both_rat)
+
+    # bools pack to 0/1 bytes, so the moves can be viewed as arrays without a python-level loop
+    player1 = np.frombuffer(bytes(player1_moves), dtype=np.uint8)
+    player2 = np.frombuffer(bytes(player2_moves), dtype=np.uint8)
+
+    # count how often each of the 4 outcomes happened, then weight the counts by their points
+    outcome_counts = np.bincount((player1 << 1) | player2, minlength=4)
+    player1score, player2score = (outcome_counts @ score_table).tolist()
+    return (player1score, player2score)
+
+
+def _get_mask_scores(player1_mask: int, player2_mask: int, rounds: int) -> Tuple[float, float]:
+    """`get_scores` for two histories stored as masks (see `history.HistoryState`) that are `rounds` long."""
+    both_rat = (player1_mask & player2_mask).bit_count()
+    player1_only = player1_mask.bit_count() - both_rat
+    player2_only = player2_mask.bit_count() - both_rat
+    both_coop = rounds - both_rat - player1_only - player2_only
+    shared = both_coop * POINTS_BOTH_COOPERATE + both_rat * POINTS_BOTH_RAT
+    return (
+        float(shared + player1_only * POINTS_DIFFERENT_WINNER + player2_only * POINTS_DIFFERENT_LOSER),
+        float(shared + player2_only * POINTS_DIFFERENT_WINNER + player1_only * POINTS_DIFFERENT_LOSER),
+    )
+
+
+def _play_kernel_game(
+    player1_kernel: BitmaskStrategy,
+    player2_kernel: BitmaskStrategy,
+    rounds: int,
+    game_flips: Optional[List[List[bool]]],
+) -> Tuple[float, float]:
+    """
+    Plays one game between two bit-packed default functions.
+    Kernels always return a bool and never queue moves, so the loop only has to call them and update their states.
+    `game_flips` is `None` for a game without noise.
+    """
+    player1state = HistoryState()
+    player2state = HistoryState()
+    player1update = player1state.update
+    player2update = player2state.update
+    if game_flips is None:
+        for i in range(rounds):
+            player1move = player1_kernel(player1state, i)
+            player2move = player2_kernel(player2state, i)
+            player1update(player1move, player2move, i)
+            player2update(player2move, player1move, i)
+    else:
+        for i in range(rounds):
+            player1move = player1_kernel(player1state, i)
+            player2move = player2_kernel(player2state, i)
+            player1flip, player2flip = game_flips[i]
+            player1update(player1move, player2move ^ player2flip, i)
+            player2update(player2move, player1move ^ player1flip, i)
+    return _get_mask_scores(player1state.my_mask, player2state.my_mask, rounds)
+
+
+def play_vectorized_match(
+    player1_kernel: VectorizedStrategy,
+    player2_kernel: VectorizedStrategy,
+    noise_level: float,
+    rounds: List[int],
+    rng: np.random.Generator,
+    flips: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Plays all noise games of a match between two vectorized default functions in lockstep.
+
+    Arguments:
+    - `player1_kernel`, `player2_kernel`: the vectorized versions of the two players (see `default_strategies.vectorized_kernels`)
+    - `noise_level`: chance of miscommunicating
+    - `rounds`: the number of rounds of each game; its length is the number of games
+    - `rng`: the generator used for noise and for the random default functions
+    - `flips`: pre-drawn noise (see `play_match`'s `noise_mask`); drawn from `rng` each round if not given
+
+    Games that are shorter than the longest one are played to the end anyway, but the extra rounds are not scored.
 
-    player1_score, player2_score = 0.0, 0.0
+    Returns: a (number of games, 2) array of the scores of player 1 and player 2 in each game.
+    """
 
-    for player1_move, player2_move in zip(player1_moves, player2_moves):
-        player1_score += payoffs[2 * player1_move + player2_move]
-        player2_score += payoffs[2 * player2_move + player1_move]
+    num_games, max_rounds = len(rounds), max(rounds)
+    player1state = ReplicaState(num_games, max_rounds, rng)
+    player2state = ReplicaState(num_games, max_rounds, rng)
 
-    return (player1_score, player2_score)
+    for _ in range(max_rounds):
+        player1move = player1_kernel(player1state)
+        player2move = player2_kernel(player2state)
+        if flips is None:
+            player1percieved = np.where(rng.random(num_games) < noise_level, ~player1move, player1move)
+            player2percieved = np.where(rng.random(num_games) < noise_level, ~player2move, player2move)
+        else:
+            player1percieved = player1move ^ flips[:num_games, player1state.current_round, 0]
+            player2percieved = player2move ^ flips[:num_games, player2state.current_round, 1]
+        player1state.update(player1move, player2percieved)
+        player2state.update(player2move, player1percieved)
+
+    return _score_games(player1state.my_moves, player2state.my_moves, rounds)
+
+
+def _score_games(player1moves: np.ndarray, player2moves: np.ndarray, rounds: List[int]) -> np.ndarray:
+    """
+    `get_scores` for many games at once, given (number of games, longest game) arrays of 0/1 moves.
+    Only the first `rounds[game]` moves of each game are scored.
+    Returns: a (number of games, 2) array of the scores of player 1 and player 2 in each game.
+    """
+    played = np.arange(player1moves.shape[1]) < np.asarray(rounds)[:, None]
+    return (SCORE_TABLE[(player1moves << 1) | player2moves] * played[:, :, None]).sum(axis=1)
 
 
 def play_match(
     bytecode: Tuple[bytes, bytes],
     noise: bool = NOISE,
     noise_level: float = NOISE_LEVEL,
-    rounds: List[int] = ROUNDS,
+    rounds: int | List[int] | None = None,
     num_noise_games_to_avg: int = NUM_NOISE_GAMES_TO_AVG,
-    random_seed: int = RANDOM_SEED
+    random_seed: int = RANDOM_SEED,
+    noise_mask: Optional[np.ndarray] = None,
+    rng: Optional[np.random.Generator] = None,
 ) -> Optional[List[float]]:
     """
     Plays a match of Iterated Prisoner's Dilemma between two players.
@@ -104,46 +262,145 @@ def play_match(
     - `bytecode`: a tuple of the bytecode representations of the two players.
     - `noise`: whether or not noise is enabled.
     - `noise_level`: chance of miscommunicating (only takes affect if noise is on)
-    - `rounds`: the list of numbers of rounds for the game.
+    - `rounds`: the list of numbers of rounds for the game (or a single number used for every game).
+      Defaults to `get_rounds()`.
     - `noise_games_to_average`: the number of games to play before averaging results if noise is on.
+    - `noise_mask`: the noise to use instead of drawing it (only takes affect if noise is on), as a boolean array of
+      shape (games, rounds, 2) where `noise_mask[game, round]` is whether (player 1's move, player 2's move) is misheard.
+      Lets callers that replay a match draw its noise once. Defaults to drawing it from a NumPy generator seeded with `random_seed`.
+      Raises `ValueError` if it is not exactly (`num_noise_games_to_avg`, the longest game's rounds, 2) in shape.
+    - `rng`: the NumPy generator the simulation draws noise (and the vectorized random default functions) from.
+      Defaults to a new one seeded with `random_seed`. `random` and `np.random` are still seeded with `random_seed`
+      either way, since submitted strategies draw from those.
 
     `noise`, `noise_level`, `rounds`, and `num_games` all default to the values specified in `game_specs.py`
 
+    Default functions are played through their bit-packed versions (see `default_strategies.bitmask_kernels`),
+    so they never need copies of the move lists. Other functions are always given copies of the histories,
+    so they can never modify the simulation's own.
+    If noise is on and both players are default functions, all noise games are played at once
+    with `play_vectorized_match` instead (random draws then come from `rng`).
+
     Returns: a 2-element list of their scores.
     """
+    player1, player2 = unpack_functions(bytecode)
+    return _play_unpacked_match(
+        player1, player2, noise, noise_level, rounds, num_noise_games_to_avg, random_seed, noise_mask, rng
+    )
 
-    np.random.seed(random_seed)
-    random.seed(random_seed)
 
-    player1, player2 = unpack_functions(bytecode)
-    globals()[player1.__name__] = player1
-    globals()[player2.__name__] = player2
+def _play_unpacked_match(
+    player1: Strategy,
+    player2: Strategy,
+    noise: bool,
+    noise_level: float,
+    rounds: int | List[int] | None,
+    num_noise_games_to_avg: int,
+    random_seed: int,
+    noise_mask: Optional[np.ndarray] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> Optional[List[float]]:
+    """`play_match` for two functions that have already been unpacked (see `play_match` for the arguments)."""
 
-    games = np.zeros((num_noise_games_to_avg if noise else 1, 2))
+    np.random.seed(random_seed)
+    random.seed(random_seed)
+    if rng is None:
+        rng = np.random.default_rng(random_seed)
+
+    if rounds is None:
+        rounds = get_rounds()
+    elif isinstance(rounds, int):
+        rounds = [rounds] * (num_noise_games_to_avg if noise else 1)
+    if noise and noise_mask is not None:
+        noise_mask = np.asarray(noise_mask, dtype=bool)
+        # checked up front, since a wrong shape would otherwise only fail (or be ignored) partway through a game
+        expected_shape = (num_noise_games_to_avg, max(rounds[:num_noise_games_to_avg]), 2)
+        if noise_mask.shape != expected_shape:
+            raise ValueError(f"noise_mask has shape {noise_mask.shape}, expected {expected_shape} (games, rounds, 2)")
+
+    if noise:
+        player1_vectorized = get_vectorized_kernel(player1)
+        player2_vectorized = get_vectorized_kernel(player2)
+        if player1_vectorized is not None and player2_vectorized is not None:
+            games = play_vectorized_match(
+                player1_vectorized,
+                player2_vectorized,
+                noise_level,
+                rounds[:num_noise_games_to_avg],
+                rng,
+                noise_mask,
+            )
+            return tuple(np.mean(games, axis=0).tolist())
+
+    player1_kernel = get_bitmask_kernel(player1)
+    player2_kernel = get_bitmask_kernel(player2)
+    # default functions that only read their histories are given the live lists instead of fresh copies every round;
+    # submitted strategies always get copies, so they can never rewrite the moves that are scored
+    player1_copy_mine, player1_copy_other = needs_history_copies(player1) if is_default_function(player1) else (True, True)
+    player2_copy_mine, player2_copy_other = needs_history_copies(player2) if is_default_function(player2) else (True, True)
+    # strategies can also ask for their histories as masks by taking `my_mask` and `other_mask` arguments
+    player1_wants_masks = wants_masks(player1)
+    player2_wants_masks = wants_masks(player2)
+
+    num_games = num_noise_games_to_avg if noise else 1
+    # every noise flip of the match is drawn at once instead of calling `random.random()` twice a round;
+    # flips[game, round] is whether (player 1's move, player 2's move) is misheard
+    if noise and noise_mask is not None:
+        flips = noise_mask
+    elif noise:
+        flips = rng.random((num_games, max(rounds[:num_games]), 2)) < noise_level
+
+    games = np.zeros((num_games, 2))
+    kernel_game = player1_kernel is not None and player2_kernel is not None
+    if not kernel_game:
+        # the moves of every game are kept, so that all the games can be scored together at the end
+        player1match = np.zeros((num_games, max(rounds[:num_games])), dtype=np.uint8)
+        player2match = np.zeros_like(player1match)
     with suppress_output():
-        for game_num in range(num_noise_games_to_avg if noise else 1):
-            player1moves = []
-            player2moves = []
-            player1percieved = []
-            player2percieved = []
+        for game_num in range(num_games):
+            game_flips = flips[game_num].tolist() if noise else None
+            if kernel_game:
+                games[game_num] = _play_kernel_game(player1_kernel, player2_kernel, rounds[game_num], game_flips)
+                continue
+
+            if noise:
+                # histories only a bit-packed kernel will see (or only scoring will read) are kept as
+                # one byte per move instead of a list; strategies that are called with them still get lists
+                player1moves = bytearray() if player1_kernel is not None else []
+                player2moves = bytearray() if player2_kernel is not None else []
+                player1percieved = bytearray() if player2_kernel is not None else []
+                player2percieved = bytearray() if player1_kernel is not None else []
+            else:
+                # without noise both players see the real moves, so each history is shared by both of them
+                player1moves = player1percieved = []
+                player2moves = player2percieved = []
+            # moves queued by strategies that returned lists, stored last move first so each one is an O(1) pop;
+            # the strategy isn't called again until its queue is empty
             player1currentreturnedmoves = []
             player2currentreturnedmoves = []
+            player1state = HistoryState()
+            player2state = HistoryState()
 
             for i in range(rounds[game_num]):
                 try:
                     if player1currentreturnedmoves:
-                        player1move = player1currentreturnedmoves.pop(0)
+                        player1move = player1currentreturnedmoves.pop()
+                    elif player1_kernel is not None:
+                        player1move = player1_kernel(player1state, i)
                     else:
-                        player1move = player1(
-                            player1moves.copy(),
-                            player2percieved.copy(),
-                            i,
-                        )
+                        player1mine = player1moves.copy() if player1_copy_mine else player1moves
+                        player1other = player2percieved.copy() if player1_copy_other else player2percieved
+                        if player1_wants_masks:
+                            player1move = player1(
+                                player1mine, player1other, i, my_mask=player1state.my_mask, other_mask=player1state.other_mask
+                            )
+                        else:
+                            player1move = player1(player1mine, player1other, i)
                         if check_type(player1move, list[bool]):
                             if len(player1move) == 0:
                                 raise Exception("Strategy returned empty list!")
-                            player1currentreturnedmoves = player1move.copy()
-                            player1move = player1currentreturnedmoves.pop(0)
+                            player1currentreturnedmoves = player1move[::-1]
+                            player1move = player1currentreturnedmoves.pop()
 
 
                     if not isinstance(player1move, bool):
@@ -156,19 +413,23 @@ def play_match(
 
                 try:
                     if player2currentreturnedmoves:
-                        player2move = player2currentreturnedmoves.pop(0)
+                        player2move = player2currentreturnedmoves.pop()
+                    elif player2_kernel is not None:
+                        player2move = player2_kernel(player2state, i)
                     else:
-                        
-                        player2move = player2(
-                            player2moves.copy(),
-                            player1percieved.copy(),
-                            i,
-                        )
+                        player2mine = player2moves.copy() if player2_copy_mine else player2moves
+                        player2other = player1percieved.copy() if player2_copy_other else player1percieved
+                        if player2_wants_masks:
+                            player2move = player2(
+                                player2mine, player2other, i, my_mask=player2state.my_mask, other_mask=player2state.other_mask
+                            )
+                        else:
+                            player2move = player2(player2mine, player2other, i)
                         if check_type(player2move, list[bool]):
                             if len(player2move) == 0:
                                 raise Exception("Strategy returned empty list!")
-                            player2currentreturnedmoves = player2move.copy()
-                            player2move = player2currentreturnedmoves.pop(0)
+                            player2currentreturnedmoves = player2move[::-1]
+                            player2move = player2currentreturnedmoves.pop()
 
                     if not isinstance(player2move, bool):
                         raise Exception("Strategy returned invalid response!")
@@ -180,26 +441,26 @@ def play_match(
 
                 player1moves.append(player1move)
                 player2moves.append(player2move)
-                player1percieved.append(
-                    not player1move
-                    if noise and random.random() < noise_level
-                    else player1move
-                )
-                player2percieved.append(
-                    not player2move
-                    if noise and random.random() < noise_level
-                    else player2move
-                )
+                if noise:
+                    player1flip, player2flip = game_flips[i]
+                    player1percievedmove = player1move ^ player1flip
+                    player2percievedmove = player2move ^ player2flip
+                    player1percieved.append(player1percievedmove)
+                    player2percieved.append(player2percievedmove)
+                else:
+                    player1percievedmove = player1move
+                    player2percievedmove = player2move
+                player1state.update(player1move, player2percievedmove, i)
+                player2state.update(player2move, player1percievedmove, i)
 
             if len(player1moves) != rounds[game_num] or len(player2moves) != rounds[game_num]:
                 return None
 
-            games[game_num] = get_scores(player1moves, player2moves)
-    if player1.__name__ in globals():
-        del globals()[player1.__name__]
-    if player2.__name__ in globals():
-        del globals()[player2.__name__]
+            player1match[game_num, : rounds[game_num]] = np.frombuffer(bytes(player1moves), dtype=np.uint8)
+            player2match[game_num, : rounds[game_num]] = np.frombuffer(bytes(player2moves), dtype=np.uint8)
 
+    if not kernel_game:
+        games = _score_games(player1match, player2match, rounds[:num_games])
     return tuple(np.mean(games, axis=0).tolist())
 
 
@@ -207,7 +468,7 @@ def run_simulation(
     strats: List[Strategy],
     noise: bool = NOISE,
     noise_level: float = NOISE_LEVEL,
-    rounds: List[int] = ROUNDS,
+    rounds: int | List[int] | None = None,
     num_noise_games_to_avg: int = NUM_NOISE_GAMES_TO_AVG,
     random_seed: int = RANDOM_SEED,
 ) -> Dict[str, Dict[str, List[int]]]:
@@ -218,7 +479,7 @@ def run_simulation(
     - `strats`: a list of strategies to run in the tournament.
     - `noise`: whether or not noise is enabled.
     - `noise_level`: chance of miscommunicating (only takes affect if noise is on)
-    - `rounds`: the list of numbers of rounds for the game.
+    - `rounds`: the list of numbers of rounds for the game. Defaults to `get_rounds()`.
     - `noise_games_to_average`: the number of games to play before averaging results if noise is on.
 
     `noise`, `noise_level`, `rounds`, and `num_games` all default to the values specified in `game_specs.py`
@@ -230,17 +491,31 @@ def run_simulation(
     print(out["SteveFunc"]["QuackaryFunc"]) # gives results of Steve vs. Quackary
     ```
     """
-    matchups = []
     noise_desc = f"A Noise level of {NOISE_LEVEL} averaged over {num_noise_games_to_avg} games" if noise else "No Noise"
     print(f"Running simulation with {len(strats)} strategies and {noise_desc}.")
-    for i, p1 in enumerate(strats):
-        for j, p2 in enumerate(strats):
-            if j <= i:
-                continue
-            matchups.append((p1, p2))
-    with mp.Pool(mp.cpu_count()) as pool:
-        specified_play_match = partial(
-            play_match,
+    matchups = list(combinations(range(len(strats)), 2))
+
+    # every match is seeded the same way, so strategies with the same code always play the same way (with or
+    # without noise); each matchup is played by the first strategy with each code, and every distinct pair only once
+    # (two strategies with the same code become the pair (k, k), which `_play_matchup` still plays as two functions)
+    first_with_code = {}
+    representatives = [first_with_code.setdefault(_code_signature(strat), i) for i, strat in enumerate(strats)]
+    distinct_matchups = sorted({(representatives[i], representatives[j]) for i, j in matchups})
+
+    # every worker gets the strategies once, so only the indices of each matchup are sent to it
+    if "fork" in mp.get_all_start_methods():
+        # forked workers inherit the strategies' code as it is, without pickling or marshalling anything
+        context = mp.get_context("fork")
+        initializer, initargs = _set_worker_strategies, (strats,)
+    else:
+        # other platforms (Windows) start workers from scratch, so they are sent bytecode to unpack
+        context = mp.get_context()
+        initializer, initargs = _init_worker, ([(_pack_one(strat), _defaults_of(strat)) for strat in strats],)
+
+    num_workers = mp.cpu_count()
+    with context.Pool(num_workers, initializer=initializer, initargs=initargs) as pool:
+        specified_play_matchup = partial(
+            _play_matchup,
             noise=noise,
             noise_level=noise_level,
             rounds=rounds,
@@ -250,18 +525,103 @@ def run_simulation(
 
         result = list(
             tqdm(
-                pool.imap(
-                    specified_play_match,
-                    [pack_functions(x) for x in matchups],
+                pool.imap_unordered(
+                    specified_play_matchup,
+                    distinct_matchups,
+                    # about 8 chunks per worker: few enough to amortize IPC, enough to balance uneven matches
+                    chunksize=max(1, len(distinct_matchups) // (num_workers * 8)),
                 ),
-                total=len(matchups),
+                total=len(distinct_matchups),
             )
         )
+    match_results = {(i, j): match_result for i, j, match_result in result}
+
     output = defaultdict(dict)
-    for i, matchup in enumerate(matchups):
-        match_result = result[i]
+    # going through the matchups in order keeps the output's key order stable
+    for i, j in matchups:
+        match_result = match_results[representatives[i], representatives[j]]
         if match_result == None:
             continue
-        output[matchup[0].__name__][matchup[1].__name__] = match_result
-        output[matchup[1].__name__][matchup[0].__name__] = tuple(reversed(match_result))
+        player1score, player2score = match_result
+        output[strats[i].__name__][strats[j].__name__] = match_result
+        output[strats[j].__name__][strats[i].__name__] = (player2score, player1score)
     return output
+
+
+def _code_signature(strategy: Strategy) -> Tuple[Any, ...]:
+    """
+    A key that is equal for two strategies exactly when they are known to play the same way:
+    everything about their code except its name and line numbers, their default arguments, and which kernels
+    (if any) they are played with. Strategies with closures get a key of their own, since their captured variables
+    could differ, and so do strategies with defaults that can't be compared by value.
+    """
+    code = strategy.__code__
+    if strategy.__closure__ is not None:
+        return (id(strategy),)
+    try:
+        defaults = marshal.dumps(_defaults_of(strategy))  # like `co_consts` below, keeps 1, 1.0 and True apart
+    except ValueError:
+        return (id(strategy),)
+    return (
+        defaults,
+        code.co_code,
+        marshal.dumps(code.co_consts),  # unlike the tuple itself, keeps 1, 1.0 and True apart
+        code.co_names,
+        code.co_varnames,
+        code.co_argcount,
+        code.co_flags,
+        get_bitmask_kernel(strategy),
+        get_vectorized_kernel(strategy),
+    )
+
+
+def _defaults_of(strategy: Strategy) -> Tuple[Optional[Tuple[Any, ...]], Optional[Dict[str, Any]]]:
+    """The default values of `strategy`'s positional and keyword-only arguments."""
+    return (strategy.__defaults__, strategy.__kwdefaults__)
+
+
+# the code, name, closure and defaults of each strategy of the tournament being run, set once in each worker process;
+# the function objects themselves are not kept, so state a strategy keeps on its function never outlives a match
+_worker_strategies: List[Tuple[CodeType, str, Optional[Tuple[Any, ...]], Tuple[Any, Any]]] = []
+
+
+def _set_worker_strategies(strategies: List[Strategy]) -> None:
+    global _worker_strategies
+    _worker_strategies = [
+        (strategy.__code__, strategy.__name__, strategy.__closure__, _defaults_of(strategy)) for strategy in strategies
+    ]
+    # workers only ever play matches, so their descriptors are silenced once for the life of the worker (and
+    # restored when it exits); the `suppress_output` of every match only swaps `sys.stdout` and `sys.stderr`
+    if mp.parent_process() is not None:
+        worker_output = suppress_output(fds=True)
+        worker_output.__enter__()
+        mp.util.Finalize(None, worker_output.__exit__, args=(None, None, None), exitpriority=0)
+
+
+def _init_worker(packed_strategies: List[Tuple[Tuple[bytes, str], Tuple[Any, Any]]]) -> None:
+    namespace = _new_namespace()
+    strategies = []
+    for i, (packed, (defaults, kwdefaults)) in enumerate(packed_strategies):
+        strategy = _unpack_one(packed, f"p{i}", namespace)
+        strategy.__defaults__, strategy.__kwdefaults__ = defaults, kwdefaults
+        strategies.append(strategy)
+    _set_worker_strategies(strategies)
+
+
+def _play_matchup(matchup: Tuple[int, int], **match_kwargs) -> Tuple[int, int, Optional[List[float]]]:
+    i, j = matchup
+    # like `unpack_functions`, every match gets new functions in a new namespace, even when i == j
+    namespace = _new_namespace()
+    player1, player2 = (_build_one(*_worker_strategies[k], namespace) for k in (i, j))
+    return i, j, _play_unpacked_match(player1, player2, **match_kwargs)
+
+
+def _build_one(
+    code: CodeType, name: str, closure: Optional[Tuple[Any, ...]], defaults: Tuple[Any, Any], namespace: Dict[str, Any]
+) -> Strategy:
+    # the defaults are copied too, so a mutable default (like a list) is fresh in every match
+    positional, keyword_only = defaults if defaults[0] is None and defaults[1] is None else copy.deepcopy(defaults)
+    function = FunctionType(code, namespace, name, positional, closure)
+    function.__kwdefaults__ = keyword_only
+    namespace[name] = function
+    return function
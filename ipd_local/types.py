@@ -1,4 +1,11 @@
-from typing import List, Tuple, Any, Dict, Optional, Callable, TypeAlias
-from types import FunctionType
+from typing import List, Tuple, Any, Dict, Optional, Callable, TypeAlias, FrozenSet
+from types import FunctionType, CodeType, MappingProxyType
 
-Strategy: TypeAlias = Callable[[List[bool], List[bool], int], bool | List[bool]]
\ No newline at end of file
+Strategy: TypeAlias = Callable[[List[bool], List[bool], int], bool | List[bool]]
+
+# same as `Strategy`, but the move histories come as a `history.HistoryState`
+# (bit-packed masks where round k is bit k, plus running summaries)
+BitmaskStrategy: TypeAlias = Callable[[Any, int], bool]
+
+# plays one round of every noise game at once; takes a `history.ReplicaState` and returns a boolean array
+VectorizedStrategy: TypeAlias = Callable[[Any], Any]
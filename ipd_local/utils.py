@@ -1,69 +1,138 @@
 import sys
 import os
 import re
+import atexit
+import io
 from typing import get_origin
+from functools import lru_cache
+
+# smart quotes that LLMs like to use, folded to plain ones in a single pass
+_QUOTE_TABLE = str.maketrans({"“": '"', "”": '"', "„": '"', "‟": '"', "’": "'", "‘": "'"})
+_FENCE_HEAD = re.compile(r"^```[a-zA-Z]*\n?")
+_FENCE_TAIL = re.compile(r"\n?```$")
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+# responses up to this long are memoized, since the same (often degenerate) responses come back many times
+_CLEAN_CACHE_MAX_LENGTH = 4096
 
 def clean_json_like(s: str) -> str:
+    if len(s) < _CLEAN_CACHE_MAX_LENGTH:
+        return _clean_json_like_cached(s)
+    return _clean_json_like(s)
+
+def _clean_json_like(s: str) -> str:
     s = s.strip()
-    s = re.sub(r"^```[a-zA-Z]*\n?", "", s)
-    s = re.sub(r"\n?```$", "", s)
-    s = s.replace("“", '"').replace("”", '"').replace("„", '"').replace("‟", '"')
-    s = s.replace("’", "'").replace("‘", "'")
+    if s.startswith("{") and s.endswith("}"):
+        # already a bare object: there are no fences to strip or surrounding text to cut off
+        return _TRAILING_COMMA.sub(r"\1", s.translate(_QUOTE_TABLE))
+    s = _FENCE_HEAD.sub("", s, count=1)
+    s = _FENCE_TAIL.sub("", s, count=1)
+    s = s.translate(_QUOTE_TABLE)
     start = s.find("{")
     end = s.rfind("}")
     if start != -1 and end != -1:
         s = s[start:end+1]
-    s = re.sub(r",\s*([}\]])", r"\1", s)
+    s = _TRAILING_COMMA.sub(r"\1", s)
     return s
 
-_re_s5 = re.compile(r'"summary5"\s*:\s*"((?:\\.|[^"\\])*)"')
-_re_s40 = re.compile(r'"summary40"\s*:\s*"((?:\\.|[^"\\])*)"')
+_clean_json_like_cached = lru_cache(maxsize=512)(_clean_json_like)
+
+# both fields in one pattern, so a response is only scanned once
+_re_summaries = re.compile(r'"(summary5|summary40)"\s*:\s*"((?:\\.|[^"\\])*)"')
 
 def recover_summary_fields(s: str):
     s = s.strip()
-    m5 = _re_s5.search(s)
-    m40 = _re_s40.search(s)
     out = {}
-    if m5:
-        out["summary5"] = m5.group(1)
-    if m40:
-        out["summary40"] = m40.group(1)
+    for m in _re_summaries.finditer(s):
+        out.setdefault(m.group(1), m.group(2))  # the first occurrence of each field wins, as with `search`
     return out if out else None
 
+# opened once and shared by every `suppress_output`, instead of being reopened on each entry
+_DEVNULL = open(os.devnull, "w")
+atexit.register(_DEVNULL.close)
+
+class _Null(io.TextIOBase):
+    """A text stream that drops everything written to it without a system call."""
+
+    def write(self, s):
+        return len(s)
+
+    def fileno(self):
+        # anything that writes to the descriptor directly still ends up in /dev/null
+        return _DEVNULL.fileno()
+
+_NULL = _Null()
+
+# how many `suppress_output(fds=True)` contexts are open; only the outermost one redirects the file descriptors
+_fd_redirects = 0
+
 class suppress_output:
+    """
+    Silences stdout and stderr by swapping `sys.stdout` and `sys.stderr` for a stream that discards everything.
+    With `fds=True`, the file descriptors under them are redirected to /dev/null as well, so output written
+    straight to the descriptors (by C extensions, for example) is silenced too. That costs a few system calls
+    and silences everything else in the process, so it is only meant for long-lived contexts like a whole worker.
+    """
+
+    def __init__(self, fds: bool = False):
+        self.fds = fds
+
     def __enter__(self):
+        global _fd_redirects
+        for stream in (sys.stdout, sys.stderr):
+            if stream is not None:  # both are None without a console (e.g. pythonw)
+                stream.flush()
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
-        self.null = open(os.devnull, "w")
-        sys.stdout = self.null
-        sys.stderr = self.null  # Redirect stderr as well
+        self.original_fds = None
+        if self.fds:
+            # descriptors redirected by an enclosing context are already silenced
+            if _fd_redirects == 0:
+                try:
+                    self.original_fds = (os.dup(1), os.dup(2))
+                except OSError:  # no real descriptors to redirect (e.g. pythonw)
+                    pass
+                else:
+                    os.dup2(_DEVNULL.fileno(), 1)
+                    os.dup2(_DEVNULL.fileno(), 2)
+            _fd_redirects += 1
+        sys.stdout = _NULL
+        sys.stderr = _NULL  # Redirect stderr as well
 
     def __exit__(self, exc_type, exc_value, traceback):
+        global _fd_redirects
         sys.stdout = self.original_stdout
         sys.stderr = self.original_stderr
-        self.null.close()
+        if self.fds:
+            _fd_redirects -= 1
+        if self.original_fds is not None:
+            for fd, original_fd in enumerate(self.original_fds, start=1):
+                os.dup2(original_fd, fd)
+                os.close(original_fd)
+
 
+# deletes every character `str.split()` splits on (there are none past U+3000)
+_WHITESPACE_DELETE = dict.fromkeys((i for i in range(0x3001) if chr(i).isspace()), None)
+
+# a comment runs from its `#` to the end of the line
+_COMMENT = re.compile(r"#[^\n]*")
+
+def _as_lines(code):
+    # `code` can be a whole source string or an iterable of lines; a string is measured in one go
+    return (code,) if isinstance(code, str) else code
 
 def get_length_no_whitespace(code):
-    return sum([
-        len("".join(line.split())) for line in code
-    ])
+    return sum(len(line.translate(_WHITESPACE_DELETE)) for line in _as_lines(code))
 
 def get_length_no_whitespace_no_comments(code):
-    length = 0
-    for line in code:
-        if "#" in line:
-            length += get_length_no_whitespace(line.split("#")[0])
-        else:
-            length += get_length_no_whitespace(line)
-    return length
+    return sum(len(_COMMENT.sub("", line).translate(_WHITESPACE_DELETE)) for line in _as_lines(code))
+
+
+@lru_cache(maxsize=256)
+def _origin_of(expected_type):
+    # generic types (like `list[bool]`) are checked against their origin type, others against themselves
+    return get_origin(expected_type) or expected_type
 
 
 def check_type(obj, expected_type):
-    origin = get_origin(expected_type)
-    if origin is None:
-        # Not a generic type
-        return isinstance(obj, expected_type)
-    else:
-        # Check against the origin type
-        return isinstance(obj, origin)
\ No newline at end of file
+    return isinstance(obj, _origin_of(expected_type))
\ No newline at end of file
@@ -7,23 +7,53 @@ from ipd_local.get_inputs import get_spreadsheet_data, get_and_load_functions
 from ipd_local.output_locations import *
 from ipd_local.output import *
 from ipd_local.default_strategies import all_default_functions
-from ipd_local.descriptor import describe_strategy
+from ipd_local.descriptor import describe_strategies
 
 from tqdm import tqdm
 import json
 from loguru import logger
 import sys
+import os
 import time
 import random
 import numpy as np
 
+# orjson is optional; it encodes several times faster than json and straight to bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DESCRIPTIONS_FLUSH_EVERY = 25
+JSON_BUFFER_SIZE = 1 << 20  # json.dump writes many small chunks, so they are collected into 1 MiB writes
+
+
+def write_json(path: str, data) -> None:
+    """Writes `data` to `path` as compact JSON, with orjson if it is installed."""
+    if orjson is not None:
+        with open(path, "wb") as output_file:
+            output_file.write(orjson.dumps(data))
+    else:
+        # streamed to the file rather than built as one string first
+        with open(path, "w", buffering=JSON_BUFFER_SIZE) as output_file:
+            json.dump(data, output_file, separators=(",", ":"))
+
+
+def write_json_atomically(path: str, data) -> None:
+    """Writes `data` to a temporary file and then moves it over `path`, so `path` is never left half-written."""
+    temp_path = path + ".tmp"
+    write_json(temp_path, data)
+    os.replace(temp_path, path)
+
+
 if RANDOM_SEED:
     random.seed(RANDOM_SEED)
     np.random.seed(RANDOM_SEED)
 
 if __name__ == "__main__":
     logger.remove()
-    logger.add(PROBLEMS_LOG_LOCATION)
+    # records are written by a background thread (and workers send theirs to it), into a 64 KiB buffer
+    logger.add(PROBLEMS_LOG_LOCATION, enqueue=True, buffering=1 << 16)
     logger.info("Starting!")
 
     data = get_spreadsheet_data(INPUT_SHEET_NAME, TAB_NAME)
@@ -31,27 +61,26 @@ if __name__ == "__main__":
 
     if INCLUDE_DEFAULTS:
         print(f"Added {len(all_default_functions)} default strategies.")
-        all_strategies = imported_strategies + all_default_functions
+        all_strategies = list(imported_strategies.values()) + all_default_functions
     else:
-        all_strategies = imported_strategies
+        all_strategies = list(imported_strategies.values())
 
     raw_data = run_simulation(
         all_strategies,
         noise=NOISE,
         noise_level=NOISE_LEVEL,
-        rounds=ROUNDS,
+        rounds=get_rounds(),
         num_noise_games_to_avg=NUM_NOISE_GAMES_TO_AVG,
         random_seed=RANDOM_SEED
     )
 
-    with open(RAW_OUT_LOCATION, "w") as output_file:
-        output_file.write(json.dumps(raw_data))
+    write_json(RAW_OUT_LOCATION, raw_data)
 
     specs = {
         "Noise": NOISE,
         "Noise Level (if applicable)": NOISE_LEVEL,
         "Noise Games Played Before Averaging (if applicable)": NUM_NOISE_GAMES_TO_AVG,
-        "Number of Rounds": ROUNDS,
+        "Number of Rounds": get_rounds(),
         "Points when both rat": POINTS_BOTH_RAT,
         "Points for winner when different": POINTS_DIFFERENT_WINNER,
         "Points for loser when different": POINTS_DIFFERENT_LOSER,
@@ -59,18 +88,30 @@ if __name__ == "__main__":
         "Random Seed": RANDOM_SEED,
     }
     with open("./latest_specs.json", "w") as output_file:
-        output_file.write(json.dumps(specs))
+        json.dump(specs, output_file)
 
     if DESCRIBE_STRATEGIES:
         print(f"describing {len(all_strategies)} strategies...")
 
         strategy_to_description = {}
-        for strategy in tqdm(imported_strategies):
-            name = strategy.__name__
-            description = describe_strategy(NOISE, strategy_code_pairs[name])
+        strategy_codes = {name: strategy_code_pairs[name] for name in imported_strategies}
+        for i, (name, description) in enumerate(
+            tqdm(
+                describe_strategies(NOISE, strategy_codes),
+                total=len(strategy_codes),
+                mininterval=2.0,
+                miniters=max(1, len(strategy_codes) // 50),
+                disable=not sys.stderr.isatty(),  # keeps progress bars out of redirected logs
+            ),
+            start=1,
+        ):
             strategy_to_description[name] = description
 
-            with open(STRATEGY_DESCRIPTIONS_LOCATION, "w") as output_file:
-                output_file.write(json.dumps(strategy_to_description))
+            # saved every so often rather than after every description, so a crash loses at most a few
+            if i % DESCRIPTIONS_FLUSH_EVERY == 0:
+                write_json_atomically(STRATEGY_DESCRIPTIONS_LOCATION, strategy_to_description)
+        # the descriptions finish in any order, so they are put back in the order of the strategies before the last save
+        strategy_to_description = {name: strategy_to_description[name] for name in strategy_codes}
+        write_json_atomically(STRATEGY_DESCRIPTIONS_LOCATION, strategy_to_description)
 
     update_sheet()
@@ -0,0 +1,26 @@
+"""
+Helper for the consistency check scripts: loads a Python file (like the notebook's exported code) as a module.
+"""
+
+import sys
+import os
+import importlib.util
+
+# modules loaded so far, by the real path of their file
+_loaded_modules = {}
+
+def load_python_file_as_module(filepath, module_name):
+    """
+    Load a Python file as a module registered as `module_name`.
+    Each file is only executed once, so loading it again (under any name) registers and returns the same module.
+    """
+    path = os.path.realpath(filepath)
+    module = _loaded_modules.get(path)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        _loaded_modules[path] = module
+    sys.modules[module_name] = module
+    return module
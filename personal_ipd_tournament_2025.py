@@ -366,17 +366,18 @@ def suspicious_tit_for_tat(my_moves, other_moves, current_round):
 
 # below are two strong performing functions from previous years
 
-_harrison_encoded = '4wMAAAAAAAAAAAAAAAgAAAADAAAA8/4AAACXAGQBhAB9A2QChAB9BGcAZAOiAX0FfAJ0AQAAAAAAAAAAfAWrAQAAAAAAAGtcAAByXAIAfAR8AWQAdAEAAAAAAAAAAHwFqwEAAAAAAAAaAHwFqwIAAAAAAABkBGsaAAByRAIAfAR8AXQBAAAAAAAAAAB8BasBAAAAAAAAZAAaAGQFZwF8AnQBAAAAAAAAAAB8BasBAAAAAAAAegoAAHoFAACrAgAAAAAAAHQDAAAAAAAAAAB8AnQBAAAAAAAAAAB8BasBAAAAAAAAegoAAGQGegsAAKsBAAAAAAAAZAR6AAAAaxoAAHIBeQcCAHwDfAB8AXwCqwMAAAAAAABTACkITmMDAAAAAAAAAAAAAAAJAAAAEwAAAPPeAQAAhwCHAYcChwqHC4cMhw2HDocPhxCHEZcAZAGEAH0DZAKEAIoNZAOEAIoKiApmAWQEhAiKDIgPZgFkBYQIiguICogLiAyIDYgOiA9mBmQGhAh9BIgKiAuIDGYDZAeECIoRZAhkAGwAfQVkCYoOZAp9BmQKfQdnAGQLogGKD4kCZAxrAgAAcgsCAHwDiQCJAYkCiQ6rBAAAAAAAAFMAfAZybnQDAAAAAAAAAABkDIkCZA16AAAAqwIAAAAAAABEAF1bAACKEAIAfASJAGQAiRAaAIkBZACJEBoAiRCrAwAAAAAAAFwCAAB9CH0JfAlzAYwZfAdzAYwcdAUAAAAAAAAAAIgCiACIAYgQiBFmBWQOhAh0AwAAAAAAAAAAZA2JAokQegoAAKsCAAAAAAAARACrAAAAAAAAAKsBAAAAAAAAcwGMQnwFagEAAAAAAAAAAAAAAAAAAAAAAACrAAAAAAAAAHwIawIAAHIEZApjAgEAUwBkD2MCAQBTAAQAbiYCAHwEiQCJAYkCqwMAAAAAAABcAgAAfQh9CXwJchd8BWoBAAAAAAAAAAAAAAAAAAAAAAAAqwAAAAAAAAB8CGsCAAByAmQKUwBkD1MAAgB8A4kAiQGJAokOqwQAAAAAAABTACkQTmMEAAAAAAAAAAAAAAAHAAAAEwAAAPMAAQAAlwB8AmQBaygAAHMFfAFkAhkAAABzAXkDfABkAGQCGgBqAQAAAAAAAAAAAAAAAAAAAAAAAGQDqwEAAAAAAAB9BGQBfQV0AwAAAAAAAAAAdAUAAAAAAAAAAHwAqwEAAAAAAABkBHoKAACrAQAAAAAAAEQAXRYAAH0GfAB8BhkAAAByAYwJfAF8BmQEegAAABkAAABzAYwSfAVkBHoNAAB9BYwYBAB8BXwDfAR6BQAAegoAAHQHAAAAAAAAAABkBHwDZAR8A3oKAAB6BQAAfAR6BQAAZAV6CAAAqwIAAAAAAAB6CwAAfQd8BGQGa1wAAHgBcgUBAHwHZAdrAgAADABTACkITukAAAAA6f////9G6QEAAADnAAAAAAAA4D/pBQAAAOkCAAAAKQTaBWNvdW502gVyYW5nZdoDbGVu2gNtYXgpCNoIbXlfbW92ZXPaC290aGVyX21vdmVz2g1jdXJyZW50X3JvdW5k2gVub2lzZdoHY19jb3VudNoVb3Bwb25lbnRfYmV0cmF5X2NvdW502gFp2gF6cwgAAAAgICAgICAgIPogL3RtcC9pcHl0aG9uLWlucHV0LTEwNjA5NjAwODYucHnaDWxvbmdfdGVybV90ZnR6TkhhcnJpc29uUWlhbl9ub2lzZV9tYXN0ZXJfd3JhcHBlci48bG9jYWxzPi5jb29wZXJhdGVJU08uPGxvY2Fscz4ubG9uZ190ZXJtX3RmdAMAAABztAAAAIAA2A8coAHSDyGoG7BSqh/YFxzwCAAXH5hzoAKQbdcWKdEWKagl0xYwiEfwBgAlJtAMIdwVGpwzmHibPagx0Rss1hUtkAHYFx+gAZN7oHuwMbBxsTXTJznYFCmoUdEULtEUKfAFABYu8AgAEieoFbAXqR/RETi8Q9gQEZBFmFGgFZlZ0RQnqCfRFDGwddETPfMDAj0O8QACEQ6IQfAIABkgoDGZDNIYLqgRqFGpFdATL9AML/MAAAAAYwQAAAAAAAAAAAAAAAkAAAATAAAA87ICAACHA4cRhxKHE4cUhxWHFocXlwBkAWQAbACKFWQBZAJsAW0CfQQBAGQDihJnAGQEogF9BWcAZASiAX0GdAcAAAAAAAAAAHQJAAAAAAAAAAB8AHwBqwIAAAAAAACrAQAAAAAAAEQAXUMAAFwCAAB9B1wCAAB9CH0JfAd8AmQFegoAAGs3AABzAYwSZAZ8CHoFAAB8CXoAAAB9CnwGfAp4AngCGQAAAGQFeg0AAGMDYwI8AAAAfAV8CngCeAIZAAAAdAsAAAAAAAAAAHwBfAdkBXoAAAAZAAAADACrAQAAAAAAAHoNAABjA2MCPAAAAIxFBACJFWoNAAAAAAAAAAAAAAAAAAAAAAAAdAkAAAAAAAAAAHwFfAarAgAAAAAAAEQAjwuPDGMDZwBjAl0RAABcAgAAfQt9DHwMZAFrKAAAcgJkB24EfAt8DHoLAACRAowTBABjA30MfQurAQAAAAAAAIoXiRVqDQAAAAAAAAAAAAAAAAAAAAAAAGcAZAiiAasBAAAAAAAAihaJFWoPAAAAAAAAAAAAAAAAAAAAAAAAZAmJFWoQAAAAAAAAAAAAAAAAAAAAAAAArAqrAgAAAAAAAIoRZAZ8AGQLGQAAAHoFAAB8AWQLGQAAAHoAAAB9DWQMiRF8DTwAAACIFYgXZgJkDYQIihSIEYgSiBSIA4gViBZmBmQOhAiKE4kVag0AAAAAAAAAAAAAAAAAAAAAAABnAGQPogGrAQAAAAAAAH0OAgB8BIgTZgFkEIQIfA5kEWcBZAl6BQAAZBKsE6sEAAAAAAAAfQ98D2oSAAAAAAAAAAAAAAAAAAAAAAAAZAZ8AGQLGQAAAHoFAAB8AWQLGQAAAHoAAAAZAAAAfRB8EHwPahQAAAAAAAAAAAAAAAAAAAAAAAALAGYCUwBjAgEAYwN9DH0LdwApFE5yBAAAACkB2ghtaW5pbWl6ZeeuR+F6FK7vPykEcgQAAAByBAAAAHIEAAAAcgQAAAByBgAAAHIJAAAAcgcAAAApBOcAAAAAAAAUQOcAAAAAAAAAAOcAAAAAAAAiQOcAAAAAAADwP+kEAAAAKQHaBWR0eXBlcgUAAAByHwAAAGMBAAAAAAAAAAAAAAAKAAAAEwAAAPPeAAAAlQKXAIkCagEAAAAAAAAAAAAAAAAAAAAAAACJAmoDAAAAAAAAAAAAAAAAAAAAAAAAfACJA6sCAAAAAAAAiQJqAwAAAAAAAAAAAAAAAAAAAAAAAHwAZAGJA3oKAACrAgAAAAAAAIkCagMAAAAAAAAAAAAAAAAAAAAAAABkAXwAegoAAIkDqwIAAAAAAACJAmoDAAAAAAAAAAAAAAAAAAAAAAAAZAF8AHoKAABkAYkDegoAAKsCAAAAAAAAZwSrAQAAAAAAAGoEAAAAAAAAAAAAAAAAAAAAAAAAfQF8AVMAKQJOcgYAAAApA9oHYXNhcnJhedoIbXVsdGlwbHnaAVQpBNoXcHJvYmFiaWxpdHlfdmVjdG9yX3NlbGbaEXRyYW5zaXRpb25fbWF0cml42gJucNobcHJvYmFiaWxpdHlfdmVjdG9yX29wcG9uZW50cwQAAAAgIICAchYAAADaFWdldF90cmFuc2l0aW9uX21hdHJpeHp2SGFycmlzb25RaWFuX25vaXNlX21hc3Rlcl93cmFwcGVyLjxsb2NhbHM+LmNvb3BlcmF0ZUlTTy48bG9jYWxzPi5pbmZpbml0ZV9zdW1fb3B0aW1pemVyLjxsb2NhbHM+LmdldF90cmFuc2l0aW9uX21hdHJpeEAAAABziAAAAPiAANgkJqdKoUrgGBqfC5kL0CQ70D1Y0xhZ2BganwuZC9gcM7BR0DlU0TVU8wMCGRrwBgAZG58LmQvYHB3QIDfRHDfQOVTzAwIZGvAGABkbnwuZC9gcHdAgN9EcN7gR0D1Y0TlY8wMCGRrwEQsVFvMDDSUS9xoAExSRIfAbABEi8BwAGCnQEChyGAAAAGMBAAAAAAAAAAAAAAAGAAAAEwAAAPPwAAAAlQaXAGQBiQV6CgAAfAB6BQAAiQVkAXwAegoAAHoFAAB6AAAAfQACAIkEfACrAQAAAAAAAH0BfAFkAokGagEAAAAAAAAAAAAAAAAAAAAAAABkA6sBAAAAAAAAegUAAHoNAAB9AWQBiQN6CgAAiQJqAgAAAAAAAAAAAAAAAAAAAAAAAHoFAACJBmoEAAAAAAAAAAAAAAAAAAAAAAAAagcAAAAAAAAAAAAAAAAAAAAAAACJBmoBAAAAAAAAAAAAAAAAAAAAAAAAZAOrAQAAAAAAAIkDfAF6BQAAegoAAKsBAAAAAAAAegQAAIkHegQAAFMAKQROcgYAAADnOoww4o55RT5yIAAAACkE2gNleWVyJQAAANoGbGluYWxn2gNpbnYpCHImAAAAcicAAADaFGN1cnJlbnRfc3RhdGVfdmVjdG9y2g9kaXNjb3VudF9mYWN0b3JyKgAAAHIRAAAAcigAAADaDXBheW9mZl92ZWN0b3JzCAAAACAggICAgICAchYAAADaD2V4cGVjdGVkX3BheW9mZnpwSGFycmlzb25RaWFuX25vaXNlX21hc3Rlcl93cmFwcGVyLjxsb2NhbHM+LmNvb3BlcmF0ZUlTTy48bG9jYWxzPi5pbmZpbml0ZV9zdW1fb3B0aW1pemVyLjxsb2NhbHM+LmV4cGVjdGVkX3BheW9mZlEAAABzoAAAAPiAANgrLKh1qTnQOE/RKk/QUlfYFBXQGC/RFC/xAwJTARLxAAIrEtAQJ/EIACU60DpR0yRS0BAh4BAhoFSoQq9GqUawMatJ0SU10RA10BAh8AYAFheYH9EVKNgWKtcWLNEWLPEDARUt4BYYl2mRaZdtkW2gQqdGoUaoMaNJsA/QQlPRMFPRJFPTFlTxBQIVVQHwBgAXJPEHAxUk8AMFERJyGAAAACkEcgcAAAByBwAAAHIHAAAAcgcAAABjAQAAAAAAAAAAAAAAAwAAABMAAADzFgAAAJUBlwACAIkBfACrAQAAAAAAAAsAUwCpAU6pACkC2gF4cjMAAABzAgAAACCAchYAAADaCDxsYW1iZGE+emlIYXJyaXNvblFpYW5fbm9pc2VfbWFzdGVyX3dyYXBwZXIuPGxvY2Fscz4uY29vcGVyYXRlSVNPLjxsb2NhbHM+LmluZmluaXRlX3N1bV9vcHRpbWl6ZXIuPGxvY2Fscz4uPGxhbWJkYT5kAAAAcw0AAAD4gACZP6gx0xst0RotchgAAAApAnIEAAAAcgYAAAD6CEwtQkZHUy1CKQLaBmJvdW5kc9oGbWV0aG9kKQvaBW51bXB52g5zY2lweS5vcHRpbWl6ZXIaAAAA2gllbnVtZXJhdGXaA3ppcNoDaW502gVhcnJhedoFemVyb3PaB2Zsb2F0MzJyNwAAANoDZnVuKRhyDgAAAHIPAAAAchAAAAByEQAAAHIaAAAA2htvcHBvbmVudF9jb29wZXJhdGlvbl9jb3VudHPaEnRvdGFsX3N0YXRlX2NvdW50c3IUAAAA2gdteV9tb3Zl2gpvdGhlcl9tb3Zl2gtzdGF0ZV9pbmRleHIKAAAA2gV0b3RhbNoTY3VycmVudF9zdGF0ZV9pbmRleNogc3RhcnRpbmdfcHJvYmFiaWxpdHlfdmVjdG9yX3NlbGbaE29wdGltaXphdGlvbl9yZXN1bHTaFWNvb3BlcmF0ZV9wcm9iYWJpbGl0eXIwAAAAcjEAAAByMwAAAHIqAAAAcigAAAByMgAAAHIpAAAAcxgAAAAgICBgICAgICAgICAgICAgIEBAQEBAQEByFgAAANoWaW5maW5pdGVfc3VtX29wdGltaXplcnpXSGFycmlzb25RaWFuX25vaXNlX21hc3Rlcl93cmFwcGVyLjxsb2NhbHM+LmNvb3BlcmF0ZUlTTy48bG9jYWxzPi5pbmZpbml0ZV9zdW1fb3B0aW1pemVyFwAAAHOnAQAA/4AA2wwe3Qwv4B4iiE/yFAArN9AMJ9ohLdAMHuQsNbRjuCjAS9M2UNYsUdEQKJAB0RMokEeYWtgTFJgNqAHRGCnTEynYIiOgZ6ErsArRIjqQS+AUJqB70xQzsHHRFDjTFDPYFC+wC9MUPMQDyAvQVFXQWFnRVFnRSFrQRFrTQFvRFFvUFDzwCwAtUgHwDgArLa8oqSj0BgApLNAsR9BJW9QoXPQFAxES4ShcmQyYBZh18AMAHiOgYZpakUWoVbBVqV3RFDrYKFzyBQMREvMDBSsO0Awn8BQAHR+fSJlI0iU50xw6iE3wBgAkJqc4oTioQbBSt1qxWqA40yNA0Awg2CIjoGiocqFs0SIysFvAErFf0SJE0Awf2Dg70Awg0CE00Qw19QQPDSn3Ig4NEvEADg0S8CAAMDKveKl40jhU0y9V0Aws4SIq2xAt2BAw2BgekHigIZF82Bch9AkFIw7QDB/wDgAlONckOdEkOdgQEZBImFKRTNEQIKA7qHKhP9EQMvEDAiUO0Awh8AwAFCnQKz7XK0LRK0LQKkLQE0LQDEL580ECAxEScwYAAADCEhZFEwpjAQAAAAAAAAAAAAAABAAAABMAAADzMAAAAJcAdAEAAAAAAAAAAHwAqwEAAAAAAAB0AwAAAAAAAAAAfACrAQAAAAAAAHoLAABTAHI1AAAAKQLaA3N1bXIMAAAAKQHaBnZhbHVlc3MBAAAAIHIWAAAA2gNhdmd6REhhcnJpc29uUWlhbl9ub2lzZV9tYXN0ZXJfd3JhcHBlci48bG9jYWxzPi5jb29wZXJhdGVJU08uPGxvY2Fscz4uYXZncgAAAHMVAAAAgADcExaQdpM7pBOgVqMb0RMs0AwschgAAABjAQAAAAAAAAAAAAAACQAAABMAAADzmgAAAJUBlwB0AQAAAAAAAAAAfACrAQAAAAAAAGQBaygAAHIBeQJ0AwAAAAAAAAAAfABEAI8BYwJnAGMCXRAAAH0BfAECAIkCfACrAQAAAAAAAHoKAABkA3oIAACRAowSBABjAn0BqwEAAAAAAAB0AQAAAAAAAAAAfACrAQAAAAAAAGQBegoAAHoLAABkBHoIAABTAGMCAQBjAn0BdwApBU5yBgAAAHIEAAAAcgkAAAByBwAAACkCcgwAAAByUQAAACkDclIAAADaBXZhbHVlclMAAABzAwAAACAggHIWAAAA2hZnZXRfc3RhbmRhcmRfZGV2aWF0aW9ueldIYXJyaXNvblFpYW5fbm9pc2VfbWFzdGVyX3dyYXBwZXIuPGxvY2Fscz4uY29vcGVyYXRlSVNPLjxsb2NhbHM+LmdldF9zdGFuZGFyZF9kZXZpYXRpb251AAAAc1UAAAD4gADcDxKQNot7mGHSDx/YFxjkEBO5VtMURLlWsEWQZZljoCaba9EWKahh0xUvuFbRFETTEEXME8hWyxvQV1jJH9EQWdgSF/EFAhQZ8AACDRn52hREcwUAAACaFUEICGMCAAAAAAAAAAAAAAAHAAAAEwAAAPNgAAAAlQGXAHQBAAAAAAAAAAB8AHwBqwIAAAAAAABEAI8CjwNjA2cAYwJdEAAAXAIAAH0CfQOJBHwCZAF6BQAAfAN6AAAAGQAAAJECjBIEAGMDfQN9AlMAYwIBAGMDfQN9AncAKQJOcgkAAAApAXI/AAAAKQVyDgAAAHIPAAAAckcAAABySAAAANoNcGF5b2ZmX3ZhbHVlc3MFAAAAICAgIIByFgAAANoLZ2V0X3BheW9mZnN6TEhhcnJpc29uUWlhbl9ub2lzZV9tYXN0ZXJfd3JhcHBlci48bG9jYWxzPi5jb29wZXJhdGVJU08uPGxvY2Fscz4uZ2V0X3BheW9mZnN8AAAAc0QAAAD4gAD0BgAsL6h4uBvUK0X0BQMUDuErRdEUJ5BHmFrwAwARHphnqAGZa6hK0R420xA32CtF8gUDFA7wAAMNDvnzAAMUDnMEAAAAkRUqBmMDAAAAAAAAAAAAAAAGAAAAEwAAAPOkAAAAlQaXAAIAiQl8AHwBqwIAAAAAAAB9AwIAiQh8A6sBAAAAAAAAfQQCAIkKfAOrAQAAAAAAAH0FAgCJC3wAfAF8AokMqwQAAAAAAABcAgAAfQZ9B3wGfAd8BHoKAABkAXwFegUAAHwCZAJ6CAAAegsAAGtEAAB4AXIUAQB8B3wEegoAAGQDiQ1kBBkAAACJDWQFGQAAAHoKAAB6BQAAa0QAAGYCUwApBk5yCQAAAHIHAAAA55qZmZmZmak/cgQAAADpAwAAAHI2AAAAKQ5yDgAAAHIPAAAAchAAAADaD2N1cnJlbnRfcGF5b2Zmc9oWY3VycmVudF9hdmVyYWdlX3BheW9mZtoSc3RhbmRhcmRfZGV2aWF0aW9uck4AAADaGmV4cGVjdGVkX2Rpc2NvdW50ZWRfcGF5b2ZmclMAAAByWQAAAHJWAAAAck8AAAByEQAAAHJYAAAAcw4AAAAgICAgICAgIICAgICAgHIWAAAA2g5nZXRfSVNPX3Jlc3VsdHpPSGFycmlzb25RaWFuX25vaXNlX21hc3Rlcl93cmFwcGVyLjxsb2NhbHM+LmNvb3BlcmF0ZUlTTy48bG9jYWxzPi5nZXRfSVNPX3Jlc3VsdIIAAABznQAAAPiAAOEeKagosEvTHkCIT/EGACYpqB/TJTnQDCLhITe4D9MhSNAMHuFAVtgQGJgroH2wZfMDAkEBDtEMPdAMIdAjPfAIABEm2BAq0C1D0RBD2BIT0BYo0RIoqE24ddErRdESRfEDARFGAfIAAxE/4BQu0DFH0RRH2BIWmC2oAdEaKqhduDHRLT3RGj3REj7xAwEVP/AJBhQO8AAGDQ5yGAAAAGMEAAAAAAAAAAAAAAAGAAAAEwAAAPPAAAAAlQOXAHwDfQR8AnwDegoAAH0FAgCJC3wAZAB8AxoAfAFkAHwDGgCrAgAAAAAAAH0GAgCJC3wAfANkABoAfAF8A2QAGgCrAgAAAAAAAH0HAgCJDHwGqwEAAAAAAAB9CAIAiQx8B6sBAAAAAAAAfQkCAIkKfAarAQAAAAAAAAIAiQp8B6sBAAAAAAAAegoAAHwIZAF6CAAAfAR6CwAAfAlkAXoIAAB8BXoLAAB6AAAAZAJ6CAAAegsAAGQBa0QAAFMAKQNOcgkAAAByBwAAAHI2AAAAKQ1yDgAAAHIPAAAAchAAAADaD3N0YXJ0X0lTT19yb3VuZNoQY29vcGVyYXRlX3JvdW5kc9oKSVNPX3JvdW5kc9oRY29vcGVyYXRlX3BheW9mZnPaC0lTT19wYXlvZmZz2hxjb29wZXJhdGVfc3RhbmRhcmRfZGV2aWF0aW9u2hZJU09fc3RhbmRhcmRfZGV2aWF0aW9uclMAAAByWQAAAHJWAAAAcw0AAAAgICAgICAgICAggICAchYAAADaEnNob3VsZF9zd2l0Y2hfYmFja3pTSGFycmlzb25RaWFuX25vaXNlX21hc3Rlcl93cmFwcGVyLjxsb2NhbHM+LmNvb3BlcmF0ZUlTTy48bG9jYWxzPi5zaG91bGRfc3dpdGNoX2JhY2uWAAAAc74AAAD4gADgHy7QDBzYGSaoH9EZOIhK4SAr2BAY0BkpmC/QECqoS9A4SLgf0CxJ8wMCIQ7QDB3xBgAbJtgQGJgf0Bkp0BAqqEu4D9A4SNAsSfMDAhsOiEvxCAAsQgHQQlPTK1TQDCjZJTu4S9MlSNAMIuEUF9AYKdMUKqlTsBvTLT3RFD3YECyoYdEQL9AyQtEQQtgSKKgh0RIrqGrREjjxAwEROeASF/EHA0IBGfEAAxQZ8AYAHB3xBwMUHfAAAw0dchgAAAByBAAAAOeamZmZmZm5P0YpBHIIAAAAcgQAAADpCQAAAHIGAAAA6QoAAAByBgAAAGMBAAAAAAAAAAAAAAAIAAAAMwAAAPNUAAAAlQVLAAEAlwB8AF0fAAB9AQIAiQaJA2QAiQV8AXoAAAAaAIkEZACJBXwBegAAABoAiQJ8AXoAAACJBasEAAAAAAAADACWAZcBAQCMIQQAeQCtA3cBcjUAAAByNgAAACkH2gIuMHIUAAAAchAAAAByDgAAAHIPAAAA2gVyb3VuZHJqAAAAcwcAAAAgIICAgICAchYAAADaCTxnZW5leHByPnpKSGFycmlzb25RaWFuX25vaXNlX21hc3Rlcl93cmFwcGVyLjxsb2NhbHM+LmNvb3BlcmF0ZUlTTy48bG9jYWxzPi48Z2VuZXhwcj7BAAAAc1AAAAD46AD4gADwAAgcFvEOACJBAZhB8Q0AHS/YHCSgW6B1qHGhedAcMdgcJ6gLqCWwIakp0Bw02BwpqEHRHC3YHCHzCQUdGvQABRka8QwAIkEB+XMEAAAAgyUoAVQpA9oGcmFuZG9tcgsAAADaA2FsbCkScg4AAAByDwAAAHIQAAAAchcAAAByYQAAAHJyAAAA2g5jaGVja19wcmV2aW91c9oRY2hlY2tfc3dpdGNoX2JhY2tyTgAAANoUc2hvdWxkX3N3aXRjaF90b19JU09yUwAAAHJZAAAAclYAAAByTwAAAHIRAAAAclgAAABycAAAAHJqAAAAcxIAAABgYGAgICAgICAgQEBAQEBAQEByFgAAANoMY29vcGVyYXRlSVNPejdIYXJyaXNvblFpYW5fbm9pc2VfbWFzdGVyX3dyYXBwZXIuPGxvY2Fscz4uY29vcGVyYXRlSVNPAgAAAHMyAQAA//qAAPICEgkw8ihZAQlDAfJ2AgEJLfQGBQkZ9A4ECQ73DBIJDvEAEgkO9igSCR3zKAAJFuAQE4gF4BkeiA7gHCHQCBniGCSIDeALGJgy0gsd2RMgoBioO7gNwHXTE03QDE3hCxnkGR6YcqA9sDHRIzTWGTWQBeE+TNgUHJhWmGXQFCSga7AmsDXQJjm4NfMDAj8S0RA70BAl0Cc78ggAFCjaFCXcGBv3AAgcFvQOACInoHGoLbgl0So/1CFA8w8IHBb1AAgZFvAUACUrp02hTaNP0DZL0iRLmDXSFFXQUVXSFFXxJQAaNvEoADtJAdgQGJgroH3zAwI7DtEMN9AMIdAjN/EGABAk2CAmpw2hDaMP0DJH0iBHkHXQEFHIVNAQUdkPHJhYoHuwTcA10w9J0AhJchgAAABjAgAAAAAAAAAAAAAABwAAABMAAADzbAAAAJcAdAEAAAAAAAAAAHwAqwEAAAAAAAB0AQAAAAAAAAAAfAGrAQAAAAAAAGsoAABzAkoAggF0AwAAAAAAAAAAZAGEAHQFAAAAAAAAAAB8AHwBqwIAAAAAAABEAKsAAAAAAAAAqwEAAAAAAABTACkCTmMBAAAAAAAAAAAAAAADAAAAMwAAAPMsAAAASwABAJcAfABdDAAAXAIAAH0BfQJ8AXwCazcAAJYBlwEBAIwOBAB5AK0DdwFyNQAAAHI2AAAAKQNybwAAANoFaXRlbTHaBWl0ZW0ycwMAAAAgICByFgAAAHJxAAAAektIYXJyaXNvblFpYW5fbm9pc2VfbWFzdGVyX3dyYXBwZXIuPGxvY2Fscz4ubnVtX2RpZmZlcmVudC48bG9jYWxzPi48Z2VuZXhwcj7WAAAAcxsAAADoAPiAANASSNE2R6FsoGWoVZA1mEWVPtE2R/lzBAAAAIISFAEpA3IMAAAAclEAAAByPwAAACkC2gVsaXN0MdoFbGlzdDJzAgAAACAgchYAAADaDW51bV9kaWZmZXJlbnR6OEhhcnJpc29uUWlhbl9ub2lzZV9tYXN0ZXJfd3JhcHBlci48bG9jYWxzPi5udW1fZGlmZmVyZW501AAAAHMwAAAAgADcDxKQNYt6nFOgFZta0g8n0Agn0A8n3A8S0RJItGO4JcAV1DZH0xJI0w9I0AhIchgAAAApBlRURlRURnIJAAAARnIgAAAAVCkCcgwAAAByQAAAACkGcg4AAAByDwAAAHIQAAAAcncAAAByfgAAANoPZmVlZGVyX3NlcXVlbmNlcwYAAAAgICAgICByFgAAANohSGFycmlzb25RaWFuX25vaXNlX21hc3Rlcl93cmFwcGVycoAAAAABAAAAc6YAAACAAPICUAMFSgHyZAYCBUkB8gYAFz2AT/AGAAkWnBOYX9MZLdIILdkMGZgr0CY8rAOoT9MoPNAaPbh/0wxP0FNU0gxU2QwZ2AwXnAOYT9MYLNAYLtAML9gNEohHkH2kc6g/0yc70Rc70Qw88wUDDQr0CAAMD5ANpAOgT9MgNNEQNLgB0Q850ws6uFHRCz7yCQQNP/AMABAU2QsXmAigK6h90ws90AQ9chgAAAA='
+_harrison_encoded = 'eNq1WXtQG9d634dWD/SWVgIBNmDzkAwYcIINxhibGIPt2ASDHT+SIbJWYNlCwivhAJFaT65nkHw9DZ47uZaTdK6cZBrRpDdKJzMlM52O2+kf6bR/7CJPouimHXybmdR/lYdv0+SP3n5nd/XAyDftTbIDZ/ec853X9/2+19G/k1j+UcI/qq//DxS3MQa/joVJhoBSNo4x5Nt4mAoRQTxLHqLel74vv4Bh7AsEFpKFcAYrRlGOvgnxm5FdLgf6QyJ9MWoG6BlqHC++2mwJ/FMYlp0vmDvDk+kZ+awaRmTnl82iXaNd4DMK2AcZwkKw2vvSTMOYQ3nCVcgaFfybEWv+DaaYw+bwOWKuZE49p5nTzunm9HOGOWMhw25oGRLKkkjJGM7IritvaCJ6+KLgSx0piagjmog2ooM2OSO/rgzLxLYxklEAhZFRMpgXC1OM6oaOKQnL4V8BAlC/jd/QRwlGcxkOzqrRtqNYFI8SUd37suzGQ3LWl2cIowF6LTpsllmHsBfPY9gNA2J+FBgdNZTDHNLbkGUAyBILK8OqkCqA37SFFFBWBqnsrBEigkXwiCFiHKMY3XVlwXpa2I0BMTy/3vtSX5b5MFdviLqEY5ueLGVIKZxQxpS4CBzOxOjFtwzz1Yv7RqfevFe29P80L8GUoDmHseIcdBhOuGQFoxVZ0WM40ooQweCX7XAMCrBO2IQDzQB+GIwhyrFiyzNk9uhhGQM6lGdXnqWhQmyW5JkF4rLCODngU47WYvGbKkCqXESwuPpNU4iCuhboqJtlMkA+4FmGNATNFFTk9iELkeg/qz8iDUPNKvPiQloSVoRkjBzp9DTOUjgWUjAKxDiNqBcPEd3D38Nz+CHa5dfiyOWeh+g0D9FEDlmGcvmnfMEMxTp94+4M6XX7MuSEc9qhzCgnZkYn/FfdgYzaH7zoZqWK1jXFsm5fcJSFgUyG8vk9AXdG4RoVJ7L4Jyf9PtR/wR1knTNSM+7J4LMBZLiqpee76pbgxGSLZ3ImeNHva/b4JqeCzW2tu1s7d7e2duzeOTmT0Xr9vvHRoJudGA2OBWdPDDhZ1hPw+4Y8Tt+osO7ohDMA/aMvs87JSTe7c5/X73J6A/t3uvx+qDuD7iPDg/nWDfMh6QY+huIaltZXxvElfU2iInnyL6vSpZUrSqy0KhaIE/MTn1sdvNWRqEtZWyP9K3Ksrp7T1HxpKX/rqdj0m92JNr6i6TNL8zyeLq2K4794Jf5Ksi155aP2VENnmnYkhnh6J087VijMuhMmNTUkLMnShSre2PG3z6QNxvm+2FDccucsTzckGni6LTnFm7vXSaJbt4oRRl3kIIyxVcfb7miWynYmjImhBQtnbuE0LetIlBvgn7N8fw2SnSPnjHOmOfMcPWeZs86VIpuHbNUNC7wJLz5BhGU4AP6GCeyVDDkM6S3PwzCoyoM+hGeBVwD4ZySdVuQ0WwFKRyHYXt4jAp6Rh5QChFVIDcIlIXmoZJqYFtQRKEEVXKSL2Ce4gXxPUJ1bGQdQU1kV0uRWLxx5s0+GRS2XtJsVuuAEVEiet3SvqV/TuMhxzEW8aJTOoA5rQhrRYIDdUfhkIXVIg5TsFnHTLIO1wpqwOrv6jdLi6wEPlW/jOSorUOmLmBkVtBs2t39Qkt0heBYwJIwanVngHi59Ix5qwVcYQ1p08oglUjoGfgN8ER0xRkwROkJCmxW8FVj7G+Yn7lKf32VYhyx1xAxez3BdGdIxxnGcUQkGx/SBOWttw/qQ/pKpyFmeuE/0DhtCBhhHbx6nxsaIYQx5C5GzL2MO+gSLFnPgYHg8Ps+EZ9b99a/7H8zSv/7PHodM6Hu8kKMCyZhVCMZMsnD0ga+z60gf27ItKz0PpUUoJjgDFgKZQrYK6VKhQyjJRRFQvE7cxqJEMYcBreTm1hAWJbOSfBIFg0fJQu9bnI7BQ4Jr+L75snSPzzouy0r5kmzzqDAewsFRECcEPjrIjMIZAAPrnAEBTHmDnknvTAYfARdROsn6LzgveLye4MzoVbcr6GdHA27vWMYIBt4X8AQ9fh8Y4iDrmc4QvslMRRH6rFcIyAQXcO0aC+4Sy1jG3cHRTbPMXv3Blt7jGwMQBd2jgakJWDwo4KlgVNF1DyCPEIHiv8El1Na/d/Tu0eWy8l+p76i52i6u+0yq7GxarKcrn0oOcZ0jfPsIWGtbOfgFW4XYsYWr3sNX7oHOJ/QsGmEqvvOM2G1UW6zrpLbO9E05ZqZv1axUYMZtK5VYmYMz2Nmyx5EpzyJzBSFTjux6VLC4IUEDo1QWC0JYgaQM0VNUlg9bkNQZIir/wwGQMBoFKngWU4A8YvMIYU15MXRdUhTRl+9ZNUqG8Gw4lNsJzB1VoBKwKhOx+vXem62//bOZvv1stRjEkO4ZN1uHACX3enxO73iG9PiuOpRsPVLvBtRBZ8OWQBCwIsEyo2c8ASFAGR1zogZ2BxpgRIUdjdJOOmf8Y2MSuRS/XBMeEcB69/Qk9LmZUZFydvInh+5jKw4h0MYl0DY2JaYWOrmOQX7HIHfy+TRt4cpaeLpllSSGcRPEFI0mztCwqsTq9nJ7h1K1JzlDzbKhJj6S6P3w8MLhZNv7R/i6dt7QDu2AXGtprIq32NPWHZ9bm3hr0yqJW5qXrWW3Pbc8tyduTcR73zt893Ci7Z0jST3XO8y3DvO1wynryCpFWE7hMEFp7aqCtNSukJTRJIAZLLkia7DzxQaIk1mIIwa/jt9GAMbzAFYDEBbwEwtguTL4NPsUOj5CZrUkEeU+r3PiAuPcP+v5yUWRXYpBm9CKMrjTk2hLVTTz5c3igYm8r/pO+Wxz7+H+4eZe2Lv8AoqfAxn5hBsCYMahhlB6agKiXl3ABUHxztxy5ehUKjd0ChvMkLOeSYRvCNpFc00BkT+QUYx5/c7gU7vYPWgAOTblc5SxOrQ2CkJYQw7ZwoQVuTg9e3RkBwVdCGRMQX/Q6ZVURWxjkRfPKKScIFOSTwkyapHO42Pc0yxynRlKGJ8xb9Q5gSBTDRU26IFA/EluxSwdXdwS6w6AN8pYchIqHMe2ogO1oQIBQVRfpLnsLlQ4kFzKxKTjperC54D4iJCxFpfz7PM/EYBK0bbeAzz//hr2G83Wf9W0LG/dFhlco7HGPZymIVPTzGm2ftXU/rFr0X7vWGr3c581DfEG+zzOm+3z/bFzaTMd0yZwvsyRMjvS27bHx+82Jkv4bXvnjy3T9fFXUvRTySs83QHvNN2SVKfoff9IfqrmRk5xZ87yI2f5gXPcoXOpA+d5+vx9et+KGms+ia/osMbmD+0L9kdyzNHENfVzR87ft7/wiCKNpgf2F+5oYlRsaoXEtm6PO984d6svcSp5auFFnt6btr+whojWSapRB9tfobEtVb8auDOwVNeZqtwbOQ52AJxpx92OxMHkyb8599G5eEdq+wFOU422fjHB3vXy23Ylz98zfTTKbzvEaarSHV3Qy9U8zWvafyfTax3fbNNpwXpBsVKNte76cHpheqljJNVyitM0Pdi24zeG5rShNV22dX46XnMrlC6teaSitsNequBQdR2f13bytZ0o2xqInbz1LG+ojnfBqj28YRfYxTqgq1nRYLSDa9z/eWMv39jL7ejlzL2cpvfb9YMEnCyAlPcfTNY+c8kGSyXLWqpW4R6u4E4rZ60K7rzyLk2NnBnbLliHDAnQYDViUCq/6vROuQMBRFgtYpN0Xh2fPfSDgQizsAh1FiHf/dJsnb/6i653zfHT71Tw5iZg4+ZQI5dQviHZ4WLnk1ImfIYoPCmkWLiLEBIsgxhygA0nCjiAglUS3WdAemWC9IoI5xKS4qsIIY1auHVRIu4JqQOMgsSBEoMC0czmswFCYCo7JMS27EnBLAnsZYcRI0jRlUsGAIWDYJd8jJNlRhn3VY9ge34EA1B84im0g1Oiv/hSb5rf/fNXYs4lfVW6tOwrg/mT0yn60Cenk33z7juueP2bl9H9gzNlaVk8zdOHUoa+fzF/evqfK7jnz/xTFW84mzaVgr+lbSsYobV9m6EPBVBS84bloFLpIordj71URJ75BB9kR7xGSumxQUqPiTAJQSTBCOFZiMwmeJL0yDAZzqdz8P2ykFaoBFCzPehFFXiiflQMbAivRNhT0vWQJBU1Yp5IEZh99kcRhTRbCPH/kMh/MHdNLYnpxYr7jX1g7Gjdg8Y+nm5AdhasnXFrbDyB37mcOMpv3Z0y7Ek39q0hohWM1Oq+XcfgU0hpbll2yDdcROcC9XelQB00QFXI5zAJLcpQwZ0j1EsK6hTU1eJ9d1STTcQFacjDipA8pAjJxKQvRAlSIRgC6QbSksuHhDtBGt0JSlRkVMvIkMzgTdkKbucRLUrGHfITee35+o076FnoEbTqIToYuxvJUfdYRJHRZ328xNqMNdvgvAoyGHdLHRnTZjVgT6AZynMBbTYYz8W2gqqyZ1FxGhWDuRjmDJKgruA6sTAo1yFRg+yl2GF28EfBTn7CV9Hify7C58FWR8KePJbaeiAyuCrH6h2JqlRdJ6fZ9qBmz6I+VTMArvzBgdNpQ1msMR5OuiHrO4jreE03eB1ue/eKEjPWpw07uOZneMMzaZOZs9p5kz1xfHGKBxya+iDkNh7G1zDS2LNM7+Ta+nm6P22yxprB/5fvSLy42MY3d/Pl3bxpP4rOe1ZUcoROuVYnWnRZMUzeQ5gkb4Mmh0GrxZvmLN4YaC1HVznCO4dWuYRGEv3mA5gU3rleBfRqQvIcdpVCXZGrqwRs5/qFmqLQG4SUYFuUwl23Gl0XSjUK1ZC1yWMbPM4hIRkkC/AqglO7CZxCrClKTritNuSjSFYMv0tynYGMsSDGlNCsRt3ZSmW+fzOYM1ZEWgTkGzEspAn5ODSHWVPgon/Ky4wGXvYEXRdHLzhdl2eHfzBuN0/6S7SHvxOxu1y1k9NUpm31iSre1hE5+qC6EXDK2RyxFs6wI3GM6xhYrOKajgBmayBK2gL4rqhHSK4CGoFiUQ80IkWFLnIMEsumXhwywVTjCKexf1HXtXgsVTeAtIEu5SBcpXcsDCcrUoBYujttaEo4eUMLt6uXN/SmAfQ1vKkxcYk3dSDQdy6DX1OQvbhtFaysDYLIyi1Qp7cg07tFALdgnCRT9UnPYcgtldnWh6ps0vWwJPu1IbpBlChlWB9BukAdw3D0mxH2YhWKVwCf8iggPEqF8FnhV9GobEONEL+iVNYua7Bf4rdxHLtZI8NmsL8iX8aF+E7EpSJD7GwVEigxC8uhNEMJyGMvIaEo8pcLIiRU+8bdPjCO7P7Zoz8YCbm5/h6t9RwCwH8gDKxgykrrqg7bdhCPHVzVYlta0pW18fPxqcSVuzNcZVu6siGhTtQlaxYcXOXT6UpH4iBf2ZyurFlXUVvKH2GUrXxVg0Z/K/jBn9XZ8REHmZGzoAf+CVYtxrBer8P0eC6KsiDWiQpWMNqui27XZUjuQHH8U0gZhXoBdEV3QW/EdNCP1PsPOwp2EhUCk9Ed9ksvvbQxC5TSQE0h52b3/JEsRyYxsAsld99dw9YIk6p1zX4WVz2Dr10lcFXzIzmlsj3SyVS6bzQmlW4Vg+K/7CbVlnU7prIuG8wRatm2NaJbrqzhlLbfltVGtMvqstiuJfWWL8zV8bJE16L23lTKfJzTHH+gtn1l2xpj493JNn7705/Z2uepB/ufTdOVsdMxN0fXxi8n65PtXH3nYjtoaI+JN3RxhjquoWtNidH2DF33ZVnFNwgAjwAADfEriebFOn5Hz/2aA+t6aP0dprRZIZ2ra3zv+N3j7wxyu48t1R6LtS/Rp7ihU1Cu1mHlu1ftWNcRXHJwsEwXeLc9gnfbAwbDUJuurn9Pe1f7jp7b1b9U3T8/xRmGPh2B4gt9ZexM/JXk8XvtKf0RTnlE9FhFY1bvkzOsfFsuhxB+9yWOYq/iBT9549c3/I5bGPE+/tO3cC2+6VJKMBdNUOSMhUYKyPAwgcI09KuXZAZ0RcwAyfoFnfcE3RNt4muXlIeIyR57BXnDY/8P4PmmJiBqGhtzo4iriLJ/hsBYAYWg65xpgN/df9cbdydOzbfH+l7fD1VRb1810ThsMJcyiVE7kaG8nkCwTXztEu/ZpMRUu2Ht2Y4/dtf30RZbxbQUUqH2n8++NRy3vHluSd/AKRs4fQO08qaBj12Ldfcs93f3p0wDKf0ApxwQr9fkIyOH4U8IBQ4L98Ej2dTvgND/uNl5GRV/IkQHY24340aXTlem3D6XW0jzRcMgHrHme8/EXgM6hJPAXwgnWCOeI6mj+BojJ6gj+JocK+2+NgiuS2V9yxwbTdmal5TNX2hssUauft8HZGIwZd/HlXcv/mlKM8gNjyxpRqAzrSl9i4wNpsqauDLwzy1prSnSPx9+N5DoSTV08aVdvGbfOkVqSx4pMY1+XvsuGR9MVT/NG55exHl9Z0q9d3GIV+9fU8m0PSsazEB/oS6NKeONiXBK3c3JugW+/S/g41h6'
 
-_jackson_encoded = '4wMAAAAAAAAAAAAAAAYAAAADAAAA88QBAACXAGcAZAGiAX0DfAJkAmsoAAByAXkDfAJkBGsCAAByBXwDfAIZAAAAUwBkBX0EdAEAAAAAAAAAAGQEqwEAAAAAAABEAF0TAAB9BXwBfAUZAAAAfAN8BRkAAABrKAAAcwGMD3wEZAZ6DQAAfQSMFQQAfARkB2tcAAByAXkDdAEAAAAAAAAAAHQDAAAAAAAAAAB8AasBAAAAAAAAZAh6CgAAqwEAAAAAAABEAF0RAAB9BXwBfAV8BWQIegAAABoAZwBkCaIBaygAAHMBjBEBAHkDBAB8AmQKa0QAAHI+ZAV9BnQBAAAAAAAAAABkBHQDAAAAAAAAAAB8AasBAAAAAAAAqwIAAAAAAABEAF0SAAB9B3wBfAcZAAAAcgZ8BmQGeg0AAH0GjA58BmQGehcAAH0GjBQEAHQFAAAAAAAAAAB8BqsBAAAAAAAAfAJkC3oLAABrGgAAcgF5A3wCZAx6BgAAZAVrKAAAcht0BgAAAAAAAAAAagkAAAAAAAAAAAAAAAAAAAAAAABkBmQEqwIAAAAAAABkCGtcAAByAXkDeQ18AmQMegYAAGQGaygAAHIBeQ18AmQMegYAAGQOaygAAHIBeQN5DSkPTikKRkZURkZGVEZURunHAAAAVOkKAAAA6QAAAADpAQAAAOkIAAAA6QUAAAApBVRUVFRU6Q8AAADpFAAAAOkEAAAARukCAAAAKQXaBXJhbmdl2gNsZW7aA2Fic9oGcmFuZG9t2gdyYW5kaW50KQjaB215bW92ZXPaCm90aGVybW92ZXPaDGN1cnJlbnRSb3VuZNoHcGF0dGVybtoLbmVnYXRlbm9pc2XaAWnaDXJhbmRvbUNoZWNrZXLaAWFzCAAAACAgICAgICAg+iAvdG1wL2lweXRob24taW5wdXQtMjc4NjMxNjA5NC5wedoZSmFja3NvbkxlZUFsdGVybmF0b3JOb2lzZXIaAAAA6AAAAHMvAQAAgADaDlGAR+AHE5Bz0gca2A8T4AcTkGLSBxjYDxaQfNEPJNAIJOAWF4gL3BEWkHKWGYhB2A8ZmCGJfaAHqAGhCtMPKtgQG5hx0RAgkQvwBQASG/AGAAwXmCHSCxvYExf0BgAWG5wzmHqbP6hR0Rsu1hUvkAHYEx2YYaAhoGGhJdATKNIsStMTStkbH/AFABYw8AgAEByYYtIPINggIZAN3BkemHKkM6B6oz/WGTOQQdgXIaAhkn3YGCWoEdEYKpkN4BglqBHRGCqZDfAJABo09AoAFBeQfdMTJagcuALRKTrSEzrYGx/gDxuYYdEPH6Ax0g8k3BMZlz6RPqAhoFLTEyioQdITLdgbH+AbINgRHaAB0REhoFHSESbYFxzYER2gAdERIaBR0hEm2Bcb4Bcc8wAAAAA='
+_jackson_encoded = 'eNptUsFL21AcfkmbpLbWWKONbbrZgg4r0+oqbvOglEkHMgRdj9shmqBdbdIlcdCSgkcHHuoOs2M7RLdDwX9gf8BgVxtBsuChsMt6K+hpp71XmyrbfvBevvd7v/d93/u9/HSBmyDhQOvLbxgAh2ATCNgxVnbpuIDnxgFQsCLC7hwOMaFDHILFz4FAlN0a5pAI7pMOXgIvGQDKhI7pBKqEJ9pfxKVi+7TuFsiSH1a494fcAK6o3ItrlRs2retPxxxewVPyAnBLJeCo6ATcg7kw8t5zjHWUAhgouqACLnhzS1BhATombzv+n8oJ3uUfgPwU5KeQe4XUyY5vcr+vjdk2HnQDjejykA4PVPWVfPDW4W4He0uw0wLR7imnkc6ZVz3gnxBI2E/cubfTn6K/y0J2XuYm0+e8VdEfp1fi3nQ6k0Yjk25+hyyZJmweaCLCJrLY9KAJGY8TGRRNGiUG0eSGU7qJt/dsQuGlTdF2bYuS7eLXVZuECUHO2xT6ZiUt7rGpfDEvvxFV2ytrW6JyjXs3dhRFlLQ1eUcSbKrAa5qoSLZPEjd5TZTkrCraWNb2X9M92RI3cqJiY7yKnEU78Tua0PKFRLZQ1LZkaTIrFXa0yQcPH80lZ+amH89OFYp2aJnfyKmy9EwUU9tIgtdkZQXRK7D34BccagJeeRfYfau7TxsUU1FNKmzRDILrJjVs0cGKXqdHTz2jjSC757sIBCvK+9BeyqJD1djbskHVsCPvGT1h9XPV1/X+6IGvRYABrkWCXrYaM32cxbBXJAhyn5LV0sfF2mqdmzofSlQwi7lT5Y2YwR+NnTLj5v3lM2b5BzcCTwenWx7QH6mum3TUisYq/ovQ3aryJWmUPi+eh5KVlMXGjNi7sjU8VgvUhyc++Btd1OoB4dkrLxhkK+UzZqwW+YrX4/MmM29xIw2aq/J1esSYMenRCyZ0uHCwAA2snTHjtZTJTKISLmoF7hhYPRAzVs3APYuN/LXmGmzkEv0qfwCLCwxa'
 
 
 import marshal
 import base64
+import zlib
 import types
 
 def decode_and_load(encoded_string, strategy_name):
-    decoded = base64.b64decode(encoded_string.encode('ascii'))
+    decoded = zlib.decompress(base64.b64decode(encoded_string.encode('ascii')))
     code_obj = marshal.loads(decoded)
     func = types.FunctionType(code_obj, globals(), strategy_name)
     return func
@@ -9,17 +9,10 @@ Tests:
 """
 
 import sys
-import importlib.util
 import random
 import numpy as np
 
-def load_python_file_as_module(filepath, module_name):
-    """Load a Python file as a module."""
-    spec = importlib.util.spec_from_file_location(module_name, filepath)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
+from module_loading import load_python_file_as_module
 
 def test_reproducibility():
     """Test that running with same seed produces same results."""
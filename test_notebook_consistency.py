@@ -3,17 +3,11 @@ Test script to verify consistency between the Jupyter notebook and main codebase
 """
 
 import sys
-import importlib.util
-import random
-import numpy as np
-
-def load_python_file_as_module(filepath, module_name):
-    """Load a Python file as a module."""
-    spec = importlib.util.spec_from_file_location(module_name, filepath)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
+
+from module_loading import load_python_file_as_module
+
+# everything test_simulation_logic_comparison uses from the notebook, checked before its simulation is run
+REQUIRED_NAMES = ('opposite_of_last', 'rat', 'silent', 'tit_for_tat', 'run_no_noise_tournament')
 
 def test_missing_functions():
     """Test for undefined functions referenced in the code."""
@@ -78,6 +72,13 @@ def test_simulation_logic_comparison():
 
     # Test if functions produce same results
     print("\nTesting if basic strategies work in notebook...")
+    missing = [name for name in REQUIRED_NAMES if not hasattr(notebook_module, name)]
+    if missing:
+        issue = f"✗ ISSUE: Notebook is missing {', '.join(missing)}, so its simulation can't be run"
+        print(issue)
+        issues.append(issue)
+        return issues
+
     try:
         # Test with simple strategies
         test_strats = [notebook_module.rat, notebook_module.silent, notebook_module.tit_for_tat]
@@ -106,13 +107,6 @@ def test_simulation_logic_comparison():
                 print(issue)
                 issues.append(issue)
 
-    except NameError as e:
-        if 'opposite_of_last' in str(e):
-            issue = f"✗ ISSUE: NameError due to undefined 'opposite_of_last': {e}"
-            print(issue)
-            issues.append(issue)
-        else:
-            raise
     except Exception as e:
         issue = f"✗ ISSUE: Notebook simulation failed: {e}"
         print(issue)
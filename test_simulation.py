@@ -1,11 +1,54 @@
 """Unit tests for the simulation module only"""
 
 from ipd_local.simulation import get_scores, pack_functions, unpack_functions, play_match, run_simulation
-from ipd_local.utils import suppress_output
+from ipd_local import default_strategies, simulation
+from ipd_local.history import needs_history_copies
 
 import unittest
+import os
 import marshal
 import random
+import numpy as np
+from types import FunctionType
+from functools import lru_cache
+from contextlib import ExitStack, redirect_stdout, redirect_stderr
+from unittest import mock
+
+
+@lru_cache(maxsize=512)
+def _play_match_cached(bytecode, **kwargs):
+    """
+    `play_match` for the expected side of a comparison, which is a pure function of its arguments given the seed.
+    `rounds` has to be passed as a tuple rather than a list so it can be hashed.
+    Tests of determinism itself call `play_match` directly, since a cache hit would make them pass trivially.
+    """
+    return play_match(bytecode, **kwargs)
+
+
+@lru_cache(maxsize=512)
+def _get_scores_cached(player1_moves, player2_moves, *payoffs):
+    return get_scores(list(player1_moves), list(player2_moves), *payoffs)
+
+
+def gs_expect(player1_moves, player2_moves, *payoffs):
+    """`get_scores` for expected values, which are the same few move lists over and over, so they are only scored once."""
+    return _get_scores_cached(tuple(player1_moves), tuple(player2_moves), *payoffs)
+
+
+# nothing in this module checks what the simulation prints, so `sys.stdout` and `sys.stderr` are swapped once for
+# the whole module; the descriptors are left alone, so the test runner's own output still shows
+_quiet = ExitStack()
+
+
+def setUpModule():
+    sink = _quiet.enter_context(open(os.devnull, "w"))
+    _quiet.enter_context(redirect_stdout(sink))
+    _quiet.enter_context(redirect_stderr(sink))
+
+
+def tearDownModule():
+    _quiet.close()
+
 
 # ========== Test Strategy Functions ==========
 
@@ -45,6 +88,11 @@ def grudger(my_moves, other_moves, current_round):
     return False
 
 
+def grudger_from_masks(my_moves, other_moves, current_round, my_mask, other_mask):
+    """Same as grudger, but reads the opponent's history mask (with no defaults, so it fails if the masks aren't passed)"""
+    return other_mask != 0
+
+
 def return_list_strategy(my_moves, other_moves, current_round):
     """Returns a list of bools for testing multi-round planning"""
     if current_round == 0:
@@ -70,66 +118,96 @@ def modifying_strategy(my_moves, other_moves, current_round):
     return False
 
 
+def two_tats_from_lists(my_moves, other_moves, current_round):
+    """Rats only if the opponent ratted in both of the last two rounds"""
+    return current_round >= 2 and other_moves[-1] and other_moves[-2]
+
+
+def two_tats_from_masks(my_moves, other_moves, current_round, my_mask=0, other_mask=0):
+    """Same as two_tats_from_lists, but reads the opponent's history mask"""
+    return current_round >= 2 and (other_mask >> (current_round - 2)) & 0b11 == 0b11
+
+
+def counting_strategy(my_moves, other_moves, current_round):
+    """Strategy that keeps a count of its calls on its own function object, and rats after the 50th"""
+    counting_strategy.calls = getattr(counting_strategy, "calls", 0) + 1
+    return counting_strategy.calls > 50
+
+
+def equality_rewriter(my_moves, other_moves, current_round):
+    """Strategy that rats, and tries to rewrite the opponent's history through a comparison"""
+    class Grab:
+        def __eq__(self, other):
+            other[:] = [False] * len(other)
+            return False
+
+    Grab() == other_moves
+    return True
+
+
+def rats_from_round_10(my_moves, other_moves, current_round, first_rat=10):
+    """Strategy whose behavior comes from a default argument"""
+    return current_round >= first_rat
+
+
+def rats_from_round_50(my_moves, other_moves, current_round, first_rat=50):
+    """Same code as rats_from_round_10, with a different default"""
+    return current_round >= first_rat
+
+
+def counts_in_default(my_moves, other_moves, current_round, calls=[]):
+    """Strategy that keeps a count of its calls in a mutable default, and rats after the 50th"""
+    calls.append(current_round)
+    return len(calls) > 50
+
+
+def recursive_strategy(my_moves, other_moves, current_round):
+    """Strategy that calls itself by name"""
+    if current_round == 0:
+        return False
+    return recursive_strategy(my_moves, other_moves, 0) or other_moves[-1]
+
+
 class TestGetScores(unittest.TestCase):
     """Test the get_scores function for calculating points"""
 
-    def test_both_cooperate_all_rounds(self):
-        """Test when both players always cooperate"""
-        moves1 = [False] * 10
-        moves2 = [False] * 10
-        self.assertEqual(get_scores(moves1, moves2), (50.0, 50.0))
-
-    def test_both_defect_all_rounds(self):
-        """Test when both players always defect"""
-        moves1 = [True] * 10
-        moves2 = [True] * 10
-        self.assertEqual(get_scores(moves1, moves2), (10.0, 10.0))
-
-    def test_one_exploits_other(self):
-        """Test when player1 always defects and player2 always cooperates"""
-        moves1 = [True] * 10
-        moves2 = [False] * 10
-        self.assertEqual(get_scores(moves1, moves2), (90.0, 0.0))
-
-    def test_symmetric_exploitation(self):
-        """Test when player2 always defects and player1 always cooperates"""
-        moves1 = [False] * 10
-        moves2 = [True] * 10
-        self.assertEqual(get_scores(moves1, moves2), (0.0, 90.0))
-
-    def test_alternating_moves(self):
-        """Test with alternating cooperation and defection"""
-        moves1 = [False, True, False, True]
-        moves2 = [True, False, True, False]
-        # Round 1: p1=F, p2=T -> p1 gets 0, p2 gets 9
-        # Round 2: p1=T, p2=F -> p1 gets 9, p2 gets 0
-        # Round 3: p1=F, p2=T -> p1 gets 0, p2 gets 9
-        # Round 4: p1=T, p2=F -> p1 gets 9, p2 gets 0
-        self.assertEqual(get_scores(moves1, moves2), (18.0, 18.0))
-
-    def test_empty_moves(self):
-        """Test with empty move lists"""
-        self.assertEqual(get_scores([], []), (0.0, 0.0))
-
-    def test_single_round(self):
-        """Test with a single round"""
-        self.assertEqual(get_scores([True], [True]), (1.0, 1.0))
-        self.assertEqual(get_scores([False], [False]), (5.0, 5.0))
-
-    def test_custom_payoffs(self):
-        """Test with custom payoff values"""
-        moves1 = [False, True]
-        moves2 = [False, False]
-        # Custom: both_coop=10, loser=2, winner=15, both_rat=3
-        # Round 1: both cooperate -> (10, 10)
-        # Round 2: p1 defects -> (15, 2)
-        self.assertEqual(get_scores(moves1, moves2, 10, 2, 15, 3), (25.0, 12.0))
-
-    def test_large_number_of_rounds(self):
-        """Test with many rounds for performance"""
-        moves1 = [False] * 1000
-        moves2 = [False] * 1000
-        self.assertEqual(get_scores(moves1, moves2), (5000.0, 5000.0))
+    @classmethod
+    def setUpClass(cls):
+        # the move lists shared by the tests, built once (get_scores never modifies them)
+        cls.F10 = [False] * 10
+        cls.T10 = [True] * 10
+        cls.F1000 = [False] * 1000
+        cls.ALT_F = [False, True, False, True]
+        cls.ALT_T = [True, False, True, False]
+
+    def test_all_scoring_cases(self):
+        """Test each scoring case (name, player 1's moves, player 2's moves, payoffs, expected scores)"""
+        cases = [
+            ("both cooperate all rounds", self.F10, self.F10, (), (50.0, 50.0)),
+            ("both defect all rounds", self.T10, self.T10, (), (10.0, 10.0)),
+            ("player1 exploits player2", self.T10, self.F10, (), (90.0, 0.0)),
+            ("player2 exploits player1", self.F10, self.T10, (), (0.0, 90.0)),
+            # each round one player gets 0 and the other 9, and the roles swap every round
+            ("alternating moves", self.ALT_F, self.ALT_T, (), (18.0, 18.0)),
+            ("empty moves", [], [], (), (0.0, 0.0)),
+            ("single round both defect", [True], [True], (), (1.0, 1.0)),
+            ("single round both cooperate", [False], [False], (), (5.0, 5.0)),
+            # both_coop=10, loser=2, winner=15, both_rat=3: (10, 10) then player 1 defects for (15, 2)
+            ("custom payoffs", [False, True], [False, False], (10, 2, 15, 3), (25.0, 12.0)),
+            ("large number of rounds", self.F1000, self.F1000, (), (5000.0, 5000.0)),
+        ]
+        for name, moves1, moves2, payoffs, expected in cases:
+            with self.subTest(name=name):
+                self.assertEqual(get_scores(moves1, moves2, *payoffs), expected)
+
+    def test_short_and_long_games_agree(self):
+        """Test that games on either side of the pure python cutoff are scored the same way"""
+        rng = random.Random(42)
+        moves1 = [rng.random() < 0.5 for _ in range(simulation.SMALL_GAME_ROUNDS)]
+        moves2 = [rng.random() < 0.5 for _ in range(simulation.SMALL_GAME_ROUNDS)]
+        short = get_scores(moves1[:-1], moves2[:-1], 10, 2, 15, 3)
+        last_round = get_scores(moves1[-1:], moves2[-1:], 10, 2, 15, 3)
+        self.assertEqual(get_scores(moves1, moves2, 10, 2, 15, 3), tuple(map(sum, zip(short, last_round))))
 
 
 class TestPackUnpackFunctions(unittest.TestCase):
@@ -173,32 +251,46 @@ class TestPackUnpackFunctions(unittest.TestCase):
 class TestPlayMatch(unittest.TestCase):
     """Test the play_match function for individual matches"""
 
+    @classmethod
+    def setUpClass(cls):
+        # every test plays one of these pairs, so each is packed once for the whole class
+        cls.PKG_CC = pack_functions((cheat, cooperate))
+        cls.PKG_TC = pack_functions((tit_for_tat, cooperate))
+        cls.PKG_TCH = pack_functions((tit_for_tat, cheat))
+        cls.PKG_LIST = pack_functions((return_list_strategy, cooperate))
+        cls.PKG_BROKEN = pack_functions((broken_strategy, cooperate))
+        cls.PKG_INVALID = pack_functions((invalid_return_strategy, cooperate))
+        cls.PKG_RAND = pack_functions((random_strategy, random_strategy))
+        cls.PKG_MOD = pack_functions((modifying_strategy, cooperate))
+        cls.EXPECT_CC_150 = gs_expect([True] * 150, [False] * 150)
+        cls.EXPECT_CC_50 = gs_expect([True] * 50, [False] * 50)
+        cls.EXPECT_COOPERATE_10 = gs_expect([False] * 10, [False] * 10)
+
     def test_play_match_no_noise_deterministic(self):
         """Test play_match without noise is deterministic"""
         result = play_match(
-            pack_functions((cheat, cooperate)),
+            self.PKG_CC,
             noise=False,
             rounds=150,
             random_seed=42,
         )
-        self.assertEqual(result, get_scores([True] * 150, [False] * 150))
+        self.assertEqual(result, self.EXPECT_CC_150)
 
     def test_play_match_tit_for_tat_vs_cooperate(self):
         """Test tit-for-tat against always cooperate"""
         result = play_match(
-            pack_functions((tit_for_tat, cooperate)),
+            self.PKG_TC,
             noise=False,
             rounds=10,
             random_seed=42,
         )
         # Both should cooperate all rounds
-        expected = get_scores([False] * 10, [False] * 10)
-        self.assertEqual(result, expected)
+        self.assertEqual(result, self.EXPECT_COOPERATE_10)
 
     def test_play_match_tit_for_tat_vs_cheat(self):
         """Test tit-for-tat against always defect"""
         result = play_match(
-            pack_functions((tit_for_tat, cheat)),
+            self.PKG_TCH,
             noise=False,
             rounds=10,
             random_seed=42,
@@ -207,13 +299,13 @@ class TestPlayMatch(unittest.TestCase):
         # Rounds 1-9: both defect -> tft: 9, cheat: 9
         expected_tft = [False] + [True] * 9
         expected_cheat = [True] * 10
-        expected = get_scores(expected_tft, expected_cheat)
+        expected = gs_expect(expected_tft, expected_cheat)
         self.assertEqual(result, expected)
 
     def test_play_match_with_list_return(self):
         """Test strategy that returns list of bools"""
         result = play_match(
-            pack_functions((return_list_strategy, cooperate)),
+            self.PKG_LIST,
             noise=False,
             rounds=10,
             random_seed=42,
@@ -221,35 +313,33 @@ class TestPlayMatch(unittest.TestCase):
         # return_list_strategy returns [False, False, True, True] on round 0
         # Then False for remaining rounds
         expected_moves = [False, False, True, True] + [False] * 6
-        expected = get_scores(expected_moves, [False] * 10)
+        expected = gs_expect(expected_moves, [False] * 10)
         self.assertEqual(result, expected)
 
     def test_play_match_broken_strategy_returns_none(self):
         """Test that broken strategies return None"""
-        with suppress_output():
-            result = play_match(
-                pack_functions((broken_strategy, cooperate)),
-                noise=False,
-                rounds=10,
-                random_seed=42,
-            )
+        result = play_match(
+            self.PKG_BROKEN,
+            noise=False,
+            rounds=10,
+            random_seed=42,
+        )
         self.assertIsNone(result)
 
     def test_play_match_invalid_return_type_returns_none(self):
         """Test that strategies with invalid return types return None"""
-        with suppress_output():
-            result = play_match(
-                pack_functions((invalid_return_strategy, cooperate)),
-                noise=False,
-                rounds=10,
-                random_seed=42,
-            )
+        result = play_match(
+            self.PKG_INVALID,
+            noise=False,
+            rounds=10,
+            random_seed=42,
+        )
         self.assertIsNone(result)
 
     def test_play_match_with_noise_same_seed_deterministic(self):
         """Test that noise with same seed produces same results"""
         result1 = play_match(
-            pack_functions((cheat, cooperate)),
+            self.PKG_CC,
             noise=True,
             noise_level=0.1,
             rounds=50,
@@ -257,7 +347,7 @@ class TestPlayMatch(unittest.TestCase):
             random_seed=42,
         )
         result2 = play_match(
-            pack_functions((cheat, cooperate)),
+            self.PKG_CC,
             noise=True,
             noise_level=0.1,
             rounds=50,
@@ -269,7 +359,7 @@ class TestPlayMatch(unittest.TestCase):
     def test_play_match_with_noise_different_seed(self):
         """Test that noise with different seeds produces different results"""
         result1 = play_match(
-            pack_functions((random_strategy, random_strategy)),
+            self.PKG_RAND,
             noise=True,
             noise_level=0.1,
             rounds=50,
@@ -277,7 +367,7 @@ class TestPlayMatch(unittest.TestCase):
             random_seed=42,
         )
         result2 = play_match(
-            pack_functions((random_strategy, random_strategy)),
+            self.PKG_RAND,
             noise=True,
             noise_level=0.1,
             rounds=50,
@@ -290,27 +380,61 @@ class TestPlayMatch(unittest.TestCase):
     def test_play_match_zero_noise_level(self):
         """Test with noise enabled but noise_level=0"""
         result = play_match(
-            pack_functions((cheat, cooperate)),
+            self.PKG_CC,
             noise=True,
             noise_level=0.0,
             rounds=50,
             num_noise_games_to_avg=5,
             random_seed=42,
         )
-        expected = get_scores([True] * 50, [False] * 50)
-        self.assertEqual(result, expected)
+        self.assertEqual(result, self.EXPECT_CC_50)
 
     def test_play_match_data_isolation(self):
         """Test that strategies receive copies and can't modify game state"""
         result = play_match(
-            pack_functions((modifying_strategy, cooperate)),
+            self.PKG_MOD,
             noise=False,
             rounds=10,
             random_seed=42,
         )
         # Should complete successfully despite modification attempts
-        expected = get_scores([False] * 10, [False] * 10)
-        self.assertEqual(result, expected)
+        self.assertEqual(result, self.EXPECT_COOPERATE_10)
+
+    def test_play_match_scored_moves_cannot_be_rewritten(self):
+        """Test that a submitted strategy gets copies even when the bytecode check thinks it only reads its histories"""
+        # a renamed copy of tit for tat has no kernel, so it is played from its lists like a submission
+        code = default_strategies.tit_for_tat.__code__.replace(co_name="tft_copy")
+        tft_copy = FunctionType(code, default_strategies.tit_for_tat.__globals__, "tft_copy")
+        self.assertEqual(needs_history_copies(equality_rewriter), (False, False))
+        self.assertEqual(
+            play_match(pack_functions((equality_rewriter, tft_copy)), noise=False, rounds=100, random_seed=42),
+            play_match(pack_functions((default_strategies.rat, tft_copy)), noise=False, rounds=100, random_seed=42),
+        )
+
+    def test_play_match_mask_strategy(self):
+        """Test that a strategy taking history masks plays the same as its list version, even with noise"""
+        for noise in (False, True):
+            with self.subTest(noise=noise):
+                kwargs = dict(noise=noise, noise_level=0.3, rounds=60, num_noise_games_to_avg=5, random_seed=42)
+                self.assertEqual(
+                    play_match(pack_functions((two_tats_from_masks, random_strategy)), **kwargs),
+                    _play_match_cached(pack_functions((two_tats_from_lists, random_strategy)), **kwargs),
+                )
+
+    def test_play_match_mask_arguments_are_passed(self):
+        """Test that a strategy taking history masks is given them, and plays the same as its list version"""
+        for opponent in (cheat, alternating, random_strategy):
+            with self.subTest(opponent=opponent.__name__):
+                kwargs = dict(noise=False, rounds=30, random_seed=42)
+                result = play_match(pack_functions((grudger_from_masks, opponent)), **kwargs)
+                self.assertIsNotNone(result)
+                self.assertEqual(result, _play_match_cached(pack_functions((grudger, opponent)), **kwargs))
+
+    def test_play_match_recursive_strategy_leaves_module_globals(self):
+        """Test that a strategy can call itself by name without being added to the simulation module"""
+        result = play_match(pack_functions((recursive_strategy, cooperate)), noise=False, rounds=10)
+        self.assertEqual(result, self.EXPECT_COOPERATE_10)
+        self.assertNotIn("recursive_strategy", vars(simulation))
 
 
 class TestRunSimulation(unittest.TestCase):
@@ -318,26 +442,24 @@ class TestRunSimulation(unittest.TestCase):
 
     def test_run_simulation_two_strategies(self):
         """Test basic simulation with two strategies"""
-        with suppress_output():
-            result = run_simulation(
-                [cheat, cooperate],
-                noise=False,
-                rounds=10,
-                random_seed=42,
-            )
+        result = run_simulation(
+            [cheat, cooperate],
+            noise=False,
+            rounds=10,
+            random_seed=42,
+        )
 
         self.assertEqual(result["cheat"]["cooperate"], (90.0, 0.0))
         self.assertEqual(result["cooperate"]["cheat"], (0.0, 90.0))
 
     def test_run_simulation_symmetry(self):
         """Test that results are symmetric: A vs B = reversed(B vs A)"""
-        with suppress_output():
-            result = run_simulation(
-                [cheat, cooperate, tit_for_tat],
-                noise=False,
-                rounds=10,
-                random_seed=42,
-            )
+        result = run_simulation(
+            [cheat, cooperate, tit_for_tat],
+            noise=False,
+            rounds=10,
+            random_seed=42,
+        )
 
         # Check symmetry for all pairs
         self.assertEqual(
@@ -356,13 +478,12 @@ class TestRunSimulation(unittest.TestCase):
     def test_run_simulation_all_pairs_played(self):
         """Test that all strategy pairs play exactly once"""
         strategies = [cheat, cooperate, tit_for_tat, alternating]
-        with suppress_output():
-            result = run_simulation(
-                strategies,
-                noise=False,
-                rounds=10,
-                random_seed=42,
-            )
+        result = run_simulation(
+            strategies,
+            noise=False,
+            rounds=10,
+            random_seed=42,
+        )
 
         # Should have 4 strategies, each with 3 opponents (4 choose 2 = 6 matchups)
         strategy_names = [s.__name__ for s in strategies]
@@ -379,13 +500,12 @@ class TestRunSimulation(unittest.TestCase):
 
     def test_run_simulation_with_failing_strategy(self):
         """Test that simulation continues even if one strategy fails"""
-        with suppress_output():
-            result = run_simulation(
-                [cheat, cooperate, broken_strategy],
-                noise=False,
-                rounds=10,
-                random_seed=42,
-            )
+        result = run_simulation(
+            [cheat, cooperate, broken_strategy],
+            noise=False,
+            rounds=10,
+            random_seed=42,
+        )
 
         # cheat vs cooperate should still have results
         self.assertIn("cheat", result)
@@ -399,44 +519,95 @@ class TestRunSimulation(unittest.TestCase):
 
     def test_run_simulation_deterministic_with_seed(self):
         """Test that same seed produces same results"""
-        with suppress_output():
-            result1 = run_simulation(
-                [cheat, cooperate, tit_for_tat],
-                noise=False,
-                rounds=10,
-                random_seed=42,
-            )
-            result2 = run_simulation(
-                [cheat, cooperate, tit_for_tat],
-                noise=False,
-                rounds=10,
-                random_seed=42,
-            )
+        result1 = run_simulation(
+            [cheat, cooperate, tit_for_tat],
+            noise=False,
+            rounds=10,
+            random_seed=42,
+        )
+        result2 = run_simulation(
+            [cheat, cooperate, tit_for_tat],
+            noise=False,
+            rounds=10,
+            random_seed=42,
+        )
 
         self.assertEqual(result1, result2)
 
+    def test_run_simulation_duplicate_code(self):
+        """Test that strategies with the same code under different names get the same results as if played directly"""
+        def renamed(strategy, name):
+            code = strategy.__code__.replace(co_name=name)
+            return FunctionType(code, strategy.__globals__, name)
+
+        strats = [random_strategy, tit_for_tat, renamed(random_strategy, "random_copy"), renamed(tit_for_tat, "tft_copy")]
+        kwargs = dict(noise=True, noise_level=0.2, rounds=20, num_noise_games_to_avg=3, random_seed=42)
+        result = run_simulation(strats, **kwargs)
+        for i, player1 in enumerate(strats):
+            for player2 in strats[i + 1:]:
+                expected = _play_match_cached(pack_functions((player1, player2)), **kwargs)
+                self.assertEqual(result[player1.__name__][player2.__name__], expected)
+
+    def test_run_simulation_function_state_per_match(self):
+        """Test that state a strategy keeps on its function object does not carry over between matches"""
+        strats = [counting_strategy, cooperate, cheat, tit_for_tat]
+        kwargs = dict(noise=False, rounds=100, random_seed=42)
+        result = run_simulation(strats, **kwargs)
+        for opponent in strats[1:]:
+            expected = _play_match_cached(pack_functions((counting_strategy, opponent)), **kwargs)
+            self.assertEqual(result["counting_strategy"][opponent.__name__], expected)
+
+        # a worker plays match after match, so the same matchup has to come out the same every time
+        simulation._set_worker_strategies(strats)
+        first = simulation._play_matchup((0, 1), num_noise_games_to_avg=1, noise_level=0, **kwargs)
+        second = simulation._play_matchup((0, 1), num_noise_games_to_avg=1, noise_level=0, **kwargs)
+        self.assertEqual(first, second)
+
+    def test_run_simulation_duplicate_code_function_state(self):
+        """Test that two strategies with the same code are still played as two separate functions"""
+        copy = FunctionType(counting_strategy.__code__.replace(co_name="counting_copy"), globals(), "counting_copy")
+        strats = [counting_strategy, copy]
+        kwargs = dict(noise=False, rounds=100, random_seed=42)
+        result = run_simulation(strats, **kwargs)
+        expected = _play_match_cached(pack_functions((counting_strategy, copy)), **kwargs)
+        self.assertEqual(result["counting_strategy"]["counting_copy"], expected)
+
+        # both strategies are played by the first one with their code, but never by the same function object
+        simulation._set_worker_strategies(strats)
+        with mock.patch.object(simulation, "_play_unpacked_match", return_value=None) as play:
+            simulation._play_matchup((0, 0), num_noise_games_to_avg=1, noise_level=0, **kwargs)
+        player1, player2 = play.call_args.args
+        self.assertIsNot(player1, player2)
+
+    def test_run_simulation_default_arguments(self):
+        """Test that strategies keep their default arguments, which tell apart strategies that share their code"""
+        result = run_simulation([rats_from_round_10, rats_from_round_50, counts_in_default, cooperate], noise=False, rounds=100)
+        self.assertEqual(result["rats_from_round_10"]["cooperate"], gs_expect([False] * 10 + [True] * 90, [False] * 100))
+        self.assertEqual(result["rats_from_round_50"]["cooperate"], gs_expect([False] * 50 + [True] * 50, [False] * 100))
+        # a mutable default starts out fresh in every match
+        for opponent in ("rats_from_round_10", "cooperate"):
+            self.assertEqual(result["counts_in_default"][opponent], result["rats_from_round_50"][opponent])
+
     def test_run_simulation_single_strategy(self):
         """Test simulation with only one strategy (edge case)"""
-        with suppress_output():
-            result = run_simulation(
-                [cheat],
-                noise=False,
-                rounds=10,
-                random_seed=42,
-            )
+        result = run_simulation(
+            [cheat],
+            noise=False,
+            rounds=10,
+            random_seed=42,
+        )
 
         # Should have no matchups (can't play against itself in round-robin)
         self.assertEqual(len(result.get("cheat", {})), 0)
 
     def test_run_simulation_complex_strategies(self):
         """Integration test with multiple complex strategies"""
-        with suppress_output():
-            result = run_simulation(
-                [cheat, cooperate, tit_for_tat, grudger, alternating],
-                noise=False,
-                rounds=20,
-                random_seed=42,
-            )
+        result = run_simulation(
+            [cheat, cooperate, tit_for_tat, grudger, alternating],
+            noise=False,
+            rounds=20,
+            random_seed=42,
+        )
 
         # All strategies should have results
         for strat_name in ["cheat", "cooperate", "tit_for_tat", "grudger", "alternating"]:
@@ -446,16 +617,152 @@ class TestRunSimulation(unittest.TestCase):
         # Test specific expected behaviors
         # tit_for_tat vs cooperate: both should cooperate all rounds
         tft_coop_score = result["tit_for_tat"]["cooperate"]
-        expected = get_scores([False] * 20, [False] * 20)
+        expected = gs_expect([False] * 20, [False] * 20)
         self.assertEqual(tft_coop_score, expected)
 
         # grudger vs cheat: grudger cooperates once, then always defects
         grudger_cheat = result["grudger"]["cheat"]
         grudger_moves = [False] + [True] * 19
         cheat_moves = [True] * 20
-        expected = get_scores(grudger_moves, cheat_moves)
+        expected = gs_expect(grudger_moves, cheat_moves)
         self.assertEqual(grudger_cheat, expected)
 
 
+class TestNeedsHistoryCopies(unittest.TestCase):
+    """Test the bytecode check that decides which histories play_match has to copy"""
+
+    def test_read_only_strategies(self):
+        """Indexing, slicing, len, `in` and iteration should not need copies"""
+        self.assertEqual(needs_history_copies(tit_for_tat), (False, False))
+        self.assertEqual(needs_history_copies(grudger), (False, False))
+
+        def recent_majority(my_moves, other_moves, current_round):
+            if len(other_moves) < 3:
+                return False
+            for move in my_moves:
+                if move:
+                    return True
+            return sum(other_moves[-3:]) >= 2
+
+        self.assertEqual(needs_history_copies(recent_majority), (False, False))
+
+    def test_modifying_strategies(self):
+        """Anything that could modify or keep a history should need a copy"""
+        self.assertEqual(needs_history_copies(modifying_strategy), (False, True))
+
+        def returns_history(my_moves, other_moves, current_round):
+            return my_moves
+
+        def passes_history_on(my_moves, other_moves, current_round):
+            return tit_for_tat(my_moves, other_moves, current_round)
+
+        self.assertEqual(needs_history_copies(returns_history), (True, False))
+        self.assertEqual(needs_history_copies(passes_history_on), (True, True))
+
+
+class TestPlayVectorizedMatch(unittest.TestCase):
+    """Test that noise games between default functions played all at once match the one-game-at-a-time path"""
+
+    deterministic_defaults = [
+        default_strategies.rat,
+        default_strategies.silent,
+        default_strategies.tit_for_tat,
+        default_strategies.tit_for_two_tats,
+        default_strategies.nuke_for_tat,
+        default_strategies.nuke_for_two_tats,
+        default_strategies.two_tits_for_tat,
+        default_strategies.pavlov,
+        default_strategies.suspicious_tit_for_tat,
+    ]
+
+    def test_zero_noise_matches_no_noise(self):
+        """With noise_level=0 every game should score the same as a game without noise"""
+        for player1 in self.deterministic_defaults:
+            for player2 in self.deterministic_defaults:
+                with self.subTest(player1=player1.__name__, player2=player2.__name__):
+                    noisy = play_match(
+                        pack_functions((player1, player2)),
+                        noise=True,
+                        noise_level=0.0,
+                        rounds=[30, 45, 60],
+                        num_noise_games_to_avg=3,
+                        random_seed=42,
+                    )
+                    expected = [
+                        _play_match_cached(pack_functions((player1, player2)), noise=False, rounds=rounds)
+                        for rounds in (30, 45, 60)
+                    ]
+                    self.assertEqual(noisy, tuple(sum(x) / 3 for x in zip(*expected)))
+
+    def test_noise_mask_matches_one_game_at_a_time(self):
+        """Given the same noise, games played all at once should score the same as one game at a time"""
+        noise_mask = np.random.default_rng(42).random((4, 50, 2)) < 0.2
+        for player1 in self.deterministic_defaults:
+            for player2 in self.deterministic_defaults:
+                with self.subTest(player1=player1.__name__, player2=player2.__name__):
+                    # a renamed copy of player 2's code has no kernels, so it forces the one-game-at-a-time path
+                    code = player2.__code__.replace(co_name=player2.__name__ + "_copy")
+                    copy = FunctionType(code, player2.__globals__, code.co_name)
+                    kwargs = dict(noise=True, rounds=50, num_noise_games_to_avg=4, noise_mask=noise_mask)
+                    self.assertEqual(
+                        play_match(pack_functions((player1, player2)), **kwargs),
+                        play_match(pack_functions((player1, copy)), **kwargs),
+                    )
+
+    def test_noise_mask_wrong_shape(self):
+        """A noise mask that doesn't cover exactly every game and round should be rejected up front"""
+        bytecode = pack_functions((random_strategy, tit_for_tat))
+        for shape in ((4, 49, 2), (4, 51, 2), (3, 50, 2), (4, 50)):
+            with self.subTest(shape=shape):
+                with self.assertRaises(ValueError):
+                    play_match(bytecode, noise=True, rounds=50, num_noise_games_to_avg=4, noise_mask=np.zeros(shape, dtype=bool))
+
+    def test_default_noise_mask_is_drawn_from_seed(self):
+        """Not passing a noise mask should be the same as passing the one drawn from `random_seed`"""
+        bytecode = pack_functions((random_strategy, tit_for_tat))
+        noise_mask = np.random.default_rng(42).random((5, 50, 2)) < 0.1
+        self.assertEqual(
+            play_match(bytecode, noise=True, noise_level=0.1, rounds=50, num_noise_games_to_avg=5, random_seed=42),
+            play_match(bytecode, noise=True, rounds=50, num_noise_games_to_avg=5, random_seed=42, noise_mask=noise_mask),
+        )
+
+    def test_default_rng_is_seeded_from_seed(self):
+        """Not passing a generator should be the same as passing one seeded with `random_seed`"""
+        for player2 in (default_strategies.tit_for_tat, random_strategy):
+            with self.subTest(player2=player2.__name__):
+                bytecode = pack_functions((default_strategies.rand, player2))
+                kwargs = dict(noise=True, noise_level=0.1, rounds=50, num_noise_games_to_avg=5, random_seed=42)
+                self.assertEqual(
+                    play_match(bytecode, **kwargs),
+                    play_match(bytecode, **kwargs, rng=np.random.default_rng(42)),
+                )
+
+    def test_same_seed_deterministic(self):
+        """Vectorized noise games should be reproducible from the seed"""
+        bytecode = pack_functions((default_strategies.rand, default_strategies.tit_for_tat))
+        result1 = play_match(bytecode, noise=True, rounds=50, num_noise_games_to_avg=20, random_seed=42)
+        result2 = play_match(bytecode, noise=True, rounds=50, num_noise_games_to_avg=20, random_seed=42)
+        result3 = play_match(bytecode, noise=True, rounds=50, num_noise_games_to_avg=20, random_seed=99)
+        self.assertEqual(result1, result2)
+        self.assertNotEqual(result1, result3)
+
+
+class TestPlayKernelGame(unittest.TestCase):
+    """Test that games between two bit-packed default functions score the same as through the list path"""
+
+    def test_matches_list_strategies(self):
+        """A default function should score the same as an identical copy that has no kernel"""
+        for player1 in TestPlayVectorizedMatch.deterministic_defaults:
+            for player2 in TestPlayVectorizedMatch.deterministic_defaults:
+                with self.subTest(player1=player1.__name__, player2=player2.__name__):
+                    # kernels are looked up by code object, so a renamed copy of the code has none
+                    code = player2.__code__.replace(co_name=player2.__name__ + "_copy")
+                    copy = FunctionType(code, player2.__globals__, code.co_name)
+                    self.assertEqual(
+                        play_match(pack_functions((player1, player2)), noise=False, rounds=77),
+                        _play_match_cached(pack_functions((player1, copy)), noise=False, rounds=77),
+                    )
+
+
 if __name__ == "__main__":
     unittest.main()
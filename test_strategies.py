@@ -9,55 +9,129 @@ This test suite verifies each strategy's behavior by:
 
 import unittest
 import random
+from unittest import mock
+from functools import lru_cache
+import numpy as np
 from ipd_local.default_strategies import (
     rat, silent, rand, kinda_random, tit_for_tat, tit_for_two_tats,
     nuke_for_tat, nuke_for_two_tats, two_tits_for_tat, pavlov,
-    suspicious_tit_for_tat
+    suspicious_tit_for_tat, all_default_functions, get_bitmask_kernel, get_vectorized_kernel
+)
+from ipd_local import default_strategies
+from ipd_local.history import pack_moves, unpack_moves, HistoryState, ReplicaState
+
+
+# Payoff matrix from game_specs.py
+POINTS_BOTH_COOPERATE = 5
+POINTS_DIFFERENT_LOSER = 0
+POINTS_DIFFERENT_WINNER = 9
+POINTS_BOTH_RAT = 1
+
+# _P1[move1, move2] is player 1's points for a round (True = rat); player 2's are the transpose
+_P1 = np.array(
+    [[POINTS_BOTH_COOPERATE, POINTS_DIFFERENT_LOSER], [POINTS_DIFFERENT_WINNER, POINTS_BOTH_RAT]],
+    dtype=np.int32,
 )
+_P2 = _P1.T
+
 
+def _score_moves(moves1, moves2):
+    """Both players' total points for two equal-length move histories (lists of bools or 0/1 byte buffers)."""
+    m1 = np.asarray(moves1, dtype=np.int8)
+    m2 = np.asarray(moves2, dtype=np.int8)
+    return int(_P1[m1, m2].sum()), int(_P2[m1, m2].sum())
 
-def simulate_game(strategy1, strategy2, rounds):
+
+def strategy_rng(rng):
+    """
+    Makes the default strategies draw from `rng` (a `random.Random`) instead of the global `random` module while
+    the context is open, so a test's draws don't depend on what other tests did to the global state.
+    """
+    return mock.patch.object(default_strategies, "random", rng)
+
+
+def simulate_game(strategy1, strategy2, rounds, rng=None):
     """
     Manually simulate a game between two strategies to verify behavior.
+    Every round is played by calling both strategies, with no shortcuts, since this is what the other tests trust.
+    If `rng` is given, the default strategies draw from it (see `strategy_rng`) instead of the global `random`.
     Returns (moves1, moves2, score1, score2)
     """
+    if rng is not None:
+        with strategy_rng(rng):
+            return simulate_game(strategy1, strategy2, rounds)
+
     moves1 = []
     moves2 = []
-    score1 = 0
-    score2 = 0
-
-    # Payoff matrix from game_specs.py
-    POINTS_BOTH_COOPERATE = 5
-    POINTS_DIFFERENT_LOSER = 0
-    POINTS_DIFFERENT_WINNER = 9
-    POINTS_BOTH_RAT = 1
 
     for round_num in range(rounds):
-        # Get moves from strategies
-        move1 = strategy1(moves1.copy(), moves2.copy(), round_num)
-        move2 = strategy2(moves2.copy(), moves1.copy(), round_num)
-
-        # Calculate scores for this round
-        if move1 and move2:  # Both rat
-            score1 += POINTS_BOTH_RAT
-            score2 += POINTS_BOTH_RAT
-        elif not move1 and not move2:  # Both cooperate
-            score1 += POINTS_BOTH_COOPERATE
-            score2 += POINTS_BOTH_COOPERATE
-        elif move1 and not move2:  # Player 1 rats, player 2 cooperates
-            score1 += POINTS_DIFFERENT_WINNER
-            score2 += POINTS_DIFFERENT_LOSER
-        else:  # Player 1 cooperates, player 2 rats
-            score1 += POINTS_DIFFERENT_LOSER
-            score2 += POINTS_DIFFERENT_WINNER
+        # Get moves from strategies (the histories are passed without copies, since no strategy here
+        # modifies its inputs; TestEdgeCases.test_strategies_dont_modify_inputs checks that)
+        move1 = strategy1(moves1, moves2, round_num)
+        move2 = strategy2(moves2, moves1, round_num)
 
         # Record moves
         moves1.append(move1)
         moves2.append(move2)
 
+    # Score every round at once from the payoff tables
+    score1, score2 = _score_moves(moves1, moves2)
+
     return moves1, moves2, score1, score2
 
 
+def simulate_game_packed(strategy1, strategy2, rounds):
+    """
+    `simulate_game` through the strategies' bit-packed kernels, so both histories are `HistoryState` masks
+    instead of lists. Returns the same (moves1, moves2, score1, score2).
+    """
+    kernel1 = get_bitmask_kernel(strategy1)
+    kernel2 = get_bitmask_kernel(strategy2)
+    state1 = HistoryState()
+    state2 = HistoryState()
+
+    for round_num in range(rounds):
+        move1 = kernel1(state1, round_num)
+        move2 = kernel2(state2, round_num)
+        state1.update(move1, move2, round_num)
+        state2.update(move2, move1, round_num)
+
+    moves1 = unpack_moves(state1.my_mask, rounds)
+    moves2 = unpack_moves(state2.my_mask, rounds)
+    return (moves1, moves2, *_score_moves(moves1, moves2))
+
+
+# strategies that draw from `random`, so their games depend on the seed
+_RANDOM_STRATEGIES = {rand, kinda_random}
+
+
+ALL_STRATEGIES = [
+    rat, silent, rand, kinda_random, tit_for_tat, tit_for_two_tats,
+    nuke_for_tat, nuke_for_two_tats, two_tits_for_tat, pavlov,
+    suspicious_tit_for_tat
+]
+DETERMINISTIC_STRATEGIES = [strategy for strategy in ALL_STRATEGIES if strategy not in _RANDOM_STRATEGIES]
+
+# 500 rounds of cooperation, shared by the long history tests; a tuple, so a strategy that tried to modify
+# it would fail loudly instead of changing it for later tests (see also test_strategies_dont_modify_inputs)
+LONG_HISTORY = (False,) * 500
+
+
+# ========== Scripted opponents ==========
+
+
+def alternating_defector(mymoves, othermoves, currentRound):
+    return currentRound % 2 == 0  # Defect on even rounds
+
+
+def single_defector(mymoves, othermoves, currentRound):
+    return currentRound == 2  # Only defect on round 2
+
+
+def defect_rounds_3_and_4(mymoves, othermoves, currentRound):
+    return currentRound == 3 or currentRound == 4
+
+
 class TestRatStrategy(unittest.TestCase):
     """Test the 'rat' strategy that always defects"""
 
@@ -223,9 +297,6 @@ class TestTitForTwoTatsStrategy(unittest.TestCase):
 
     def test_tft2_vs_alternating_defector(self):
         """Test against opponent who alternates: defect, cooperate, defect, cooperate"""
-        def alternating_defector(mymoves, othermoves, currentRound):
-            return currentRound % 2 == 0  # Defect on even rounds
-
         moves1, moves2, score1, score2 = simulate_game(tit_for_two_tats, alternating_defector, 10)
 
         # TFT2 should never see two consecutive defections, so always cooperates
@@ -286,9 +357,6 @@ class TestNukeForTatStrategy(unittest.TestCase):
 
     def test_nft_vs_single_defection_then_cooperate(self):
         """Test against opponent who defects once then cooperates"""
-        def single_defector(mymoves, othermoves, currentRound):
-            return currentRound == 2  # Only defect on round 2
-
         moves1, moves2, score1, score2 = simulate_game(nuke_for_tat, single_defector, 10)
 
         # NFT cooperates first 2 rounds, detects defection at round 2, then defects forever
@@ -349,9 +417,6 @@ class TestNukeForTwoTatsStrategy(unittest.TestCase):
 
     def test_nf2t_vs_alternating_defector(self):
         """Test against alternating defector - should never trigger nuke"""
-        def alternating_defector(mymoves, othermoves, currentRound):
-            return currentRound % 2 == 0
-
         moves1, moves2, score1, score2 = simulate_game(nuke_for_two_tats, alternating_defector, 10)
 
         # Should never see consecutive defections, so always cooperates
@@ -364,9 +429,6 @@ class TestNukeForTwoTatsStrategy(unittest.TestCase):
 
     def test_nf2t_triggers_on_consecutive(self):
         """Test that it triggers exactly when consecutive defections occur"""
-        def defect_rounds_3_and_4(mymoves, othermoves, currentRound):
-            return currentRound in [3, 4]
-
         moves1, moves2, score1, score2 = simulate_game(nuke_for_two_tats, defect_rounds_3_and_4, 10)
 
         # Cooperates rounds 0-4, then detects consecutive defections and nukes rest
@@ -439,9 +501,6 @@ class TestTwoTitsForTatStrategy(unittest.TestCase):
 
     def test_2tft_vs_single_defection(self):
         """Test against opponent who defects once"""
-        def single_defector(mymoves, othermoves, currentRound):
-            return currentRound == 2
-
         moves1, moves2, score1, score2 = simulate_game(two_tits_for_tat, single_defector, 10)
 
         # Rounds 0,1: cooperate
@@ -589,43 +648,60 @@ class TestSuspiciousTitForTatStrategy(unittest.TestCase):
         self.assertEqual(score2, 10)
 
 
+def _bulk_draws(strategy, n, seed):
+    """
+    `n` round-0 moves of a random default strategy, drawn in one go through its vectorized kernel
+    (the version played in noise games) from a NumPy generator seeded with `seed`.
+    The `*_produces_both_values` tests check the list versions (played by submissions' opponents) with `random`.
+    """
+    return get_vectorized_kernel(strategy)(ReplicaState(n, 1, np.random.default_rng(seed)))
+
+
 class TestRandomStrategies(unittest.TestCase):
     """Test random strategies with seeded random"""
 
     def test_rand_returns_bool(self):
         """Random strategy should return bool"""
-        random.seed(42)
-        result = rand([], [], 0)
+        with strategy_rng(random.Random(42)):
+            result = rand([], [], 0)
         self.assertIsInstance(result, bool)
 
     def test_rand_with_seed_is_deterministic(self):
         """Random strategy with same seed should produce same results"""
-        random.seed(42)
-        results1 = [rand([], [], i) for i in range(100)]
+        with strategy_rng(random.Random(42)):
+            results1 = [rand([], [], i) for i in range(100)]
 
-        random.seed(42)
-        results2 = [rand([], [], i) for i in range(100)]
+        with strategy_rng(random.Random(42)):
+            results2 = [rand([], [], i) for i in range(100)]
 
         self.assertEqual(results1, results2)
 
     def test_rand_produces_both_values(self):
         """Random strategy should produce both True and False"""
-        random.seed(42)
-        results = [rand([], [], i) for i in range(1000)]
+        with strategy_rng(random.Random(42)):
+            results = [rand([], [], i) for i in range(1000)]
+
+        self.assertIn(True, results)
+        self.assertIn(False, results)
+
+    def test_rand_vectorized_produces_both_values(self):
+        """The vectorized version of the random strategy should rat about half the time"""
+        results = _bulk_draws(rand, 1000, 42)
 
         self.assertIn(True, results)
         self.assertIn(False, results)
+        self.assertAlmostEqual(results.mean(), 0.5, delta=0.05)
 
     def test_kinda_random_returns_bool(self):
         """Kinda random strategy should return bool"""
-        random.seed(42)
-        result = kinda_random([], [], 0)
+        with strategy_rng(random.Random(42)):
+            result = kinda_random([], [], 0)
         self.assertIsInstance(result, bool)
 
     def test_kinda_random_mostly_defects(self):
         """Kinda random should defect about 90% of the time"""
-        random.seed(42)
-        results = [kinda_random([], [], i) for i in range(1000)]
+        with strategy_rng(random.Random(42)):
+            results = [kinda_random([], [], i) for i in range(1000)]
 
         defect_count = sum(results)
         defect_ratio = defect_count / 1000
@@ -636,71 +712,58 @@ class TestRandomStrategies(unittest.TestCase):
 
     def test_kinda_random_produces_both_values(self):
         """Kinda random should produce both True and False (even if rare)"""
-        random.seed(42)
-        results = [kinda_random([], [], i) for i in range(1000)]
+        with strategy_rng(random.Random(42)):
+            results = [kinda_random([], [], i) for i in range(1000)]
 
         self.assertIn(True, results)
         self.assertIn(False, results)
 
+    def test_kinda_random_vectorized_produces_both_values(self):
+        """The vectorized version of kinda random should rat about 90% of the time"""
+        results = _bulk_draws(kinda_random, 1000, 42)
+
+        self.assertIn(True, results)
+        self.assertIn(False, results)
+        self.assertAlmostEqual(results.mean(), 0.9, delta=0.03)
+
 
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and boundary conditions"""
 
     def test_all_strategies_handle_empty_history(self):
         """All strategies should handle round 0 with empty history"""
-        strategies = [
-            rat, silent, rand, kinda_random, tit_for_tat, tit_for_two_tats,
-            nuke_for_tat, nuke_for_two_tats, two_tits_for_tat, pavlov,
-            suspicious_tit_for_tat
-        ]
-
-        for strategy in strategies:
-            try:
+        for strategy in ALL_STRATEGIES:
+            with self.subTest(strategy=strategy.__name__):
                 result = strategy([], [], 0)
                 self.assertIsInstance(result, bool, f"{strategy.__name__} should return bool")
-            except Exception as e:
-                self.fail(f"{strategy.__name__} failed on round 0: {e}")
 
     def test_all_strategies_handle_long_history(self):
         """All strategies should handle long game histories"""
-        strategies = [
-            rat, silent, tit_for_tat, tit_for_two_tats,
-            nuke_for_tat, nuke_for_two_tats, two_tits_for_tat, pavlov,
-            suspicious_tit_for_tat
-        ]
-
-        # Create a long history
-        long_history = [False] * 500
-
-        for strategy in strategies:
-            try:
-                result = strategy(long_history.copy(), long_history.copy(), 500)
+        # the same 500 cooperations as masks, for the bit-packed versions
+        state = HistoryState()
+        for strategy in DETERMINISTIC_STRATEGIES:
+            with self.subTest(strategy=strategy.__name__):
+                result = strategy(LONG_HISTORY, LONG_HISTORY, 500)
                 self.assertIsInstance(result, bool, f"{strategy.__name__} should return bool")
-            except Exception as e:
-                self.fail(f"{strategy.__name__} failed with long history: {e}")
+
+                kernel_result = get_bitmask_kernel(strategy)(state, 500)
+                self.assertIsInstance(kernel_result, bool)
+                self.assertEqual(kernel_result, result)
 
     def test_strategies_dont_modify_inputs(self):
         """Strategies should not modify input lists"""
-        strategies = [
-            rat, silent, tit_for_tat, tit_for_two_tats,
-            nuke_for_tat, nuke_for_two_tats, two_tits_for_tat, pavlov,
-            suspicious_tit_for_tat
-        ]
-
-        for strategy in strategies:
-            mymoves = [True, False, True]
-            othermoves = [False, True, False]
-
-            mymoves_copy = mymoves.copy()
-            othermoves_copy = othermoves.copy()
+        for strategy in DETERMINISTIC_STRATEGIES:
+            with self.subTest(strategy=strategy.__name__):
+                mymoves = [True, False, True]
+                othermoves = [False, True, False]
 
-            strategy(mymoves, othermoves, 3)
+                strategy(mymoves, othermoves, 3)
 
-            # Check that lists weren't modified
-            self.assertEqual(mymoves, mymoves_copy,
-                           f"{strategy.__name__} modified mymoves")
-            self.assertEqual(othermoves, othermoves_copy,
-                           f"{strategy.__name__} modified othermoves")
+                # Check that lists weren't modified
+                self.assertEqual(mymoves, [True, False, True],
+                               f"{strategy.__name__} modified mymoves")
+                self.assertEqual(othermoves, [False, True, False],
+                               f"{strategy.__name__} modified othermoves")
 
 
 class TestReproducibilityAndSeeds(unittest.TestCase):
@@ -708,8 +771,8 @@ class TestReproducibilityAndSeeds(unittest.TestCase):
 
     def simulate_game_with_seed(self, strategy1, strategy2, rounds, seed):
         """Simulate a game with a specific random seed"""
-        random.seed(seed)
-        return simulate_game(strategy1, strategy2, rounds)
+        # always played, so the reproducibility checks never compare a game against a cached copy of itself
+        return simulate_game(strategy1, strategy2, rounds, rng=random.Random(seed))
 
     def test_deterministic_strategies_same_seed_identical(self):
         """Deterministic strategies should produce identical results with same seed"""
@@ -761,66 +824,66 @@ class TestReproducibilityAndSeeds(unittest.TestCase):
                            f"{strat1.__name__} vs {strat2.__name__} not reproducible")
 
 
-class TestStrategiesWithNoise(unittest.TestCase):
-    """Test how strategies behave under noise conditions"""
-
-    def simulate_game_with_noise(self, strategy1, strategy2, rounds, noise_level, seed):
-        """
-        Simulate a game with noise - moves have a chance of being misperceived.
-        This mimics the noise implementation in simulation.py
-        """
-        random.seed(seed)
-        moves1 = []
-        moves2 = []
-        perceived1 = []  # What player2 sees from player1
-        perceived2 = []  # What player1 sees from player2
-        score1 = 0
-        score2 = 0
-
-        POINTS_BOTH_COOPERATE = 5
-        POINTS_DIFFERENT_LOSER = 0
-        POINTS_DIFFERENT_WINNER = 9
-        POINTS_BOTH_RAT = 1
-
+def _simulate_game_with_noise(strategy1, strategy2, rounds, noise_level, seed):
+    """
+    Simulate a game with noise - moves have a chance of being misperceived.
+    This mimics the noise implementation in simulation.py: every flip of the game is drawn up front
+    from a NumPy generator, and the strategies that use `random` draw from their own `random.Random(seed)`
+    (see `strategy_rng`), so the global `random` state is never touched.
+    """
+    # flips[round] is whether (player 1's move, player 2's move) is misperceived
+    flips = (np.random.default_rng(seed).random((rounds, 2)) < noise_level).tolist()
+    moves1 = []
+    moves2 = []
+    perceived1 = []  # What player2 sees from player1
+    perceived2 = []  # What player1 sees from player2
+    with strategy_rng(random.Random(seed)):
         for round_num in range(rounds):
-            # Get actual moves based on perceived history
-            move1 = strategy1(moves1.copy(), perceived2.copy(), round_num)
-            move2 = strategy2(moves2.copy(), perceived1.copy(), round_num)
-
-            # Calculate scores based on actual moves
-            if move1 and move2:
-                score1 += POINTS_BOTH_RAT
-                score2 += POINTS_BOTH_RAT
-            elif not move1 and not move2:
-                score1 += POINTS_BOTH_COOPERATE
-                score2 += POINTS_BOTH_COOPERATE
-            elif move1 and not move2:
-                score1 += POINTS_DIFFERENT_WINNER
-                score2 += POINTS_DIFFERENT_LOSER
-            else:
-                score1 += POINTS_DIFFERENT_LOSER
-                score2 += POINTS_DIFFERENT_WINNER
+            # Get actual moves based on perceived history (passed without copies, as in `simulate_game`)
+            move1 = strategy1(moves1, perceived2, round_num)
+            move2 = strategy2(moves2, perceived1, round_num)
 
             # Record actual moves
             moves1.append(move1)
             moves2.append(move2)
 
             # Create perceived moves (with noise)
-            perceived_move1 = not move1 if random.random() < noise_level else move1
-            perceived_move2 = not move2 if random.random() < noise_level else move2
+            flip1, flip2 = flips[round_num]
+            perceived_move1 = move1 ^ flip1
+            perceived_move2 = move2 ^ flip2
 
             perceived1.append(perceived_move1)
             perceived2.append(perceived_move2)
 
-        return moves1, moves2, score1, score2, perceived1, perceived2
+    # Calculate scores based on actual moves, all rounds at once
+    score1, score2 = _score_moves(moves1, moves2)
+
+    return moves1, moves2, score1, score2, perceived1, perceived2
+
+
+# a noise game is fully determined by its arguments, since both the strategies' draws and the flips are seeded from `seed`
+_cached_game_with_noise = lru_cache(maxsize=4096)(_simulate_game_with_noise)
+
+
+class TestStrategiesWithNoise(unittest.TestCase):
+    """Test how strategies behave under noise conditions"""
+
+    def simulate_game_with_noise(self, strategy1, strategy2, rounds, noise_level, seed):
+        """`_simulate_game_with_noise`, but each game is only played once per test run (it is fixed by its seed)."""
+        moves1, moves2, score1, score2, perceived1, perceived2 = _cached_game_with_noise(
+            strategy1, strategy2, rounds, noise_level, seed
+        )
+        # fresh lists, so a test can't change what later tests get back
+        return list(moves1), list(moves2), score1, score2, list(perceived1), list(perceived2)
 
     def test_noise_with_same_seed_is_reproducible(self):
         """Games with noise should be reproducible with same seed"""
         seed = 42
         noise_level = 0.1
 
-        result1 = self.simulate_game_with_noise(tit_for_tat, tit_for_tat, 100, noise_level, seed)
-        result2 = self.simulate_game_with_noise(tit_for_tat, tit_for_tat, 100, noise_level, seed)
+        # played twice without the cache, so the second game isn't just a cached copy of the first
+        result1 = _simulate_game_with_noise(tit_for_tat, tit_for_tat, 100, noise_level, seed)
+        result2 = _simulate_game_with_noise(tit_for_tat, tit_for_tat, 100, noise_level, seed)
 
         self.assertEqual(result1, result2)
 
@@ -1019,6 +1082,67 @@ class TestMultiGameAveraging(unittest.TestCase):
         self.assertIsNotNone(variance_many)
 
 
+class TestBitmaskKernels(unittest.TestCase):
+    """Test that the bit-packed kernels match the list-based default strategies"""
+
+    def test_pack_unpack_round_trip(self):
+        """Packing then unpacking a history should give back the same moves"""
+        moves = [True, False, False, True, True]
+        self.assertEqual(pack_moves(moves), 0b11001)
+        self.assertEqual(unpack_moves(pack_moves(moves), len(moves)), moves)
+        self.assertEqual(unpack_moves(0, 0), [])
+
+    def test_every_default_has_a_kernel(self):
+        """Every default function should be played through a kernel"""
+        for strategy in all_default_functions:
+            self.assertIsNotNone(get_bitmask_kernel(strategy), strategy.__name__)
+            self.assertIsNotNone(get_vectorized_kernel(strategy), strategy.__name__)
+
+    def test_kernels_match_list_strategies(self):
+        """Kernels should return the same move as the list version for any history"""
+        rng = random.Random(42)
+        for strategy in all_default_functions:
+            kernel = get_bitmask_kernel(strategy)
+            for current_round in range(12):
+                my_moves = [rng.random() < 0.5 for _ in range(current_round)]
+                other_moves = [rng.random() < 0.5 for _ in range(current_round)]
+
+                state = HistoryState()
+                for i, (my_move, other_move) in enumerate(zip(my_moves, other_moves)):
+                    state.update(my_move, other_move, i)
+
+                random.seed(current_round)
+                expected = strategy(my_moves, other_moves, current_round)
+                random.seed(current_round)
+                actual = kernel(state, current_round)
+
+                self.assertIsInstance(actual, bool, strategy.__name__)
+                self.assertEqual(actual, expected,
+                                 f"{strategy.__name__} differs on {other_moves}")
+
+    def test_packed_games_match_list_games(self):
+        """Whole games played through the kernels should match the list-based simulation"""
+        for strategy1 in all_default_functions:
+            for strategy2 in all_default_functions:
+                with self.subTest(strategy1=strategy1.__name__, strategy2=strategy2.__name__):
+                    random.seed(42)
+                    expected = simulate_game(strategy1, strategy2, 60)
+                    random.seed(42)
+                    self.assertEqual(simulate_game_packed(strategy1, strategy2, 60), expected)
+
+    def test_history_state_summaries(self):
+        """The running summaries should track the percieved opponent moves"""
+        state = HistoryState()
+        for i, other_move in enumerate([False, True, False, True, True]):
+            state.update(False, other_move, i)
+            self.assertEqual(state.last_rat, other_move)
+            if i == 1:
+                self.assertTrue(state.any_rat)
+                self.assertFalse(state.two_in_a_row)
+        self.assertTrue(state.two_in_a_row)
+        self.assertEqual(state.other_mask, 0b11010)
+
+
 if __name__ == "__main__":
     # Run tests with verbose output
     unittest.main(verbosity=2)
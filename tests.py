@@ -1,12 +1,17 @@
 from ipd_local.simulation import get_scores, pack_functions, unpack_functions, play_match, run_simulation
-from ipd_local.get_inputs import get_strategy_code_pairs
+from ipd_local.get_inputs import get_strategy_code_pairs, compile_submission, check_functions, get_num_functions, get_pastebin
 from ipd_local.descriptor import get_client, get_response, describe_strategy
-from ipd_local.utils import suppress_output
+from ipd_local.utils import suppress_output, get_length_no_whitespace, get_length_no_whitespace_no_comments
 
 import unittest
 import marshal
 import json
 import random
+import os
+import tempfile
+import requests
+import sys
+from unittest import mock
 
 # ========== Test Strategy Functions ==========
 
@@ -187,10 +192,22 @@ class TestPackUnpackFunctions(unittest.TestCase):
 class TestPlayMatch(unittest.TestCase):
     """Test the play_match function for individual matches"""
 
+    @classmethod
+    def setUpClass(cls):
+        # every test plays one of these pairs, so each is packed once for the whole class
+        cls.PKG_CC = pack_functions((cheat, cooperate))
+        cls.PKG_TC = pack_functions((tit_for_tat, cooperate))
+        cls.PKG_TCH = pack_functions((tit_for_tat, cheat))
+        cls.PKG_LIST = pack_functions((return_list_strategy, cooperate))
+        cls.PKG_BROKEN = pack_functions((broken_strategy, cooperate))
+        cls.PKG_INVALID = pack_functions((invalid_return_strategy, cooperate))
+        cls.PKG_RAND = pack_functions((random_strategy, random_strategy))
+        cls.PKG_MOD = pack_functions((modifying_strategy, cooperate))
+
     def test_play_match_no_noise_deterministic(self):
         """Test play_match without noise is deterministic"""
         result = play_match(
-            pack_functions((cheat, cooperate)),
+            self.PKG_CC,
             noise=False,
             rounds=150,
             random_seed=42,
@@ -200,7 +217,7 @@ class TestPlayMatch(unittest.TestCase):
     def test_play_match_tit_for_tat_vs_cooperate(self):
         """Test tit-for-tat against always cooperate"""
         result = play_match(
-            pack_functions((tit_for_tat, cooperate)),
+            self.PKG_TC,
             noise=False,
             rounds=10,
             random_seed=42,
@@ -212,7 +229,7 @@ class TestPlayMatch(unittest.TestCase):
     def test_play_match_tit_for_tat_vs_cheat(self):
         """Test tit-for-tat against always defect"""
         result = play_match(
-            pack_functions((tit_for_tat, cheat)),
+            self.PKG_TCH,
             noise=False,
             rounds=10,
             random_seed=42,
@@ -227,7 +244,7 @@ class TestPlayMatch(unittest.TestCase):
     def test_play_match_with_list_return(self):
         """Test strategy that returns list of bools"""
         result = play_match(
-            pack_functions((return_list_strategy, cooperate)),
+            self.PKG_LIST,
             noise=False,
             rounds=10,
             random_seed=42,
@@ -242,7 +259,7 @@ class TestPlayMatch(unittest.TestCase):
         """Test that broken strategies return None"""
         with suppress_output():
             result = play_match(
-                pack_functions((broken_strategy, cooperate)),
+                self.PKG_BROKEN,
                 noise=False,
                 rounds=10,
                 random_seed=42,
@@ -253,7 +270,7 @@ class TestPlayMatch(unittest.TestCase):
         """Test that strategies with invalid return types return None"""
         with suppress_output():
             result = play_match(
-                pack_functions((invalid_return_strategy, cooperate)),
+                self.PKG_INVALID,
                 noise=False,
                 rounds=10,
                 random_seed=42,
@@ -263,7 +280,7 @@ class TestPlayMatch(unittest.TestCase):
     def test_play_match_with_noise_same_seed_deterministic(self):
         """Test that noise with same seed produces same results"""
         result1 = play_match(
-            pack_functions((cheat, cooperate)),
+            self.PKG_CC,
             noise=True,
             noise_level=0.1,
             rounds=50,
@@ -271,7 +288,7 @@ class TestPlayMatch(unittest.TestCase):
             random_seed=42,
         )
         result2 = play_match(
-            pack_functions((cheat, cooperate)),
+            self.PKG_CC,
             noise=True,
             noise_level=0.1,
             rounds=50,
@@ -283,7 +300,7 @@ class TestPlayMatch(unittest.TestCase):
     def test_play_match_with_noise_different_seed(self):
         """Test that noise with different seeds produces different results"""
         result1 = play_match(
-            pack_functions((random_strategy, random_strategy)),
+            self.PKG_RAND,
             noise=True,
             noise_level=0.1,
             rounds=50,
@@ -291,7 +308,7 @@ class TestPlayMatch(unittest.TestCase):
             random_seed=42,
         )
         result2 = play_match(
-            pack_functions((random_strategy, random_strategy)),
+            self.PKG_RAND,
             noise=True,
             noise_level=0.1,
             rounds=50,
@@ -304,7 +321,7 @@ class TestPlayMatch(unittest.TestCase):
     def test_play_match_zero_noise_level(self):
         """Test with noise enabled but noise_level=0"""
         result = play_match(
-            pack_functions((cheat, cooperate)),
+            self.PKG_CC,
             noise=True,
             noise_level=0.0,
             rounds=50,
@@ -317,7 +334,7 @@ class TestPlayMatch(unittest.TestCase):
     def test_play_match_data_isolation(self):
         """Test that strategies receive copies and can't modify game state"""
         result = play_match(
-            pack_functions((modifying_strategy, cooperate)),
+            self.PKG_MOD,
             noise=False,
             rounds=10,
             random_seed=42,
@@ -482,6 +499,164 @@ class TestGetStrategyCodePairs(unittest.TestCase):
             },
         )
 
+class TestSuppressOutput(unittest.TestCase):
+    def test_suppress_output_without_streams(self):
+        # without a console (e.g. pythonw) both streams are None
+        with mock.patch.object(sys, "stdout", None), mock.patch.object(sys, "stderr", None):
+            with suppress_output():
+                pass
+            self.assertIsNone(sys.stdout)
+            self.assertIsNone(sys.stderr)
+
+    def test_suppress_output_leaves_descriptors_by_default(self):
+        with mock.patch("os.dup") as dup, suppress_output():
+            print("hidden")
+        dup.assert_not_called()
+
+    def test_suppress_output_nested(self):
+        original_stdout = sys.stdout
+        with suppress_output(fds=True):
+            silenced = sys.stdout
+            with mock.patch("os.dup") as dup, suppress_output(fds=True):
+                print("hidden")
+            # the descriptors are already redirected by the outer context
+            dup.assert_not_called()
+            self.assertIs(sys.stdout, silenced)
+        self.assertIs(sys.stdout, original_stdout)
+
+class TestCodeLength(unittest.TestCase):
+    def test_length_no_whitespace(self):
+        self.assertEqual(get_length_no_whitespace("def a():\n    return 1\n"), len("defa():return1"))
+        self.assertEqual(get_length_no_whitespace(["def a():\n", "    return 1\n"]), len("defa():return1"))
+
+    def test_length_no_whitespace_no_comments(self):
+        code = "# header\ndef a():  # the strategy\n    return 1 #\n"
+        self.assertEqual(get_length_no_whitespace_no_comments(code), len("defa():return1"))
+        self.assertEqual(get_length_no_whitespace_no_comments(code.splitlines(keepends=True)), len("defa():return1"))
+
+class TestCheckFunctions(unittest.TestCase):
+    def test_check_functions(self):
+        with suppress_output():
+            good, bad = check_functions([cheat, invalid_return_strategy, modifying_strategy, tit_for_tat])
+        self.assertEqual(good, [cheat, tit_for_tat])
+        self.assertEqual([function for function, _ in bad], [invalid_return_strategy, modifying_strategy])
+
+    def test_check_functions_mask_strategy(self):
+        def last_two_from_masks(my_moves, other_moves, current_round, my_mask, other_mask):
+            return current_round >= 2 and (other_mask >> (current_round - 2)) & 0b11 == 0b11
+
+        with suppress_output():
+            good, bad = check_functions([last_two_from_masks])
+        self.assertEqual(good, [last_two_from_masks])
+
+    def test_check_functions_mixed_histories(self):
+        def breaks_on_mixed_history(my_moves, other_moves, current_round):
+            if True in my_moves and False in my_moves:
+                return None
+            return False
+
+        with suppress_output():
+            good, bad = check_functions([breaks_on_mixed_history])
+        self.assertEqual(good, [])
+        self.assertEqual(len(bad), 1)
+
+
+class TestCompileSubmission(unittest.TestCase):
+    def setUp(self):
+        self.original_dir = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        self.temp_dir.cleanup()
+
+    def test_compile_submission(self):
+        compiled, num_functions = compile_submission(test_code)
+        self.assertEqual(num_functions, 3)
+        namespace = {}
+        exec(compiled, namespace)
+        self.assertEqual(namespace["a"](None), 1)
+
+    def test_compile_submission_uses_cache(self):
+        compile_submission(test_code)
+        self.assertEqual(len(os.listdir("./cache/compiled")), 1)
+        compiled, num_functions = compile_submission(test_code)
+        self.assertEqual(num_functions, 3)
+        self.assertEqual(len(os.listdir("./cache/compiled")), 1)
+
+    def test_compile_submission_damaged_cache(self):
+        compile_submission(test_code)
+        [cache_name] = os.listdir("./cache/compiled")
+        cache_path = os.path.join("./cache/compiled", cache_name)
+        with open(cache_path, "rb") as cache_file:
+            data = cache_file.read()
+        # a truncated file (from an interrupted run) and one with the wrong contents are both cache misses
+        for damaged in (data[: len(data) // 2], b"", marshal.dumps("not code")):
+            with open(cache_path, "wb") as cache_file:
+                cache_file.write(damaged)
+            self.assertEqual(compile_submission(test_code)[1], 3)
+            with open(cache_path, "rb") as cache_file:
+                self.assertEqual(cache_file.read(), data)
+
+    def test_compile_submission_counts_nested_functions(self):
+        code = 'def outer(m, o, r):\n    """def not_a_function"""\n    def inner():\n        return True\n    return inner()\n'
+        self.assertEqual(compile_submission(code)[1], 2)
+        self.assertEqual(get_num_functions(code), 2)
+
+    def test_compile_submission_syntax_error(self):
+        with self.assertRaises(SyntaxError):
+            compile_submission("def a(:\n    pass")
+
+
+class FakeSession:
+    """Stands in for a `requests.Session`, answering every request with the next of `responses`"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+
+    def get(self, url, headers=None):
+        response = requests.Response()
+        response.status_code, response._content = self.responses.pop(0)
+        response.url = url
+        return response
+
+
+class TestGetPastebin(unittest.TestCase):
+    def setUp(self):
+        self.original_dir = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        self.temp_dir.cleanup()
+
+    def test_get_pastebin_caches_code(self):
+        session = FakeSession((200, b"def a(m, o, r):\n    return True\n"))
+        self.assertEqual(get_pastebin("https://pastebin.com/abcd1234", session=session), "def a(m, o, r):\n    return True\n")
+        with open("./cache/abcd1234") as cache_file:
+            self.assertEqual(cache_file.read(), "def a(m, o, r):\n    return True\n")
+
+    def test_get_pastebin_error_is_not_cached(self):
+        session = FakeSession((429, b"Too Many Requests"), (200, b"def a(m, o, r):\n    return True\n"))
+        with suppress_output():
+            self.assertIsNone(get_pastebin("https://pastebin.com/abcd1234", session=session))
+        self.assertFalse(os.path.exists("./cache/abcd1234"))
+        # the failure isn't remembered either, so the next call downloads the code
+        self.assertEqual(get_pastebin("https://pastebin.com/abcd1234", session=session), "def a(m, o, r):\n    return True\n")
+
+    def test_get_pastebin_error_keeps_cached_copy(self):
+        os.makedirs("./cache")
+        with open("./cache/abcd1234", "w") as cache_file:
+            cache_file.write("cached")
+        session = FakeSession((503, b"Service Unavailable"))
+        with suppress_output():
+            self.assertEqual(get_pastebin("https://pastebin.com/abcd1234", cache=False, session=session), "cached")
+        with open("./cache/abcd1234") as cache_file:
+            self.assertEqual(cache_file.read(), "cached")
+
+
 class TestDescriptor(unittest.TestCase):
     def test_create_completion_paris(self):
         client = get_client()
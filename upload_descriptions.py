@@ -3,8 +3,6 @@
 
 import json
 import gspread
-import pandas as pd
-import gspread_dataframe
 
 SHEET_NAME = "IPD 2025 Strategy Descriptions"
 
@@ -12,12 +10,8 @@ SHEET_NAME = "IPD 2025 Strategy Descriptions"
 with open("latest_strategy_descriptions.json", "r") as f:
     descriptions = json.load(f)
 
-# Convert to DataFrame with capitalized headers
-data = []
-for strategy_name, description in descriptions.items():
-    data.append({"Strategy": strategy_name, "Description": description})
-
-df = pd.DataFrame(data)
+# Rows to upload, with capitalized headers
+rows = [["Strategy", "Description"], *map(list, descriptions.items())]
 
 # Connect to Google Sheets
 service_account = gspread.service_account(filename="service_account.json")
@@ -39,14 +33,12 @@ except:
 # Clear existing data
 worksheet.clear()
 
-# Upload the data
-gspread_dataframe.set_with_dataframe(
-    worksheet=worksheet,
-    dataframe=df,
-    include_index=False,
-    include_column_header=True,
-    resize=True,
-)
+# Only grow the sheet if it is too small (its size is already known locally, so this check is free)
+if worksheet.row_count < len(rows) or worksheet.col_count < 2:
+    worksheet.resize(rows=max(worksheet.row_count, len(rows)), cols=max(worksheet.col_count, 2))
+
+# Upload the data in a single request
+worksheet.update(range_name="A1", values=rows, value_input_option="RAW")
 
-print(f"Successfully uploaded {len(data)} strategies to {SHEET_NAME}")
+print(f"Successfully uploaded {len(descriptions)} strategies to {SHEET_NAME}")
 print(f"Spreadsheet URL: https://docs.google.com/spreadsheets/d/{spreadsheet.id}")